@@ -0,0 +1,332 @@
+"""
+Copyright 2024 Joe Maples <joe@maples.dev>
+
+This file is part of klipmi.
+
+klipmi is free software: you can redistribute it and/or modify it under the
+terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+klipmi is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+klipmi. If not, see <https://www.gnu.org/licenses/>.
+
+Benchmarks the ColPic encoder stages over the thumbnails in bench/corpus and
+checks their output byte for byte against bench/golden, which was written by
+the original encoder. The original encoder swapped width and height, so the
+non-square images were written after that was fixed. Images listed in
+PALETTES are encoded with a smaller palette than the 1024 colors of the
+panel, so the palette reduction is checked as well. Every stage runs with
+and without numpy. The golden text is then decoded again and compared to the
+pixels that went in.
+
+    python bench/colpic.py [--rounds N] [--corpus] [--golden] [--render DIR]
+
+--corpus draws the corpus images again and --golden stores the current
+output as the new reference, only use it when the format changes on purpose.
+--render writes what the panel would show for every image to DIR.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+from array import array
+from PIL import Image, ImageDraw
+from typing import Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from klipmi.utils import libcolpic
+from klipmi.utils.libcolpic import (
+    Byte8bitEncode,
+    ColPic_EncodeStr,
+    ColPicDecode,
+    ColPicDecodeStr,
+    ColPicEncode,
+    ColPicEncodeStream,
+    decodeThumbnail,
+    imageToColor16,
+    parseThumbnail,
+    streamThumbnail,
+)
+
+BENCH_PATH = os.path.dirname(os.path.abspath(__file__))
+CORPUS_PATH = os.path.join(BENCH_PATH, "corpus")
+GOLDEN_PATH = os.path.join(BENCH_PATH, "golden")
+# Size and background of the previews on the panel
+THUMBNAIL_SIZE = 160
+BACKGROUND = "4d4d4d"
+SIZES = [32, 100, 160, 300]
+KINDS = ["flat", "gradient", "transparent", "colors"]
+# Kind, width and height of the images that are not square, one is wider
+# and one taller than the thumbnail
+SHAPES = [("gradient", 300, 150), ("transparent", 90, 160)]
+# Kind, size and palette size of the images encoded with a smaller palette,
+# noise has far more colors than the encoder counts
+PALETTES = [("colors", 128, 64)]
+COLORSMAX = {"%s-%d" % (kind, size): colors for kind, size, colors in PALETTES}
+
+
+def drawImage(kind: str, width: int, height: int) -> Image.Image:
+    # Square images keep their old seed, so the corpus stays the same
+    if width == height:
+        rng = random.Random("%s%d" % (kind, width))
+    else:
+        rng = random.Random("%s%dx%d" % (kind, width, height))
+    size = min(width, height)
+    if kind == "flat":
+        # A few solid shapes, long runs and a tiny palette
+        img = Image.new("RGBA", (width, height), (40, 40, 40, 255))
+        draw = ImageDraw.Draw(img)
+        for color in [(230, 80, 20, 255), (20, 120, 230, 255), (240, 240, 240, 255)]:
+            x, y = rng.randrange(width // 2), rng.randrange(height // 2)
+            draw.rectangle((x, y, x + width // 3, y + height // 3), fill=color)
+        return img
+    elif kind == "gradient":
+        img = Image.new("RGBA", (width, height))
+        img.putdata(
+            [
+                (x * 255 // width, y * 255 // height, (x + y) * 127 // size, 255)
+                for y in range(height)
+                for x in range(width)
+            ]
+        )
+        return img
+    elif kind == "transparent":
+        # Shaded part with soft edges on a transparent background, like the
+        # previews slicers embed in gcode files
+        img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(img)
+        for step in range(size // 4, 0, -1):
+            shade = 80 + step * 170 // (size // 4)
+            inset = size // 2 - step * 2
+            draw.ellipse(
+                (inset, inset, width - inset, height - inset),
+                fill=(shade, shade // 2, 255 - shade, 128 + step * 127 // (size // 4)),
+            )
+        return img
+    # Noise over a gradient, far more than the 1024 colors of a palette
+    img = Image.new("RGBA", (width, height))
+    img.putdata(
+        [
+            (
+                (x * 255 // width + rng.randrange(64)) % 256,
+                (y * 255 // height + rng.randrange(64)) % 256,
+                rng.randrange(256),
+                255,
+            )
+            for y in range(height)
+            for x in range(width)
+        ]
+    )
+    return img
+
+
+def corpus() -> List[Tuple[str, Image.Image]]:
+    images = []
+    for name in sorted(os.listdir(CORPUS_PATH)):
+        if name.endswith(".png"):
+            with Image.open(os.path.join(CORPUS_PATH, name)) as img:
+                images.append((name[:-4], img.convert("RGBA")))
+    return images
+
+
+def stages(img: Image.Image, colorsmax: int) -> Dict[str, Tuple[Callable, str, int]]:
+    # Inputs of the encoder stages as parseThumbnail hands them down
+    thumbnail = img.copy()
+    thumbnail.thumbnail((THUMBNAIL_SIZE, THUMBNAIL_SIZE))
+    w, h = thumbnail.size
+    color16 = imageToColor16(thumbnail, libcolpic.thumbnailBackground(BACKGROUND))
+    # The encoder maps the pixels of dropped palette colors in place, the
+    # run codes are made of what it leaves
+    pixels = array("H", color16)
+    encoded = bytearray(w * h * 10)
+    size = ColPicEncode(pixels, w, h, encoded, w * h * 10, colorsmax)
+    listqty = (encoded[16] | encoded[17] << 8) >> 1
+
+    def parse():
+        return parseThumbnail(img.copy(), THUMBNAIL_SIZE, THUMBNAIL_SIZE, BACKGROUND)
+
+    def stream():
+        return "".join(
+            streamThumbnail(img.copy(), THUMBNAIL_SIZE, THUMBNAIL_SIZE, BACKGROUND)
+        )
+
+    def encodeStr():
+        output = bytearray(w * h * 10)
+        ColPic_EncodeStr(array("H", color16), w, h, output, w * h * 10, colorsmax)
+        return output.replace(b"\0", b"").decode("latin-1")
+
+    def encodeStream():
+        return "".join(ColPicEncodeStream(array("H", color16), w, h, colorsmax))
+
+    def encode():
+        output = bytearray(w * h * 10)
+        size = ColPicEncode(array("H", color16), w, h, output, w * h * 10, colorsmax)
+        return bytes(output[:size])
+
+    def byte8bit():
+        output = bytearray(encoded[: 32 + listqty * 2]) + bytearray(w * h * 10)
+        size = Byte8bitEncode(
+            pixels, 32, listqty, w * h, output, 32 + listqty * 2, w * h * 10
+        )
+        return bytes(output[32 + listqty * 2 : 32 + listqty * 2 + size])
+
+    # Stage, golden file and offset of the output in it. The thumbnail
+    # functions always use the full palette
+    outputs = {}
+    if colorsmax == 1024:
+        outputs["parseThumbnail"] = (parse, "txt", 0)
+        outputs["streamThumbnail"] = (stream, "txt", 0)
+    outputs["ColPic_EncodeStr"] = (encodeStr, "txt", 0)
+    outputs["ColPicEncodeStream"] = (encodeStream, "txt", 0)
+    outputs["ColPicEncode"] = (encode, "bin", 0)
+    outputs["Byte8bitEncode"] = (byte8bit, "bin", 32 + listqty * 2)
+    return outputs
+
+
+def roundTrip(name: str, img: Image.Image) -> bool:
+    thumbnail = img.copy()
+    thumbnail.thumbnail((THUMBNAIL_SIZE, THUMBNAIL_SIZE))
+    w, h = thumbnail.size
+    color16 = imageToColor16(thumbnail, libcolpic.thumbnailBackground(BACKGROUND))
+    colorsmax = COLORSMAX.get(name, 1024)
+    if colorsmax < 1024:
+        # Dropped palette colors are mapped to the closest kept one
+        ColPicEncode(color16, w, h, bytearray(w * h * 10), w * h * 10, colorsmax)
+
+    # Pixels of colors that did not make it into the palette are sent as the
+    # first palette color
+    data = ColPicDecodeStr(golden(name, "txt").decode("latin-1"))
+    listsize = int.from_bytes(data[16:20], "little")
+    palette = {data[32 + i] | data[33 + i] << 8 for i in range(0, listsize, 2)}
+    first = data[32] | data[33] << 8
+    expected = array("H", [val if val in palette else first for val in color16])
+    return ColPicDecode(data) == (thumbnail.size[0], thumbnail.size[1], expected)
+
+
+def golden(name: str, kind: str) -> bytes:
+    with open(os.path.join(GOLDEN_PATH, "%s.%s" % (name, kind)), "rb") as f:
+        return f.read()
+
+
+def asBytes(result) -> bytes:
+    return result.encode("latin-1") if isinstance(result, str) else result
+
+
+def measure(function: Callable, rounds: int) -> Tuple[object, float, int]:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+
+    # Separate run, tracing slows everything down
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, best, peak
+
+
+def writeCorpus():
+    os.makedirs(CORPUS_PATH, exist_ok=True)
+    for kind in KINDS:
+        for size in SIZES:
+            # More than 1024 pixels are needed for the colors, and noise
+            # compresses badly, so only the middle sizes are kept
+            if kind == "colors" and size not in [100, 160]:
+                continue
+            drawImage(kind, size, size).save(
+                os.path.join(CORPUS_PATH, "%s-%d.png" % (kind, size)), optimize=True
+            )
+    for kind, width, height in SHAPES:
+        drawImage(kind, width, height).save(
+            os.path.join(CORPUS_PATH, "%s-%dx%d.png" % (kind, width, height)),
+            optimize=True,
+        )
+    for kind, size, _ in PALETTES:
+        drawImage(kind, size, size).save(
+            os.path.join(CORPUS_PATH, "%s-%d.png" % (kind, size)), optimize=True
+        )
+
+
+def writeGolden():
+    os.makedirs(GOLDEN_PATH, exist_ok=True)
+    for name, img in corpus():
+        outputs = stages(img, COLORSMAX.get(name, 1024))
+        for kind, stage in [("txt", "ColPic_EncodeStr"), ("bin", "ColPicEncode")]:
+            with open(os.path.join(GOLDEN_PATH, "%s.%s" % (name, kind)), "wb") as f:
+                f.write(asBytes(outputs[stage][0]()))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--corpus", action="store_true")
+    parser.add_argument("--golden", action="store_true")
+    parser.add_argument("--render", metavar="DIR")
+    args = parser.parse_args()
+
+    if args.corpus:
+        writeCorpus()
+    if args.golden:
+        writeGolden()
+
+    numpy = libcolpic.numpy
+    failures = 0
+    print(
+        "%-18s %-18s %-6s %10s %10s %8s  %s"
+        % ("image", "stage", "numpy", "ms", "peak KB", "bytes", "golden")
+    )
+    for name, img in corpus():
+        for useNumpy in [False, True] if numpy is not None else [False]:
+            libcolpic.numpy = numpy if useNumpy else None
+            try:
+                colorsmax = COLORSMAX.get(name, 1024)
+                for stage, (function, kind, offset) in stages(img, colorsmax).items():
+                    result, best, peak = measure(function, args.rounds)
+                    expected = golden(name, kind)[offset:]
+                    ok = asBytes(result) == expected
+                    failures += not ok
+                    print(
+                        "%-18s %-18s %-6s %10.2f %10.1f %8d  %s"
+                        % (
+                            name,
+                            stage,
+                            "yes" if useNumpy else "no",
+                            best * 1000,
+                            peak / 1024,
+                            len(result),
+                            "ok" if ok else "MISMATCH",
+                        )
+                    )
+            finally:
+                libcolpic.numpy = numpy
+
+    print()
+    print("%-18s %10s  %s" % ("image", "decode ms", "round trip"))
+    for name, img in corpus():
+        text = golden(name, "txt").decode("latin-1")
+        preview, best, _ = measure(lambda: decodeThumbnail(text), args.rounds)
+        ok = roundTrip(name, img)
+        failures += not ok
+        print("%-18s %10.2f  %s" % (name, best * 1000, "ok" if ok else "MISMATCH"))
+        if args.render:
+            os.makedirs(args.render, exist_ok=True)
+            preview.save(os.path.join(args.render, "%s.png" % name))
+
+    if failures:
+        raise SystemExit("%d outputs differ from the reference" % failures)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Copyright 2024 Joe Maples <joe@maples.dev>
+
+This file is part of klipmi.
+
+klipmi is free software: you can redistribute it and/or modify it under the
+terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+klipmi is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+klipmi. If not, see <https://www.gnu.org/licenses/>.
+
+Benchmarks the run-length and palette index stage of the ColPic encoder,
+pure Python against numpy.
+
+    python bench/rle.py [--rounds N]
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from klipmi.utils.libcolpic import (
+    colorPalette,
+    imageToColor16,
+    runCodesNumpy,
+    runCodesPython,
+)
+from thumbnail import BACKGROUND, SIZES, makeThumbnail, timeit
+
+COLORS = 1024
+
+
+def encode(function, color16, palette) -> bytes:
+    index = {color: i for i, color in enumerate(palette)}
+    return b"".join(function(color16, len(color16), index))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    print(
+        "%6s %8s %12s %12s %8s"
+        % ("size", "colors", "python ms", "numpy ms", "speedup")
+    )
+    for size in SIZES:
+        color16 = imageToColor16(makeThumbnail(size), BACKGROUND)
+        palette = colorPalette(color16, len(color16), COLORS)
+        if encode(runCodesNumpy, color16, palette) != encode(
+            runCodesPython, color16, palette
+        ):
+            raise SystemExit("numpy encoding differs at %dpx" % size)
+
+        python = timeit(
+            encode, runCodesPython, color16, palette, rounds=args.rounds
+        )
+        vectorized = timeit(
+            encode, runCodesNumpy, color16, palette, rounds=args.rounds
+        )
+        print(
+            "%6d %8d %12.2f %12.2f %7.1fx"
+            % (
+                size,
+                len(palette),
+                python * 1000,
+                vectorized * 1000,
+                python / vectorized,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Copyright 2024 Joe Maples <joe@maples.dev>
+
+This file is part of klipmi.
+
+klipmi is free software: you can redistribute it and/or modify it under the
+terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+klipmi is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+klipmi. If not, see <https://www.gnu.org/licenses/>.
+
+Benchmarks the RGB565 conversion of thumbnails, pure Python against numpy.
+
+    python bench/thumbnail.py [--rounds N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+from PIL import Image, ImageDraw
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from klipmi.utils.libcolpic import imageToColor16Numpy, imageToColor16Python
+
+SIZES = [100, 160, 300]
+BACKGROUND = (0x4D, 0x4D, 0x4D)
+
+
+def makeThumbnail(size: int, seed: int = 0) -> Image.Image:
+    # Shaded part on a transparent background with soft edges, like the
+    # previews slicers embed in gcode files
+    rng = random.Random(seed)
+    img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    for step in range(size // 4, 0, -1):
+        shade = 80 + step * 170 // (size // 4)
+        inset = size // 2 - step * 2
+        draw.ellipse(
+            (inset, inset, size - inset, size - inset),
+            fill=(shade, shade // 2, 255 - shade, 255),
+        )
+    for _ in range(size * 2):
+        x, y = rng.randrange(size), rng.randrange(size)
+        r, g, b, a = img.getpixel((x, y))
+        img.putpixel((x, y), (r, g, b, rng.choice([a, a // 2, 64])))
+    return img
+
+
+def timeit(function, *args, rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    print("%6s %12s %12s %8s" % ("size", "python ms", "numpy ms", "speedup"))
+    for size in SIZES:
+        img = makeThumbnail(size)
+        expected = imageToColor16Python(img, BACKGROUND)
+        if imageToColor16Numpy(img, BACKGROUND) != expected:
+            raise SystemExit("numpy conversion differs at %dpx" % size)
+
+        python = timeit(imageToColor16Python, img, BACKGROUND, rounds=args.rounds)
+        vectorized = timeit(imageToColor16Numpy, img, BACKGROUND, rounds=args.rounds)
+        print(
+            "%6d %12.2f %12.2f %7.1fx"
+            % (size, python * 1000, vectorized * 1000, python / vectorized)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -21,16 +21,24 @@ import os
 import tomllib
 
 from optparse import OptionParser
+from typing import List
 
 CONFIG_PATH = "printer_data/config/klipmi.toml"
+DATA_PATH = "printer_data/klipmi"
 TABLE_KLIPMI = "klipmi"
 TABLE_MOONRAKER = "moonraker"
 KEY_DEVICE = "device"
 KEY_BAUD = "baudrate"
+KEY_BAUD_RATES = "baudrates"
 KEY_UI = "ui"
+KEY_RENDER_RATE = "render-rate"
+KEY_STATS_INTERVAL = "stats-interval"
+KEY_THUMBNAIL_CACHE = "thumbnail-cache"
+KEY_ENCODER_WORKERS = "encoder-workers"
 KEY_HOST = "host"
 KEY_PORT = "port"
 KEY_API = "api-key"
+KEY_GCODES_PATH = "gcodes-path"
 
 
 def getCommaSeparatedArgs(option, _, value, parser):
@@ -58,10 +66,21 @@ def getConfigPath() -> str:
     return path
 
 
+def getDataPath() -> str:
+    path = os.path.expanduser("~") + "/" + DATA_PATH
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
 class KlipmiConfig:
     device: str = ""
     baud: int = 115200
+    baudrates: List[int] = []
     ui: str = ""
+    render_rate: float = 5.0
+    stats_interval: float = 300
+    thumbnail_cache: float = 16
+    encoder_workers: int = os.cpu_count() or 1
 
     def __init__(self, config: dict):
         try:
@@ -74,16 +93,53 @@ class KlipmiConfig:
         except Exception as e:
             logging.warning("baud not set in config, defaulting to %d" % self.baud)
 
+        try:
+            self.baudrates = config[KEY_BAUD_RATES]
+        except Exception as e:
+            logging.warning("baudrates not set in config, keeping the baud rate")
+
         try:
             self.ui = config[KEY_UI]
         except Exception as e:
             logging.exception(e)
 
+        try:
+            self.render_rate = config[KEY_RENDER_RATE]
+        except Exception as e:
+            logging.warning(
+                "render-rate not set in config, defaulting to %.1f" % self.render_rate
+            )
+
+        try:
+            self.stats_interval = config[KEY_STATS_INTERVAL]
+        except Exception as e:
+            logging.warning(
+                "stats-interval not set in config, defaulting to %d"
+                % self.stats_interval
+            )
+
+        try:
+            self.thumbnail_cache = config[KEY_THUMBNAIL_CACHE]
+        except Exception as e:
+            logging.warning(
+                "thumbnail-cache not set in config, defaulting to %.1f MB"
+                % self.thumbnail_cache
+            )
+
+        try:
+            self.encoder_workers = config[KEY_ENCODER_WORKERS]
+        except Exception as e:
+            logging.warning(
+                "encoder-workers not set in config, defaulting to %d"
+                % self.encoder_workers
+            )
+
 
 class MoonrakerConfig:
     host: str = "0.0.0.0"
     port: int = 7125
     api_key: str = ""
+    gcodes_path: str = ""
 
     def __init__(self, config: dict):
         try:
@@ -101,6 +157,13 @@ class MoonrakerConfig:
         except Exception as e:
             logging.exception(e)
 
+        try:
+            self.gcodes_path = os.path.expanduser(config[KEY_GCODES_PATH])
+        except Exception as e:
+            logging.info(
+                "gcodes-path not set in config, thumbnails come from Moonraker"
+            )
+
 
 class Config:
     timeout: int = 5
@@ -0,0 +1,453 @@
+"""
+Copyright 2024 Joe Maples <joe@maples.dev>
+
+This file is part of klipmi.
+
+klipmi is free software: you can redistribute it and/or modify it under the
+terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+klipmi is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+klipmi. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import asyncio
+import heapq
+import logging
+import time
+
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from nextion import TJC
+from nextion.constants import IO_TIMEOUT
+from nextion.exceptions import CommandFailed, CommandTimeout
+from typing import Awaitable, Dict, List, Tuple
+
+from klipmi.model.stats import LinkStats, Outcome, componentOf
+
+EOL = b"\xff\xff\xff"
+ACK = 0x01
+# Time the panel needs to switch to a new baud rate
+BAUD_SETTLE_TIME = 0.1
+# Round trips a new baud rate has to pass before it is used
+BAUD_TEST_ROUNDS = 5
+
+
+def formatValue(value: str | int) -> str:
+    if isinstance(value, str):
+        return '"%s"' % value
+    elif isinstance(value, int):
+        return str(value)
+    # Same fallback as TJC.set, floats are sent as text
+    return '"%s"' % value
+
+
+def responseSize(result) -> int:
+    # Size of the reply on the wire including the 0xFF terminators
+    if result is None:
+        return 0
+    elif isinstance(result, bool):
+        return 4
+    elif isinstance(result, int):
+        return 8
+    elif isinstance(result, str):
+        return len(result.encode()) + 4
+    return 4
+
+
+class Priority(IntEnum):
+    INTERACTIVE = 0
+    TELEMETRY = 1
+    BULK = 2
+
+
+class PriorityLock:
+    """
+    Lock that is handed over to the waiter with the highest priority first,
+    and in arrival order within the same priority.
+    """
+
+    def __init__(self):
+        self.locked: bool = False
+        self.waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self.sequence: int = 0
+
+    async def acquire(self, priority: Priority):
+        if not self.locked and not self.waiters:
+            self.locked = True
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self.sequence += 1
+        heapq.heappush(self.waiters, (priority, self.sequence, future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The lock was handed over right before the cancellation
+                self.release()
+            raise
+
+    def release(self):
+        while self.waiters:
+            _, _, future = heapq.heappop(self.waiters)
+            if not future.done():
+                # Hand the lock over without unlocking it in between
+                future.set_result(True)
+                return
+        self.locked = False
+
+
+class Batch:
+    def __init__(self):
+        self.open: bool = True
+        self.writes: Dict[str, str | int] = {}
+
+
+_batch: ContextVar[Batch | None] = ContextVar("batch", default=None)
+_priority: ContextVar[Priority] = ContextVar("priority", default=Priority.TELEMETRY)
+
+
+class Display:
+    """
+    Wraps the TJC client and keeps a shadow copy of every component value
+    written since the last page change, so that unchanged values are not
+    sent over the serial link again.
+
+    Writes made inside batch() are collected and sent to the panel as one
+    serial write when the batch is closed.
+
+    All traffic is scheduled by priority, see priority(). Bulk transfers
+    are sent as a series of commands, so anything more urgent gets the link
+    in between two of them and the transfer carries on afterwards.
+
+    Every command is measured and recorded in `stats` under the page that is
+    currently shown.
+    """
+
+    def __init__(self, tjc: TJC, baud: int):
+        self.tjc: TJC = tjc
+        self.baud: int = baud
+        self.shadow: Dict[str, str | int] = {}
+        self.suppressed: int = 0
+        self.batches: int = 0
+        self.batchErrors: int = 0
+        self.lock: PriorityLock = PriorityLock()
+        self.stats: LinkStats = LinkStats()
+        self.page: str = ""
+        # Characters per picture write the panel takes, 0 until an upload
+        # found out, and whether it keeps up with several writes at once
+        self.uploadChunk: int = 0
+        self.uploadPipelined: bool = True
+
+    def __getattr__(self, name: str):
+        return getattr(self.tjc, name)
+
+    @contextmanager
+    def priority(self, priority: Priority):
+        token = _priority.set(priority)
+        try:
+            yield
+        finally:
+            _priority.reset(token)
+
+    @asynccontextmanager
+    async def link(self):
+        await self.lock.acquire(_priority.get())
+        try:
+            yield
+        finally:
+            self.lock.release()
+
+    def isShadowed(self, key: str, value: str | int) -> bool:
+        if key not in self.shadow:
+            return False
+        shadow = self.shadow[key]
+        return type(shadow) is type(value) and shadow == value
+
+    def clearShadow(self):
+        if self.shadow:
+            logging.debug(
+                "Display: dropping %d shadowed values, %d writes suppressed so far"
+                % (len(self.shadow), self.suppressed)
+            )
+        self.shadow.clear()
+
+    async def set(self, key: str, value: str | int, timeout=IO_TIMEOUT):
+        batch = _batch.get()
+        if batch is not None and batch.open and not self.tjc.sleeping:
+            # A queued write always wins over the shadow, drop it only when
+            # the latest value is back to what the panel already shows
+            batch.writes.pop(key, None)
+            if self.isShadowed(key, value):
+                self.suppressed += 1
+            else:
+                batch.writes[key] = value
+            return None
+
+        if self.isShadowed(key, value):
+            self.suppressed += 1
+            return None
+
+        # Forget the old value first, the component state is unknown if the
+        # write fails half way
+        self.shadow.pop(key, None)
+        async with self.link():
+            if self.tjc.sleeping:
+                # Deferred by the client until the panel wakes up
+                result = await self.tjc.set(key, value, timeout)
+            else:
+                result = await self.__measure(
+                    key.split(".")[0],
+                    "%s=%s" % (key, formatValue(value)),
+                    self.tjc.set(key, value, timeout),
+                )
+        self.shadow[key] = value
+        return result
+
+    async def get(self, key: str, timeout=IO_TIMEOUT):
+        await self.flush()
+        async with self.link():
+            return await self.__measure(
+                key.split(".")[0], "get %s" % key, self.tjc.get(key, timeout)
+            )
+
+    async def command(self, command: str, timeout=IO_TIMEOUT):
+        await self.flush()
+        async with self.link():
+            return await self.__measure(
+                componentOf(command), command, self.tjc.command(command, timeout)
+            )
+
+    async def connect(self):
+        result = await self.tjc.connect()
+        # The client falls back to other rates if the configured one fails
+        self.baud = self.tjc._baud_rate
+        return result
+
+    async def negotiateBaud(self, rates: List[int]) -> int:
+        """
+        Switches the panel to the fastest rate in `rates` that passes a
+        round-trip test, falling back to the current rate on errors. Returns
+        the rate in use afterwards.
+        """
+        with self.priority(Priority.INTERACTIVE):
+            async with self.link():
+                for rate in sorted(rates, reverse=True):
+                    if rate <= self.baud:
+                        break
+                    if await self.__switchBaud(rate):
+                        break
+        return self.baud
+
+    async def __switchBaud(self, rate: int) -> bool:
+        previous = self.baud
+        logging.info("Display: switching from %d to %d baud" % (previous, rate))
+        try:
+            await self.__setBaud(rate)
+            if await self.__testBaud(rate):
+                logging.info("Display: using %d baud" % rate)
+                return True
+            logging.warning("Display: %d baud failed the round-trip test" % rate)
+        except Exception as e:
+            logging.warning("Display: %d baud failed: %s" % (rate, e))
+
+        if self.tjc._baud_rate != previous:
+            try:
+                await self.__setBaud(previous)
+            except Exception as e:
+                # The panel may be on either rate, the client scans for it
+                logging.warning(
+                    "Display: returning to %d baud failed: %s, scanning" % (previous, e)
+                )
+                await self.__rescan(previous)
+        return False
+
+    async def __rescan(self, rate: int):
+        try:
+            await self.tjc.disconnect()
+        except Exception as e:
+            logging.debug("Display: disconnect failed: %s" % e)
+        self.tjc._baud_rate = rate
+        await self.connect()
+
+    async def __setBaud(self, rate: int):
+        async with self.tjc._command_lock:
+            # Not acknowledged, the panel switches right away
+            self.tjc._write_command_raw(("baud=%d" % rate).encode())
+        await asyncio.sleep(BAUD_SETTLE_TIME)
+        await self.tjc.disconnect()
+        self.tjc._baud_rate = rate
+        await self.connect()
+
+    async def __testBaud(self, rate: int) -> bool:
+        if self.tjc._baud_rate != rate:
+            return False
+        for _ in range(BAUD_TEST_ROUNDS):
+            if await self.tjc.get("baud") != rate:
+                return False
+        return True
+
+    async def wakeup(self):
+        async with self.link():
+            if self.tjc.sleeping:
+                await self.__measure("sleep", "sleep=0", self.tjc.wakeup())
+
+    async def __measure(self, component: str, command: str, request: Awaitable):
+        start = time.monotonic()
+        outcome = Outcome.OK
+        result = None
+        try:
+            result = await request
+            return result
+        except CommandTimeout:
+            outcome = Outcome.TIMEOUT
+            raise
+        except CommandFailed:
+            outcome = Outcome.ERROR
+            result = True
+            raise
+        finally:
+            self.stats.record(
+                self.page,
+                component,
+                len(command.encode(self.tjc.encoding)) + len(EOL),
+                responseSize(result),
+                time.monotonic() - start,
+                outcome,
+            )
+
+    @asynccontextmanager
+    async def batch(self):
+        if _batch.get() is not None and _batch.get().open:
+            # Nested batches are merged into the outer one
+            yield
+            return
+
+        batch = Batch()
+        token = _batch.set(batch)
+        try:
+            yield
+        finally:
+            try:
+                # Writes made while a flush is running are sent by another
+                while batch.writes:
+                    await self.flush()
+            finally:
+                batch.open = False
+                _batch.reset(token)
+
+    async def flush(self):
+        batch = _batch.get()
+        if batch is None or not batch.open or not batch.writes:
+            return
+
+        writes = batch.writes
+        batch.writes = {}
+
+        commands: List[str] = []
+        for key, value in writes.items():
+            self.shadow.pop(key, None)
+            commands.append("%s=%s" % (key, formatValue(value)))
+        errors = await self.pipeline(commands, "batch")
+
+        self.batches += 1
+        if errors is None:
+            logging.error(
+                "Display: batch of %d writes was not acknowledged" % len(writes)
+            )
+        elif errors:
+            self.batchErrors += len(errors)
+            for code in errors:
+                logging.error("Display: %s" % CommandFailed("batch", code))
+        else:
+            # The panel does not tell which command failed, so only remember
+            # the values of batches that went through cleanly
+            self.shadow.update(writes)
+
+    async def pipeline(
+        self, commands: List[str], component: str, settle: float = 0
+    ) -> List[int] | None:
+        """
+        Sends `commands` in a single write with only errors reported and
+        waits until the panel has worked through all of them. Returns the
+        error codes, or None if the panel did not answer in time.
+
+        A late answer is still waited for `settle` more seconds with the link
+        held, so no other command takes it for its own. If it does not come,
+        a lone bkcmd=3 is sent after the batch. The panel works through
+        commands in order, so two answers mean the batch was only slow, and
+        one answer that its end got lost on the way.
+
+        When the caller is cancelled, the answers in flight are still read
+        before the link is released.
+        """
+        # Switching back to bkcmd=3 is acknowledged, which tells us the
+        # panel has worked through the whole batch
+        payload = EOL.join(
+            [c.encode(self.tjc.encoding) for c in ["bkcmd=2"] + commands + ["bkcmd=3"]]
+        )
+        sent = len(payload) + len(EOL)
+        errors: List[int] = []
+        async with self.link(), self.tjc._command_lock:
+            start = time.monotonic()
+            timeout = len(payload) * 10 / self.baud + IO_TIMEOUT
+            deadline = start + timeout
+            self.tjc._flush_read_buffer()
+            self.tjc._write_command_raw(payload)
+            # Answers the panel still owes us
+            pending = 1
+            try:
+                answered = await self.__readBatchErrors(errors, timeout)
+                if not answered and settle > 0:
+                    answered = await self.__readBatchErrors(errors, settle)
+                if not answered and settle > 0:
+                    self.tjc._write_command_raw(b"bkcmd=3")
+                    sent += len(b"bkcmd=3") + len(EOL)
+                    pending = 2
+                    # The panel may still be busy with the whole batch
+                    if await self.__readBatchErrors(errors, timeout):
+                        pending = 1
+                        probe: List[int] = []
+                        answered = (
+                            await self.__readBatchErrors(probe, IO_TIMEOUT)
+                            and not probe
+                        )
+            except asyncio.CancelledError:
+                wait = max(0, deadline - time.monotonic()) + settle
+                for _ in range(pending):
+                    if not await self.__readBatchErrors([], wait):
+                        break
+                raise
+
+        self.stats.record(
+            self.page,
+            component,
+            sent,
+            (len(errors) + answered) * 4,
+            time.monotonic() - start,
+            Outcome.TIMEOUT
+            if not answered
+            else Outcome.ERROR if errors else Outcome.OK,
+        )
+        return errors if answered else None
+
+    async def __readBatchErrors(self, errors: List[int], timeout: float) -> bool:
+        # Adds the error codes to `errors`, True once the batch was answered
+        while True:
+            try:
+                response = await self.tjc._read_packet(timeout=timeout)
+            except asyncio.TimeoutError:
+                return False
+            if len(response) != 1:
+                logging.warning("Display: unexpected batch response %s" % response)
+            elif response[0] == ACK:
+                return True
+            else:
+                errors.append(response[0])
@@ -0,0 +1,103 @@
+"""
+Copyright 2024 Joe Maples <joe@maples.dev>
+
+This file is part of klipmi.
+
+klipmi is free software: you can redistribute it and/or modify it under the
+terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+klipmi is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+klipmi. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import asyncio
+import io
+import logging
+import multiprocessing
+
+from concurrent.futures import ProcessPoolExecutor
+from PIL import Image
+from typing import AsyncIterator, List, Tuple
+
+from klipmi.utils.libcolpic import streamThumbnail
+
+
+def encodeThumbnail(data: bytes, size: int, background: str) -> str:
+    # Runs in the worker processes, so it only takes and returns plain data
+    return "".join(
+        streamThumbnail(Image.open(io.BytesIO(data)), size, size, background)
+    )
+
+
+async def splitThumbnail(thumbnail: str, chunksize: int) -> AsyncIterator[str]:
+    for start in range(0, len(thumbnail), chunksize):
+        yield thumbnail[start : start + chunksize]
+
+
+class ThumbnailEncoder:
+    """
+    Decodes and encodes thumbnails in a pool of `workers` processes, so the
+    event loop is free for the display and Moonraker in the meantime. With
+    no workers the encoding runs on the event loop and is streamed part by
+    part instead.
+
+    Jobs whose caller is cancelled are dropped from the pool unless a worker
+    has already started on them.
+    """
+
+    def __init__(self, workers: int):
+        self.workers: int = workers
+        self.pool: ProcessPoolExecutor | None = None
+        self.encoded: int = 0
+
+    def __pool(self) -> ProcessPoolExecutor:
+        if self.pool is None:
+            # Started on first use, spawned so the workers do not inherit the
+            # serial port and the event loop
+            self.pool = ProcessPoolExecutor(
+                self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self.pool
+
+    async def encode(self, data: bytes, size: int, background: str) -> str:
+        if self.workers <= 0:
+            thumbnail = encodeThumbnail(data, size, background)
+        else:
+            thumbnail = await asyncio.get_running_loop().run_in_executor(
+                self.__pool(), encodeThumbnail, data, size, background
+            )
+        self.encoded += 1
+        return thumbnail
+
+    async def encodeMany(self, jobs: List[Tuple]) -> List[str | BaseException]:
+        # Jobs are the arguments of encode()
+        return await asyncio.gather(
+            *[self.encode(*job) for job in jobs], return_exceptions=True
+        )
+
+    async def stream(
+        self, data: bytes, size: int, background: str, chunksize: int
+    ) -> AsyncIterator[str]:
+        if self.workers > 0:
+            thumbnail = await self.encode(data, size, background)
+            async for part in splitThumbnail(thumbnail, chunksize):
+                yield part
+            return
+
+        # Every part is encoded right before it is sent
+        img = Image.open(io.BytesIO(data))
+        for part in streamThumbnail(img, size, size, background, chunksize):
+            yield part
+        self.encoded += 1
+
+    def close(self):
+        if self.pool is not None:
+            logging.debug("ThumbnailEncoder: %d thumbnails encoded" % self.encoded)
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = None
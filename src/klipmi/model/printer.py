@@ -16,9 +16,13 @@ You should have received a copy of the GNU General Public License along with
 klipmi. If not, see <https://www.gnu.org/licenses/>. 
 """
 
-import requests
+import aiohttp
+import hashlib
 import io
+import logging
+import os
 
+from collections import OrderedDict
 from enum import StrEnum
 from PIL import Image
 from moonraker_api import MoonrakerClient, MoonrakerListener
@@ -30,11 +34,31 @@ from moonraker_api.websockets.websocketclient import (
     WEBSOCKET_CONNECTION_TIMEOUT,
 )
 from nextion.client import asyncio
-from typing import Callable, Coroutine, Dict, List, Literal
+from typing import Callable, Coroutine, Dict, List, Literal, Tuple
 from urllib.request import pathname2url
 
 from klipmi.model.config import MoonrakerConfig
-from klipmi.utils import updateNestedDict
+from klipmi.utils import updateStatus
+from klipmi.utils.gcode import bestFit, readThumbnail
+
+THUMBNAIL_TIMEOUT = 5
+# Downloaded thumbnails kept to answer conditional requests
+THUMBNAIL_DOWNLOADS = 8
+# Thumbnails kept scaled down to the sizes they were asked for
+THUMBNAIL_SCALED = 16
+
+
+def scaleThumbnail(data: bytes, size: int) -> bytes:
+    img = Image.open(io.BytesIO(data))
+    if img.width <= size and img.height <= size:
+        return data
+    # thumbnail() lets JPEGs decode at a fraction of their size (draft) and
+    # halves larger images by whole steps (reduce) before resampling, the
+    # encoder then gets the same pixels it would have scaled itself
+    img.thumbnail((size, size))
+    output = io.BytesIO()
+    img.save(output, "PNG")
+    return output.getvalue()
 
 
 class PrinterState(StrEnum):
@@ -67,10 +91,19 @@ class Printer(MoonrakerListener):
         self.printerCallback: Callable = printerCallback
         self.filesCallback: Callable = filesCallback
         self.options: MoonrakerConfig = options
-        self.objects = objects
+        # Objects every page needs, the current page adds its own on top
+        self.baseObjects: Dict[str, List[str]] = objects
+        self.objects: Dict[str, List[str]] = objects
         self.running: bool = False
         self.status: dict = {}
         self.files: dict = {}
+        self.session: aiohttp.ClientSession | None = None
+        # Validator headers and content of recent downloads by URL
+        self.downloads: OrderedDict[str, Tuple[Dict[str, str], bytes]] = (
+            OrderedDict()
+        )
+        # Scaled thumbnails by hash of the source and size
+        self.scaled: OrderedDict[Tuple[str, int], bytes] = OrderedDict()
         self.client: MoonrakerClient = MoonrakerClient(
             self, options.host, options.port, options.api_key
         )
@@ -84,6 +117,9 @@ class Printer(MoonrakerListener):
         self.running = False
         await self.__updateState(PrinterState.STOPPED)
         await self.client.disconnect()
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
 
     async def state_changed(self, state: str | Literal[120]):
         tasks: List[Coroutine] = []
@@ -115,8 +151,9 @@ class Printer(MoonrakerListener):
         elif method == Notifications.KLIPPY_DISCONNECTED:
             tasks.append(self.__updateState(PrinterState.KLIPPER_ERR))
         elif method == Notifications.STATUS_UPDATE:
-            updateNestedDict(self.status, data[0])
-            tasks.append(self.printerCallback(self.status))
+            changes = updateStatus(self.status, data[0])
+            if changes:
+                tasks.append(self.printerCallback(self.status, changes))
         elif method == Notifications.FILES_CHANGED:
             self.files = data[0]
             tasks.append(self.filesCallback(self.files))
@@ -125,8 +162,35 @@ class Printer(MoonrakerListener):
     async def on_exception(self, exception: type | BaseException) -> None:
         """TODO"""
 
+    def setPageObjects(self, objects: Dict[str, List[str]]):
+        merged = {name: list(fields) for name, fields in self.baseObjects.items()}
+        for name, fields in objects.items():
+            merged.setdefault(name, [])
+            merged[name] += [field for field in fields if field not in merged[name]]
+
+        if merged == self.objects:
+            return
+        self.objects = merged
+        if self.client.is_connected:
+            # A new subscription replaces the previous one
+            asyncio.create_task(self.__resubscribe())
+
+    async def __resubscribe(self):
+        try:
+            await self.__subscribe()
+        except Exception as e:
+            logging.exception(e)
+
     async def __subscribe(self):
-        await self.client.call_method("printer.objects.subscribe", objects=self.objects)
+        result = await self.client.call_method(
+            "printer.objects.subscribe", objects=self.objects
+        )
+        # The reply carries the current values of the subscribed objects,
+        # hand them out right away instead of waiting for the next change
+        if result and "status" in result:
+            await self.printerCallback(
+                self.status, updateStatus(self.status, result["status"])
+            )
 
     async def __updateKlippyStatus(self):
         status = await self.client.get_klipper_status()
@@ -152,28 +216,99 @@ class Printer(MoonrakerListener):
         return metadata
 
     async def getThumbnail(self, size: int, filename: str):
+        return Image.open(io.BytesIO(await self.getThumbnailData(size, filename)))
+
+    async def getThumbnailData(self, size: int, filename: str) -> bytes:
+        """
+        Image data of the thumbnail of `filename` that fits `size` best,
+        scaled down to `size` if it is larger.
+        """
+        data = await self.__readThumbnail(size, filename)
+        key = (hashlib.sha1(data).hexdigest(), size)
+        if key in self.scaled:
+            self.scaled.move_to_end(key)
+            return self.scaled[key]
+
+        # Off the event loop, large thumbnails take a while to decode
+        scaled = await asyncio.to_thread(scaleThumbnail, data, size)
+        self.scaled[key] = scaled
+        while len(self.scaled) > THUMBNAIL_SCALED:
+            self.scaled.popitem(last=False)
+        return scaled
+
+    async def __readThumbnail(self, size: int, filename: str) -> bytes:
+        if self.options.gcodes_path:
+            try:
+                # Off the event loop, the file may have to come from disk
+                data = await asyncio.to_thread(
+                    readThumbnail, self.__localPath(filename), size
+                )
+                if data is not None:
+                    return data
+            except Exception as e:
+                logging.warning(
+                    "Reading the thumbnail of %s failed: %s" % (filename, e)
+                )
+
         thumbnailsList = await self.client.call_method(
             "server.files.thumbnails", filename=filename
         )
-
-        thumbnail = {}
-        for item in thumbnailsList:
-            if item["width"] == size:
-                thumbnail = item
-                break
-            if thumbnail == {} or item["width"] > item["width"]:
-                thumbnail = item
+        thumbnail = bestFit(thumbnailsList, size)
+        if thumbnail is None:
+            raise FileNotFoundError("%s has no thumbnails" % filename)
 
         path = thumbnail["thumbnail_path"]
         host = self.options.host
         if "http" not in host:
             host = "http://%s" % host
 
-        img = requests.get(
-            "%s/server/files/gcodes/%s" % (host, pathname2url(path)),
-            timeout=5,
-        )
-        return Image.open(io.BytesIO(img.content))
+        url = "%s/server/files/gcodes/%s" % (host, pathname2url(path))
+        return await self.__download(url)
+
+    def __localPath(self, filename: str) -> str:
+        root = os.path.realpath(self.options.gcodes_path)
+        path = os.path.realpath(os.path.join(root, filename))
+        if os.path.commonpath([root, path]) != root:
+            raise ValueError("%s is outside of %s" % (filename, root))
+        return path
+
+    async def __download(self, url: str) -> bytes:
+        if self.session is None or self.session.closed:
+            # One session for all downloads, so connections are reused
+            self.session = aiohttp.ClientSession(
+                headers=(
+                    {"X-Api-Key": self.options.api_key} if self.options.api_key else {}
+                ),
+                timeout=aiohttp.ClientTimeout(total=THUMBNAIL_TIMEOUT),
+            )
+
+        headers: Dict[str, str] = {}
+        cached = self.downloads.get(url)
+        if cached is not None:
+            validators, _ = cached
+            if "ETag" in validators:
+                headers["If-None-Match"] = validators["ETag"]
+            if "Last-Modified" in validators:
+                headers["If-Modified-Since"] = validators["Last-Modified"]
+
+        async with self.session.get(url, headers=headers) as response:
+            if response.status == 304 and cached is not None:
+                self.downloads.move_to_end(url)
+                return cached[1]
+            response.raise_for_status()
+            content = await response.read()
+            validators = {
+                name: response.headers[name]
+                for name in ("ETag", "Last-Modified")
+                if name in response.headers
+            }
+
+        if validators:
+            self.downloads[url] = (validators, content)
+            self.downloads.move_to_end(url)
+            while len(self.downloads) > THUMBNAIL_DOWNLOADS:
+                self.downloads.popitem(last=False)
+        return content
 
     def runGcode(self, gcode: str):
         asyncio.create_task(
@@ -0,0 +1,83 @@
+"""
+Copyright 2024 Joe Maples <joe@maples.dev>
+
+This file is part of klipmi.
+
+klipmi is free software: you can redistribute it and/or modify it under the
+terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+klipmi is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+klipmi. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import asyncio
+import logging
+
+from typing import Callable, Set, Tuple
+
+
+class RenderScheduler:
+    """
+    Sits between the printer and the UI and renders status updates at most
+    `rate` times per second. Updates arriving while a render is pending are
+    merged, only the newest status is rendered along with the union of the
+    change sets.
+    """
+
+    def __init__(self, callback: Callable, rate: float):
+        self.callback: Callable = callback
+        self.interval: float = 1 / rate if rate > 0 else 0
+        self.pending: dict | None = None
+        self.changes: Set[Tuple[str, str]] | None = None
+        self.task: asyncio.Task | None = None
+        self.lastRender: float = 0
+        self.received: int = 0
+        self.rendered: int = 0
+        self.coalesced: int = 0
+
+    async def submit(self, status: dict, changes: Set[Tuple[str, str]] | None = None):
+        self.received += 1
+        if self.pending is not None:
+            self.coalesced += 1
+            # None stands for everything
+            if self.changes is None or changes is None:
+                changes = None
+            else:
+                changes = self.changes | changes
+        # The printer hands over its fully merged status, so the newest one
+        # already contains everything the older ones had
+        self.pending = status
+        self.changes = changes
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self.__run())
+
+    async def __run(self):
+        loop = asyncio.get_running_loop()
+        while self.pending is not None:
+            wait = self.lastRender + self.interval - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            status = self.pending
+            changes = self.changes
+            self.pending = None
+            self.changes = None
+            self.lastRender = loop.time()
+            try:
+                await self.callback(status, changes)
+            except Exception as e:
+                logging.exception(e)
+            self.rendered += 1
+
+    def summary(self) -> str:
+        return "Status updates: %d received, %d rendered, %d coalesced" % (
+            self.received,
+            self.rendered,
+            self.coalesced,
+        )
@@ -17,16 +17,20 @@ klipmi. If not, see <https://www.gnu.org/licenses/>.
 """
 
 from asyncio import AbstractEventLoop
-from nextion import TJC
 
 from klipmi.model.config import Config
+from klipmi.model.display import Display
+from klipmi.model.encoder import ThumbnailEncoder
 from klipmi.model.printer import Printer, PrinterState
+from klipmi.model.thumbnails import ThumbnailCache
 
 
 class KlipmiState:
     def __init__(self):
         self.options: Config
-        self.display: TJC
+        self.display: Display
         self.printer: Printer
+        self.thumbnails: ThumbnailCache
+        self.encoder: ThumbnailEncoder
         self.status: PrinterState = PrinterState.NOT_READY
         self.loop: AbstractEventLoop
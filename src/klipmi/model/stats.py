@@ -0,0 +1,223 @@
+"""
+Copyright 2024 Joe Maples <joe@maples.dev>
+
+This file is part of klipmi.
+
+klipmi is free software: you can redistribute it and/or modify it under the
+terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+klipmi is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+klipmi. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import asyncio
+import logging
+import re
+
+from collections.abc import Callable
+from enum import StrEnum
+from typing import Dict, List, Tuple
+
+# Upper bounds of the latency histogram buckets in milliseconds, the last
+# bucket takes everything above
+LATENCY_BUCKETS: List[float] = [5, 10, 20, 50, 100, 200, 500, 1000]
+
+
+class Outcome(StrEnum):
+    OK = "ok"
+    TIMEOUT = "timeout"
+    ERROR = "error"
+
+
+def componentOf(command: str) -> str:
+    # p[17].cp0.write("...") -> cp0, n0.val=1 -> n0, vis cp0,0 -> vis
+    name = re.split(r"[ =(]", command, maxsplit=1)[0]
+    parts = [part for part in name.split(".") if not part.startswith("p[")]
+    return parts[0] if parts else name
+
+
+class CommandStats:
+    def __init__(self):
+        self.count: int = 0
+        self.sent: int = 0
+        self.received: int = 0
+        self.time: float = 0
+        self.maxTime: float = 0
+        self.timeouts: int = 0
+        self.errors: int = 0
+        self.histogram: List[int] = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def record(self, sent: int, received: int, latency: float, outcome: Outcome):
+        self.count += 1
+        self.sent += sent
+        self.received += received
+        self.time += latency
+        self.maxTime = max(self.maxTime, latency)
+        if outcome == Outcome.TIMEOUT:
+            self.timeouts += 1
+        elif outcome == Outcome.ERROR:
+            self.errors += 1
+
+        bucket = len(LATENCY_BUCKETS)
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if latency * 1000 <= bound:
+                bucket = i
+                break
+        self.histogram[bucket] += 1
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "sent": self.sent,
+            "received": self.received,
+            "time": self.time,
+            "max_time": self.maxTime,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            "histogram": dict(
+                zip([str(b) for b in LATENCY_BUCKETS] + ["inf"], self.histogram)
+            ),
+        }
+
+
+class HandlerStats:
+    def __init__(self):
+        self.count: int = 0
+        self.time: float = 0
+        self.maxTime: float = 0
+        self.errors: int = 0
+
+    def record(self, latency: float, failed: bool):
+        self.count += 1
+        self.time += latency
+        self.maxTime = max(self.maxTime, latency)
+        if failed:
+            self.errors += 1
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "time": self.time,
+            "max_time": self.maxTime,
+            "errors": self.errors,
+        }
+
+
+class LinkStats:
+    """
+    Counters for the serial link to the display, grouped by page class and
+    component, and for the touch handlers of the pages.
+    """
+
+    def __init__(self):
+        self.commands: Dict[Tuple[str, str], CommandStats] = {}
+        self.handlers: Dict[str, HandlerStats] = {}
+        self.sent: int = 0
+        self.received: int = 0
+        self.timeouts: int = 0
+        self.timeoutTime: float = 0
+        self.errors: int = 0
+        self.busyTime: float = 0
+
+    def record(
+        self,
+        page: str,
+        component: str,
+        sent: int,
+        received: int,
+        latency: float,
+        outcome: Outcome,
+    ):
+        key = (page, component)
+        if key not in self.commands:
+            self.commands[key] = CommandStats()
+        self.commands[key].record(sent, received, latency, outcome)
+
+        self.sent += sent
+        self.received += received
+        self.busyTime += latency
+        if outcome == Outcome.TIMEOUT:
+            self.timeouts += 1
+            self.timeoutTime += latency
+        elif outcome == Outcome.ERROR:
+            self.errors += 1
+
+    def recordHandler(self, handler: str, latency: float, failed: bool):
+        if handler not in self.handlers:
+            self.handlers[handler] = HandlerStats()
+        self.handlers[handler].record(latency, failed)
+
+    def snapshot(self) -> dict:
+        pages: Dict[str, Dict[str, dict]] = {}
+        for (page, component), stats in self.commands.items():
+            pages.setdefault(page, {})[component] = stats.snapshot()
+        return {
+            "sent": self.sent,
+            "received": self.received,
+            "busy_time": self.busyTime,
+            "timeouts": self.timeouts,
+            "timeout_time": self.timeoutTime,
+            "errors": self.errors,
+            "pages": pages,
+            "handlers": {
+                handler: stats.snapshot() for handler, stats in self.handlers.items()
+            },
+        }
+
+    def summary(self, top: int = 5) -> str:
+        lines = [
+            "Display link: %d bytes sent, %d bytes received, %.1fs busy, "
+            "%d timeouts (%.1fs lost), %d errors"
+            % (
+                self.sent,
+                self.received,
+                self.busyTime,
+                self.timeouts,
+                self.timeoutTime,
+                self.errors,
+            )
+        ]
+        busiest = sorted(
+            self.commands.items(), key=lambda item: item[1].time, reverse=True
+        )
+        for (page, component), stats in busiest[:top]:
+            lines.append(
+                "  %s %s: %d commands, %d bytes, %.1fms avg, %.1fms max"
+                % (
+                    page,
+                    component,
+                    stats.count,
+                    stats.sent,
+                    stats.time / stats.count * 1000,
+                    stats.maxTime * 1000,
+                )
+            )
+
+        slowest = sorted(
+            self.handlers.items(), key=lambda item: item[1].maxTime, reverse=True
+        )
+        for handler, stats in slowest[:top]:
+            lines.append(
+                "  %s: %d touches, %.1fms avg, %.1fms max, %d errors"
+                % (
+                    handler,
+                    stats.count,
+                    stats.time / stats.count * 1000,
+                    stats.maxTime * 1000,
+                    stats.errors,
+                )
+            )
+        return "\n".join(lines)
+
+    async def report(self, interval: float, *summaries: Callable[[], str]):
+        # `summaries` add the lines of other components to every report
+        while True:
+            await asyncio.sleep(interval)
+            lines = [self.summary()] + [summary() for summary in summaries]
+            logging.info("\n".join(lines))
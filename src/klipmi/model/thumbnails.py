@@ -0,0 +1,237 @@
+"""
+Copyright 2024 Joe Maples <joe@maples.dev>
+
+This file is part of klipmi.
+
+klipmi is free software: you can redistribute it and/or modify it under the
+terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+klipmi is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+klipmi. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import AsyncIterator, List, Tuple
+
+from klipmi.model.encoder import ThumbnailEncoder
+from klipmi.model.printer import Printer
+
+SUFFIX = ".colpic"
+# Seconds between a file change and warming its thumbnails, gives uploads
+# time to finish and Moonraker time to extract the thumbnails
+WARM_DELAY = 5
+WARM_ACTIONS = ["create_file", "modify_file", "move_file"]
+
+
+class ThumbnailCache:
+    """
+    Encoded thumbnails on disk, keyed by file, modification time, size and
+    background color. Entries are evicted least recently used first once
+    they take more than `budget` bytes. The modification time of an entry
+    is its last use, so the order survives restarts.
+    """
+
+    def __init__(self, path: str, budget: int):
+        self.path: str = path
+        self.budget: int = budget
+        # Entry name to size, least recently used first
+        self.entries: OrderedDict[str, int] = OrderedDict()
+        self.size: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+        if budget <= 0:
+            return
+        try:
+            os.makedirs(path, exist_ok=True)
+            found = []
+            for entry in os.scandir(path):
+                if entry.name.endswith(SUFFIX):
+                    info = entry.stat()
+                    found.append((info.st_mtime, entry.name, info.st_size))
+                elif entry.name.endswith(".tmp"):
+                    # Left over from an interrupted write
+                    os.remove(entry.path)
+            for _, name, size in sorted(found):
+                self.entries[name] = size
+                self.size += size
+            self.__evict()
+        except Exception as e:
+            logging.exception(e)
+
+    @staticmethod
+    def key(filename: str, modified: float, size: int, background: str) -> str:
+        key = "%s\0%r\0%d\0%s" % (filename, modified, size, background.lower())
+        return hashlib.sha1(key.encode()).hexdigest() + SUFFIX
+
+    def contains(self, key: str) -> bool:
+        return key in self.entries
+
+    def get(self, key: str) -> str | None:
+        if key not in self.entries:
+            self.misses += 1
+            return None
+
+        path = os.path.join(self.path, key)
+        try:
+            with open(path) as f:
+                thumbnail = f.read()
+            os.utime(path)
+        except Exception as e:
+            logging.warning("ThumbnailCache: dropping %s: %s" % (key, e))
+            self.size -= self.entries.pop(key)
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return thumbnail
+
+    def put(self, key: str, thumbnail: str):
+        if self.budget <= 0 or len(thumbnail) > self.budget:
+            return
+
+        path = os.path.join(self.path, key)
+        try:
+            # Written next to the entry first, so a crash never leaves a
+            # truncated thumbnail behind
+            with open(path + ".tmp", "w") as f:
+                f.write(thumbnail)
+            os.replace(path + ".tmp", path)
+        except Exception as e:
+            logging.exception(e)
+            return
+
+        if key in self.entries:
+            self.size -= self.entries.pop(key)
+        self.entries[key] = len(thumbnail)
+        self.size += len(thumbnail)
+        self.__evict()
+
+    async def record(self, key: str, parts: AsyncIterator[str]) -> AsyncIterator[str]:
+        """
+        Passes the parts through and stores them once all of them were taken.
+        """
+        thumbnail: List[str] = []
+        async for part in parts:
+            thumbnail.append(part)
+            yield part
+        self.put(key, "".join(thumbnail))
+
+    def __evict(self):
+        while self.size > self.budget and self.entries:
+            key, size = self.entries.popitem(last=False)
+            self.size -= size
+            self.evictions += 1
+            try:
+                os.remove(os.path.join(self.path, key))
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logging.exception(e)
+
+    def snapshot(self) -> dict:
+        return {
+            "entries": len(self.entries),
+            "size": self.size,
+            "budget": self.budget,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class ThumbnailWarmer:
+    """
+    Encodes the thumbnails of new and changed gcode files into the cache in
+    the background. At most one job less than the encoder has workers is in
+    the pool at a time, so one worker is always free for interactive
+    uploads. With fewer than two workers nothing is warmed, the encoding
+    would hold up the uploads or the event loop. A file is queued once no
+    matter how often it changes before it is warmed.
+
+    `jobs` returns the size and background of every thumbnail the pages
+    show, the entries are keyed the same way as the uploads of the pages.
+    """
+
+    def __init__(
+        self,
+        printer: Printer,
+        cache: ThumbnailCache,
+        encoder: ThumbnailEncoder,
+        jobs: Callable[[], List[Tuple[int, str]]],
+    ):
+        self.printer: Printer = printer
+        self.cache: ThumbnailCache = cache
+        self.encoder: ThumbnailEncoder = encoder
+        self.jobs: Callable[[], List[Tuple[int, str]]] = jobs
+        self.pending: OrderedDict[str, None] = OrderedDict()
+        self.task: asyncio.Task | None = None
+        self.warmed: int = 0
+
+    def onFilesChanged(self, data: dict):
+        if self.cache.budget <= 0 or self.encoder.workers < 2 or not self.jobs():
+            return
+        item = data.get("item", {})
+        if data.get("action") not in WARM_ACTIONS or item.get("root") != "gcodes":
+            return
+
+        self.pending[item["path"]] = None
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self.__run())
+
+    async def __run(self):
+        while self.pending:
+            await asyncio.sleep(WARM_DELAY)
+            slots = self.encoder.workers - 1
+            files = []
+            while self.pending and len(files) < slots:
+                files.append(self.pending.popitem(last=False)[0])
+
+            jobs: List[Tuple[str, str, Tuple]] = []
+            for filename in files:
+                try:
+                    jobs += await self.__fileJobs(filename)
+                except Exception as e:
+                    logging.warning("ThumbnailWarmer: skipping %s: %s" % (filename, e))
+
+            for start in range(0, len(jobs), slots):
+                await self.__encode(jobs[start : start + slots])
+
+    async def __encode(self, jobs: List[Tuple[str, str, Tuple]]):
+        results = await self.encoder.encodeMany([job for _, _, job in jobs])
+        for (filename, key, job), result in zip(jobs, results):
+            if isinstance(result, BaseException):
+                logging.warning("ThumbnailWarmer: skipping %s: %s" % (filename, result))
+                continue
+            self.cache.put(key, result)
+            self.warmed += 1
+            logging.debug(
+                "ThumbnailWarmer: %s encoded at %dpx, %d warmed so far"
+                % (filename, job[1], self.warmed)
+            )
+
+    async def __fileJobs(self, filename: str) -> List[Tuple[str, str, Tuple]]:
+        # Cache key and encoder arguments of every size that is not cached
+        metadata = await self.printer.getMetadata(filename)
+        jobs = []
+        for size, background in self.jobs():
+            key = self.cache.key(filename, metadata["modified"], size, background)
+            if self.cache.contains(key):
+                continue
+            data = await self.printer.getThumbnailData(size, filename)
+            jobs.append((filename, key, (data, size, background)))
+        return jobs
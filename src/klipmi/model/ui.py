@@ -17,19 +17,79 @@ klipmi. If not, see <https://www.gnu.org/licenses/>.
 """
 
 import asyncio
+import contextvars
+import inspect
+import time
 from abc import ABC, abstractmethod
 from collections.abc import Callable
-from typing import Dict, List, Type
+from typing import Dict, List, Set, Tuple, Type
 
 from nextion import EventType
 from nextion.client import logging
 
+from klipmi.model.display import Priority
+from klipmi.model.encoder import splitThumbnail
 from klipmi.model.state import KlipmiState
+from klipmi.model.upload import PictureUpload
 from klipmi.utils import classproperty
-from klipmi.utils.libcolpic import parseThumbnail
+
+
+def touch(*componentIds: int):
+    """
+    Registers a page method as the touch handler of the given component ids.
+    Handlers are called with the touch event data and may be coroutines.
+    """
+
+    def decorator(handler: Callable) -> Callable:
+        handler.touchComponents = componentIds
+        return handler
+
+    return decorator
+
+
+def watch(*paths: str):
+    """
+    Registers a page method as the handler of printer status changes of the
+    given "object.field" paths, a bare object name matches all of its fields.
+    Handlers are called with the merged printer status.
+    """
+
+    def decorator(handler: Callable) -> Callable:
+        handler.watchPaths = paths
+        return handler
+
+    return decorator
 
 
 class BasePage(ABC):
+    # Component id to handler name, compiled once per class from the touch
+    # handlers of the class and all of its bases
+    touchHandlers: Dict[int, str] = {}
+    # (object, field) to handler names, field is None for whole objects
+    statusHandlers: Dict[Tuple[str, str | None], List[str]] = {}
+    statusHandlerNames: List[str] = []
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        handlers: Dict[int, str] = {}
+        paths: Dict[str, Tuple[str, ...]] = {}
+        # Walk from the base classes down, so subclasses override
+        for klass in reversed(cls.__mro__):
+            for name, member in vars(klass).items():
+                for componentId in getattr(member, "touchComponents", ()):
+                    handlers[componentId] = name
+                if hasattr(member, "watchPaths"):
+                    paths[name] = member.watchPaths
+        cls.touchHandlers = handlers
+
+        statusHandlers: Dict[Tuple[str, str | None], List[str]] = {}
+        for name, watched in paths.items():
+            for path in watched:
+                objectName, _, field = path.partition(".")
+                statusHandlers.setdefault((objectName, field or None), []).append(name)
+        cls.statusHandlers = statusHandlers
+        cls.statusHandlerNames = list(paths)
+
     @classproperty
     @abstractmethod
     def name(cls) -> str:
@@ -40,61 +100,176 @@ class BasePage(ABC):
     def id(cls) -> int:
         pass
 
+    @classproperty
+    def printerObjects(cls) -> Dict[str, List[str]]:
+        # Printer objects the page needs on top of the ones of the UI
+        return {}
+
     def __init__(self, state: KlipmiState, changePageCallback: Callable):
         self.state = state
         self.changePageCallback = changePageCallback
+        # Thumbnail uploads in flight, cancelled when the page is left
+        self.uploads: Set[asyncio.Task] = set()
 
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
+    async def onEnter(self):
+        # Pages are kept alive between visits, the panel resets every
+        # component on page load though
+        await self.init()
+
+    async def onLeave(self):
         pass
 
+    async def onDisplayEvent(self, type: EventType, data):
+        if type == EventType.TOUCH:
+            await self.dispatchTouch(data)
+
+    async def dispatchTouch(self, data) -> bool:
+        name = self.touchHandlers.get(data.component_id)
+        if name is None:
+            return False
+
+        start = time.monotonic()
+        failed = True
+        try:
+            result = getattr(self, name)(data)
+            if inspect.isawaitable(result):
+                await result
+            failed = False
+        finally:
+            self.state.display.stats.recordHandler(
+                "%s.%s" % (type(self).__name__, name),
+                time.monotonic() - start,
+                failed,
+            )
+        return True
+
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
+    async def dispatchStatus(self, data: dict, changes: Set[Tuple[str, str]] | None):
+        # None means everything has to be rendered
+        if changes is None:
+            names = self.statusHandlerNames
+        else:
+            matched = set()
+            for objectName, field in changes:
+                matched.update(self.statusHandlers.get((objectName, field), ()))
+                matched.update(self.statusHandlers.get((objectName, None), ()))
+            names = [name for name in self.statusHandlerNames if name in matched]
+
+        for name in names:
+            await getattr(self, name)(data)
+
     async def onFileListUpdate(self, data: dict):
         pass
 
     def changePage(self, page):
         self.changePageCallback(page)
 
+    def cancelUploads(self):
+        for task in self.uploads:
+            task.cancel()
+
     async def uploadThumbnail(
-        self, element: str, size: int, bgColor: str, filename: str
+        self,
+        element: str,
+        size: int,
+        bgColor: str,
+        filename: str,
+        progress: Callable[[int, int | None, float], None] | None = None,
     ):
-        thumbnail = parseThumbnail(
-            await self.state.printer.getThumbnail(size, filename),
-            size,
-            size,
-            bgColor,
+        """
+        Sends the thumbnail of `filename` to the picture component `element`.
+        `progress` is handed to PictureUpload.
+        """
+        # Started in a context of its own, so the upload neither joins a
+        # batch of the caller nor takes over its priority
+        task = asyncio.create_task(
+            self.__uploadThumbnail(element, size, bgColor, filename, progress),
+            context=contextvars.Context(),
         )
-        await self.state.display.command("p[%d].%s.close()" % (self.id, element))
-
-        parts = []
-        start = 0
-        end = 1024
-        while start + 1024 < len(thumbnail):
-            parts.append(thumbnail[start:end])
-            start = start + 1024
-            end = end + 1024
-
-        parts.append(thumbnail[start : len(thumbnail)])
-        for part in parts:
-            await self.state.display.command(
-                'p[%d].%s.write("%s")' % (self.id, element, str(part))
+        self.uploads.add(task)
+        try:
+            await task
+        except asyncio.CancelledError:
+            if asyncio.current_task().cancelling():
+                raise
+            logging.debug("Thumbnail upload of %s cancelled" % filename)
+        finally:
+            self.uploads.discard(task)
+
+    async def __uploadThumbnail(
+        self,
+        element: str,
+        size: int,
+        bgColor: str,
+        filename: str,
+        progress: Callable[[int, int | None, float], None] | None,
+    ):
+        thumbnails = self.state.thumbnails
+        key = None
+        if thumbnails.budget > 0:
+            try:
+                metadata = await self.state.printer.getMetadata(filename)
+                key = thumbnails.key(filename, metadata["modified"], size, bgColor)
+            except Exception as e:
+                logging.warning("Thumbnail of %s is not cached: %s" % (filename, e))
+
+        thumbnail = thumbnails.get(key) if key is not None else None
+        total = None
+        if thumbnail is not None:
+            parts = splitThumbnail(thumbnail, 1024)
+            total = len(thumbnail)
+        else:
+            parts = self.state.encoder.stream(
+                await self.state.printer.getThumbnailData(size, filename),
+                size,
+                bgColor,
+                1024,
             )
+            if key is not None:
+                parts = thumbnails.record(key, parts)
+        logging.debug(
+            "Thumbnail cache: %d hits, %d misses"
+            % (thumbnails.hits, thumbnails.misses)
+        )
+
+        # Every window is scheduled on its own, so touch handling and status
+        # updates get the display in between two windows
+        with self.state.display.priority(Priority.BULK):
+            upload = PictureUpload(self.state.display, self.id, element, progress)
+            await upload.send(parts, total)
 
 
 class BaseUi(ABC):
     currentPage: BasePage | None = None
+    # Page the panel is known to show, None when unknown
+    shownPage: BasePage | None = None
+    # Whether the next status update has to render everything
+    fullRender: bool = True
 
     @classproperty
     @abstractmethod
     def printerObjects(cls) -> Dict[str, List[str]]:
         pass
 
+    @classproperty
+    def thumbnailSizes(cls) -> List[Tuple[Type[BasePage], str, int, str]]:
+        # Page, element, size and background of the thumbnails the pages
+        # upload, new files get them encoded ahead of time
+        return []
+
     def __init__(self, state: KlipmiState):
         self.state = state
+        self.pages: Dict[Type[BasePage], BasePage] = {}
+        self.pageChange: asyncio.Task | None = None
+
+    def thumbnailJobs(self) -> List[Tuple[int, str]]:
+        # Encoder arguments of thumbnailSizes, keyed the way the pages upload
+        return [(size, background) for _, _, size, background in self.thumbnailSizes]
 
     @abstractmethod
     def onNotReady(self):
@@ -118,26 +293,78 @@ class BaseUi(ABC):
 
     async def onDisplayEvent(self, type: EventType, data):
         logging.info("onDisplayEvent: EventType: %s, data: %s" % (type.name, str(data)))
+        if (
+            type == EventType.TOUCH
+            and self.currentPage is not None
+            and data.page_id != self.currentPage.id
+        ):
+            # The panel switched pages on its own, the shadow is stale
+            self.state.display.clearShadow()
+            self.shownPage = None
+            self.fullRender = True
         if self.currentPage is not None:
-            await self.currentPage.onDisplayEvent(type, data)
+            with self.state.display.priority(Priority.INTERACTIVE):
+                await self.currentPage.onDisplayEvent(type, data)
 
-    async def onPrinterStatusUpdate(self, data: dict):
+    async def onPrinterStatusUpdate(
+        self, data: dict, changes: Set[Tuple[str, str]] | None = None
+    ):
         if self.currentPage is not None:
-            await self.currentPage.onPrinterStatusUpdate(data)
+            if self.fullRender:
+                changes = None
+                self.fullRender = False
+            # Send everything a status update changes in a single write
+            with self.state.display.priority(Priority.TELEMETRY):
+                async with self.state.display.batch():
+                    await self.currentPage.dispatchStatus(data, changes)
+                    await self.currentPage.onPrinterStatusUpdate(data)
 
     async def onFileListUpdate(self, data: dict):
         if self.currentPage is not None:
             await self.currentPage.onFileListUpdate(data)
 
+    def onDisplayReconnected(self):
+        # The panel restarted on its boot page, the next page change has to
+        # be sent even if it targets the current page
+        self.shownPage = None
+
     async def __executePageChange(self):
-        if self.currentPage is not None:
-            await self.state.display.wakeup()
-            await self.state.display.command(
-                "page %d" % self.currentPage.id, self.state.options.timeout
-            )
-            await self.currentPage.init()
+        # Page changes requested while one is running are picked up by the
+        # loop, only the latest target is sent to the panel
+        while self.currentPage is not None and self.currentPage is not self.shownPage:
+            page = self.currentPage
+            with self.state.display.priority(Priority.INTERACTIVE):
+                if self.shownPage is not None:
+                    await self.shownPage.onLeave()
+                    self.shownPage.cancelUploads()
+                self.shownPage = None
+                await self.state.display.wakeup()
+                await self.state.display.command(
+                    "page %d" % page.id, self.state.options.timeout
+                )
+                # Components are reset by the panel on page load
+                self.state.display.clearShadow()
+                self.shownPage = page
+                self.fullRender = True
+                await page.onEnter()
 
     def changePage(self, page: Type[BasePage]):
-        self.currentPage = page(self.state, self.changePage)
+        if type(self.currentPage) is page and (
+            self.currentPage is self.shownPage
+            or (self.pageChange is not None and not self.pageChange.done())
+        ):
+            logging.debug(f"changePage: already on {page.__name__}")
+            return
+
+        if page not in self.pages:
+            self.pages[page] = page(self.state, self.changePage)
+        self.currentPage = self.pages[page]
+        self.state.display.page = page.__name__
+        self.state.printer.setPageObjects(page.printerObjects)
         logging.info(f"changePage: self.currentPage: {self.currentPage}")
-        asyncio.create_task(self.__executePageChange())
+        if self.pageChange is None or self.pageChange.done():
+            # Page changes are often requested by status handlers, the new
+            # page must not write into their batch or at their priority
+            self.pageChange = asyncio.create_task(
+                self.__executePageChange(), context=contextvars.Context()
+            )
@@ -0,0 +1,177 @@
+"""
+Copyright 2024 Joe Maples <joe@maples.dev>
+
+This file is part of klipmi.
+
+klipmi is free software: you can redistribute it and/or modify it under the
+terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+klipmi is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+klipmi. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import asyncio
+import logging
+import time
+
+from collections.abc import Callable
+from nextion.exceptions import CommandFailed, CommandTimeout
+from typing import AsyncIterator
+
+from klipmi.model.display import Display
+
+# Characters per write command, the first one the panel takes is kept
+UPLOAD_CHUNK_SIZES = [4096, 2048, 1024]
+# Seconds of data sent before waiting for the panel, bounds how long other
+# commands wait for the link
+UPLOAD_WINDOW_TIME = 0.2
+# Unanswered windows before an upload is given up
+UPLOAD_RETRIES = 3
+# Time a late answer to a window is still waited for
+UPLOAD_SETTLE_TIME = 0.1
+
+
+class PictureUpload:
+    """
+    Streams text into the picture component `element` of page `page`. The
+    write commands are sent in windows with only errors reported, so the
+    panel is kept busy instead of waiting a round trip per command. The
+    largest chunk size the panel takes is found on the first upload and
+    kept on the display.
+
+    Writes append to the picture, so a window is only taken as sent once
+    the panel answered it. Late answers are told apart from lost ones by
+    Display.pipeline, so a slow panel costs no resend and the upload goes on
+    from the last confirmed chunk. Only when it is unknown what the panel
+    holds is the picture closed and the upload started over. The panel does
+    not tell which command of a window failed either, so an error also turns
+    off sending several commands per window.
+
+    `progress` is called with the confirmed characters, the total if known
+    and the rate in characters per second after every window.
+    """
+
+    def __init__(
+        self,
+        display: Display,
+        page: int,
+        element: str,
+        progress: Callable[[int, int | None, float], None] | None = None,
+    ):
+        self.display: Display = display
+        self.page: int = page
+        self.element: str = element
+        self.progress: Callable[[int, int | None, float], None] | None = progress
+        self.confirmed: int = 0
+        self.start: float = 0
+        self.restarts: int = 0
+
+    @property
+    def rate(self) -> float:
+        elapsed = time.monotonic() - self.start
+        return self.confirmed / elapsed if elapsed > 0 else 0
+
+    async def __close(self):
+        await self.display.command("p[%d].%s.close()" % (self.page, self.element))
+        self.confirmed = 0
+
+    def __write(self, data: str) -> str:
+        return 'p[%d].%s.write("%s")' % (self.page, self.element, data)
+
+    def __window(self, chunk: int) -> int:
+        if not self.display.uploadPipelined:
+            return chunk
+        overhead = len(self.__write("")) + 3
+        size = self.display.baud / 10 * UPLOAD_WINDOW_TIME
+        return max(1, int(size / (chunk + overhead))) * chunk
+
+    async def send(self, parts: AsyncIterator[str], total: int | None = None):
+        display = self.display
+        probing = display.uploadChunk == 0
+        chunk = display.uploadChunk or UPLOAD_CHUNK_SIZES[0]
+        data = ""
+        exhausted = False
+        retries = 0
+
+        self.start = time.monotonic()
+        await self.__close()
+        while True:
+            # A single command per window while probing, so an error means
+            # the size was rejected
+            span = chunk if probing else self.__window(chunk)
+            while not exhausted and len(data) < self.confirmed + span:
+                try:
+                    data += await anext(parts)
+                except StopAsyncIteration:
+                    exhausted = True
+            end = min(len(data), self.confirmed + span)
+            if end <= self.confirmed:
+                break
+
+            errors = await display.pipeline(
+                [
+                    self.__write(data[offset : min(offset + chunk, end)])
+                    for offset in range(self.confirmed, end, chunk)
+                ],
+                self.element,
+                UPLOAD_SETTLE_TIME,
+            )
+            if errors is None or errors:
+                if probing and chunk > UPLOAD_CHUNK_SIZES[-1]:
+                    chunk = UPLOAD_CHUNK_SIZES[UPLOAD_CHUNK_SIZES.index(chunk) + 1]
+                elif errors is None:
+                    # Bytes lost on the wire leave any prefix of the window
+                    # written, possibly with a cut or merged command, and the
+                    # panel cannot tell how long the text of a picture is.
+                    # Resuming from the confirmed chunk would duplicate or
+                    # skip text, only a closed picture is a known state
+                    retries += 1
+                    if retries > UPLOAD_RETRIES:
+                        raise CommandTimeout(
+                            "Upload to p[%d].%s was not acknowledged"
+                            % (self.page, self.element)
+                        )
+                    logging.warning(
+                        "Upload: end of a window to p[%d].%s got lost, starting over"
+                        % (self.page, self.element)
+                    )
+                elif display.uploadPipelined and not probing:
+                    logging.warning(
+                        "Upload: p[%d].%s rejected a window, no longer pipelining"
+                        % (self.page, self.element)
+                    )
+                    display.uploadPipelined = False
+                else:
+                    raise CommandFailed(self.__write("..."), errors[0])
+                await self.__close()
+                self.restarts += 1
+                continue
+
+            if probing:
+                probing = False
+                display.uploadChunk = chunk
+                logging.debug("Upload: panel takes %d characters per write" % chunk)
+            self.confirmed = end
+            if self.progress is not None:
+                self.progress(self.confirmed, total, self.rate)
+
+        elapsed = time.monotonic() - self.start
+        logging.debug(
+            "Upload: %d characters to p[%d].%s in %.2fs, %.0f characters/s, "
+            "%.0f%% of the link, %d restarts"
+            % (
+                self.confirmed,
+                self.page,
+                self.element,
+                elapsed,
+                self.rate,
+                self.rate * 1000 / display.baud,
+                self.restarts,
+            )
+        )
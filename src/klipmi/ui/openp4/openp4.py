@@ -25,13 +25,8 @@ class OpenP4UI(BaseUi):
     @classproperty
     def printerObjects(cls) -> Dict[str, List[str]]:
         # https://moonraker.readthedocs.io/en/latest/printer_objects
+        # Needed by every page, the pages add their own objects
         return {
-            "motion_report": ["live_position", "live_velocity"],
-            "gcode_move": ["extrude_factor", "speed_factor", "homing_origin"],
-            "extruder": ["temperature", "target"],
-            "heater_bed": ["temperature", "target"],
-            "fan": ["speed"],
-            "heater_generic chamber": ["temperature", "target"],
             "print_stats": [
                 "filename",
                 "total_duration",
@@ -41,17 +36,6 @@ class OpenP4UI(BaseUi):
                 "message",
                 "info",
             ],
-            "display_status": ["progress"],
-            "output_pin caselight": ["value"],
-            #"output_pin sound": ["value"],
-
-            # Fans
-            "fan_generic cooling_fan": ["speed"],           # Part cooling
-            "fan_generic auxiliary_cooling_fan": ["speed"], # Auxiliary cooling
-            "fan_generic exhaust_fan": ["speed"],           # Exhaust fan
-            "heater_fan hotend_fan": ["speed"],             # Hotend fan
-            "heater_fan chamber_fan": ["speed"],            # Chamber fan
-            "fan_generic exhaust_fan": ["speed"],           # Exhaust fan
         }
 
     def onNotReady(self):
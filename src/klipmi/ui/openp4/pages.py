@@ -20,9 +20,10 @@ klipmi. If not, see <https://www.gnu.org/licenses/>.
 import asyncio
 
 from PIL.Image import init
+from typing import Dict, List
 from nextion import EventType
 
-from klipmi.model.ui import BasePage
+from klipmi.model.ui import BasePage, touch, watch
 from klipmi.utils import classproperty
 
 import logging
@@ -36,6 +37,13 @@ MAX_EXTRUDER_TEMP = 370
 MAX_HEATER_BED_TEMP = 120
 MAX_CHAMBER_TEMP = 60
 
+# Printer objects of the pages showing the temperatures
+HEATER_OBJECTS = {
+    "extruder": ["temperature", "target"],
+    "heater_bed": ["temperature", "target"],
+    "heater_generic chamber": ["temperature", "target"],
+}
+
 
 log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
@@ -165,22 +173,10 @@ class OpenP4Page(BasePage):
         if not hasattr(self.state, 'return_page'):
             self.state.return_page = MainPage
 
-    def handleNavBarButtons(self, component_id: int):
-        if component_id == 33: #t33.txt="Home"
-            # 0x21 go_to_main();
-            self.changePage(MainPage)
-        elif component_id == 34: #t34.txt="Ctrl"
-            # 0x22 go_to_control();
-            self.changePage(ControlPage)
-        elif component_id == 35: #t35.txt="Doc"
-            # 0x23 go_to_file_list();
-            self.changePage(FileListPage)
-        elif component_id == 36: #t36.txt="Tool"
-            # 0x24 go_to_adjust();
-            self.changePage(ToolSelectPage)
-        elif component_id == 37: #t37.txt="Set"
-            # 0x25 go_to_setting();
-            self.changePage(LanguagePage)
+    async def onDisplayEvent(self, type: EventType, data):
+        if type == EventType.TOUCH:
+            self.handleScreenSleep(data.page_id)
+            await self.dispatchTouch(data)
 
     def handleScreenSleep(self, page_id: int):
         if page_id == 43: # screen_sleep
@@ -319,6 +315,60 @@ class OpenP4Page(BasePage):
         return self.result
 
 
+class NavBarPage(OpenP4Page):
+    # Nav bar, shared by the pages that show it. Popups and the other
+    # pages without one leave touches on 33-37 unhandled
+
+    @touch(33) #t33.txt="Home"
+    def onNavHome(self, data):
+        # 0x21 go_to_main();
+        self.changePage(MainPage)
+
+    @touch(34) #t34.txt="Ctrl"
+    def onNavControl(self, data):
+        # 0x22 go_to_control();
+        self.changePage(ControlPage)
+
+    @touch(35) #t35.txt="Doc"
+    def onNavFiles(self, data):
+        # 0x23 go_to_file_list();
+        self.changePage(FileListPage)
+
+    @touch(36) #t36.txt="Tool"
+    def onNavTools(self, data):
+        # 0x24 go_to_adjust();
+        self.changePage(ToolSelectPage)
+
+    @touch(37) #t37.txt="Set"
+    def onNavSettings(self, data):
+        # 0x25 go_to_setting();
+        self.changePage(LanguagePage)
+
+
+class SettingsPage(NavBarPage):
+    # Tabs shared by all settings pages
+
+    @touch(0) #t0.txt="Languages"
+    def onTabLanguage(self, data):
+        self.changePage(LanguagePage)
+
+    @touch(1) #t1.txt="Network"
+    def onTabNetwork(self, data):
+        self.changePage(NetworkPage)
+
+    @touch(2) #t2.txt="System message"
+    def onTabSystem(self, data):
+        self.changePage(ResetPage)
+
+    @touch(4) #t4.txt="Check for updates"
+    def onTabUpdate(self, data):
+        self.changePage(UpdatePage)
+
+    @touch(5) #t5.txt="more"
+    def onTabMore(self, data):
+        self.changePage(MorePage)
+
+
 class BootPage(BasePage):
     @classproperty
     def name(cls) -> str:
@@ -384,7 +434,7 @@ class ShutdownPage(OpenP4Page):
         pass
 
 
-class MainPage(OpenP4Page):
+class MainPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -394,6 +444,10 @@ class MainPage(OpenP4Page):
     def id(cls) -> int:
         return 3
 
+    @classproperty
+    def printerObjects(cls) -> Dict[str, List[str]]:
+        return {**HEATER_OBJECTS, "output_pin caselight": ["value"]}
+
     # Element image id's
     _regular = 32
     _highlight = 33
@@ -445,102 +499,8 @@ class MainPage(OpenP4Page):
         await self.state.display.set("b3.picc", 31)
 
     async def onDisplayEvent(self, type: EventType, data):
-        #log.info(f"MainPage: onDisplayEvent: EventType: {type}, data: {data}")
-
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-
-            # parse_cmd_msg_from_tjc_screen -> tjc_event_clicked_handler -> led_on_off;
-            if data.component_id == 0:
-                self.state.printer.togglePin("caselight")
-
-            # parse_cmd_msg_from_tjc_screen -> tjc_event_clicked_handler -> go_to_network;
-            elif data.component_id == 1:
-                #TODO MainPage: go_to_network
-                #get_wlan0_status();
-                #get_wlan0_ip[abi:cxx11]();
-
-                #page_to(0x3e);
-                self.state.return_page = self.__class__  # Store current page class
-                self.changePage(NetworkPage)
-                #get_mks_ethernet();
-            
-            # parse_cmd_msg_from_tjc_screen -> tjc_event_clicked_handler -> motors_off -> FIRMWARE_RESTART;
-            elif data.component_id == 2:
-                self.state.printer.firmwareRestart()
-                #self.state.printer.emergencyStop()
-
-            # parse_cmd_msg_from_tjc_screen -> tjc_event_clicked_handler -> motors_off -> FIRMWARE_RESTART;
-            elif data.component_id == 3:
-                # cp0 or t3 = click b3,1
-                self.page_files_pages = 0
-                self.page_files_current_pages = 0
-                self.page_files_folder_layers = 0
-
-                retuVal = self.check_conflict()
-                if retuVal == 0:
-                    pass
-
-                #TODO Main page filename
-                """
-                check_timelapse_state();
-                uVar10 = check_conflict();
-                puVar20 = (undefined4 *)(ulong)(uVar10 & 0xff);
-                if ((uVar10 & 0xff) == 0) {
-                    page_files_pages = 0;
-                    page_files_current_pages = 0;
-                    page_files_folder_layers = 0;
-                    std::__cxx11::string::operator=((string *)page_files_previous_path[abi:cxx11],"");
-                    std::__cxx11::string::operator=((string *)page_files_root_path[abi:cxx11],"gcodes/");
-                    std::__cxx11::string::operator=((string *)page_files_path[abi:cxx11],"");
-                    refresh_page_files(page_files_current_pages);
-                    bVar8 = std::operator==((string *)page_files_list_show_type[abi:cxx11],"[c]");
-                    puVar20 = (undefined4 *)(ulong)bVar8;
-                    if (bVar8) {
-                    clear_cp0_image();
-                    get_sub_dir_files_list(0);
-                    puVar20 = (undefined4 *)
-                                std::__cxx11::string::operator=((string *)file_mode[abi:cxx11],"Local");
-                    }
-                }
-                }
-
-                void refresh_page_files(int param_1)
-
-                {
-                string asStack_20 [32];
-                
-                std::operator+((string *)page_files_root_path[abi:cxx11],(string *)page_files_path[abi:cxx11]);
-                                    /* try { // try from 0063a190 to 0063a193 has its CatchHandler @ 0063a1a8 */
-                get_page_files_filelist(asStack_20);
-                std::__cxx11::string::~string(asStack_20);
-                set_page_files_show_list(param_1);
-                return;
-                }
-
-                """
-
-            # parse_cmd_msg_from_tjc_screen -> tjc_event_clicked_handler -> filament_extruder_target -> 
-            elif data.component_id == 4:
-                self.state.heater_manager.set_heater_data("extruder")
-                self.state.return_page = self.__class__ # Store current page class
-                self.changePage(KeypadPage)
-            
-            # parse_cmd_msg_from_tjc_screen -> tjc_event_clicked_handler -> filament_heater_bed_target -> set_heater_bed_target -> set_target(set_target, 60);
-            elif data.component_id == 5:
-                self.state.heater_manager.set_heater_data("bed")
-                self.state.return_page = self.__class__ # Store current page class
-                self.changePage(KeypadPage)
-                
-            # parse_cmd_msg_from_tjc_screen -> tjc_event_clicked_handler -> filament_hot_target -> set_hot_target -> set_target -> M141 Sx;
-            elif data.component_id == 6:
-                self.state.heater_manager.set_heater_data("chamber")
-                self.state.return_page = self.__class__ # Store current page class
-                self.changePage(KeypadPage)
-            else:
-                self.handleNavBarButtons(data.component_id)
-
-        elif type == EventType.NUMERIC_INPUT:
+        await super().onDisplayEvent(type, data)
+        if type == EventType.NUMERIC_INPUT:
             if data.component_id == 0: # Extruder target temperature
                 self._numeric_input = data.value
             elif data.component_id == 1: # Heatbed target temperature
@@ -550,30 +510,131 @@ class MainPage(OpenP4Page):
             else:
                 log.info(f"MainPage: onDisplayEvent: EventType: {type}, data: {data}")
 
-    async def onPrinterStatusUpdate(self, data: dict):
-        #log.info(f"MainPage: onPrinterStatusUpdate: EventType: {type}, data: {data}")
+    # parse_cmd_msg_from_tjc_screen -> tjc_event_clicked_handler -> led_on_off;
+    @touch(0)
+    def onCaselight(self, data):
+        self.state.printer.togglePin("caselight")
+
+    # parse_cmd_msg_from_tjc_screen -> tjc_event_clicked_handler -> go_to_network;
+    @touch(1)
+    def onNetwork(self, data):
+        #TODO MainPage: go_to_network
+        #get_wlan0_status();
+        #get_wlan0_ip[abi:cxx11]();
+
+        #page_to(0x3e);
+        self.state.return_page = self.__class__  # Store current page class
+        self.changePage(NetworkPage)
+        #get_mks_ethernet();
+
+    # parse_cmd_msg_from_tjc_screen -> tjc_event_clicked_handler -> motors_off -> FIRMWARE_RESTART;
+    @touch(2)
+    def onFirmwareRestart(self, data):
+        self.state.printer.firmwareRestart()
+        #self.state.printer.emergencyStop()
+
+    # parse_cmd_msg_from_tjc_screen -> tjc_event_clicked_handler -> motors_off -> FIRMWARE_RESTART;
+    @touch(3)
+    def onPreview(self, data):
+        # cp0 or t3 = click b3,1
+        self.page_files_pages = 0
+        self.page_files_current_pages = 0
+        self.page_files_folder_layers = 0
+
+        retuVal = self.check_conflict()
+        if retuVal == 0:
+            pass
+
+        #TODO Main page filename
+        """
+        check_timelapse_state();
+        uVar10 = check_conflict();
+        puVar20 = (undefined4 *)(ulong)(uVar10 & 0xff);
+        if ((uVar10 & 0xff) == 0) {
+            page_files_pages = 0;
+            page_files_current_pages = 0;
+            page_files_folder_layers = 0;
+            std::__cxx11::string::operator=((string *)page_files_previous_path[abi:cxx11],"");
+            std::__cxx11::string::operator=((string *)page_files_root_path[abi:cxx11],"gcodes/");
+            std::__cxx11::string::operator=((string *)page_files_path[abi:cxx11],"");
+            refresh_page_files(page_files_current_pages);
+            bVar8 = std::operator==((string *)page_files_list_show_type[abi:cxx11],"[c]");
+            puVar20 = (undefined4 *)(ulong)bVar8;
+            if (bVar8) {
+            clear_cp0_image();
+            get_sub_dir_files_list(0);
+            puVar20 = (undefined4 *)
+                        std::__cxx11::string::operator=((string *)file_mode[abi:cxx11],"Local");
+            }
+        }
+        }
+
+        void refresh_page_files(int param_1)
+
+        {
+        string asStack_20 [32];
+
+        std::operator+((string *)page_files_root_path[abi:cxx11],(string *)page_files_path[abi:cxx11]);
+                            /* try { // try from 0063a190 to 0063a193 has its CatchHandler @ 0063a1a8 */
+        get_page_files_filelist(asStack_20);
+        std::__cxx11::string::~string(asStack_20);
+        set_page_files_show_list(param_1);
+        return;
+        }
+
+        """
 
+    # parse_cmd_msg_from_tjc_screen -> tjc_event_clicked_handler -> filament_extruder_target ->
+    @touch(4)
+    def onExtruderTarget(self, data):
+        self.state.heater_manager.set_heater_data("extruder")
+        self.state.return_page = self.__class__ # Store current page class
+        self.changePage(KeypadPage)
+
+    # parse_cmd_msg_from_tjc_screen -> tjc_event_clicked_handler -> filament_heater_bed_target -> set_heater_bed_target -> set_target(set_target, 60);
+    @touch(5)
+    def onBedTarget(self, data):
+        self.state.heater_manager.set_heater_data("bed")
+        self.state.return_page = self.__class__ # Store current page class
+        self.changePage(KeypadPage)
+
+    # parse_cmd_msg_from_tjc_screen -> tjc_event_clicked_handler -> filament_hot_target -> set_hot_target -> set_target -> M141 Sx;
+    @touch(6)
+    def onChamberTarget(self, data):
+        self.state.heater_manager.set_heater_data("chamber")
+        self.state.return_page = self.__class__ # Store current page class
+        self.changePage(KeypadPage)
+
+    @watch("print_stats.state")
+    async def updateState(self, data: dict):
         state = data["print_stats"]["state"]
         if state == "printing":
             self.changePage(PrintingPage)
 
-        # Extruder
+    @watch("extruder")
+    async def updateExtruder(self, data: dict):
         await self.state.display.set("n0.val", int(data["extruder"]["temperature"]))
         await self.setFontColor("b4", self.isTarget(data["extruder"]))
 
-        # Heatbed
+    @watch("heater_bed")
+    async def updateBed(self, data: dict):
         await self.state.display.set("n1.val", int(data["heater_bed"]["temperature"]))
         await self.setFontColor("b5", self.isTarget(data["heater_bed"]))
 
-        # Chamber
+    @watch("heater_generic chamber")
+    async def updateChamber(self, data: dict):
         await self.state.display.set(
             "n2.val", int(data["heater_generic chamber"]["temperature"])
         )
         await self.setFontColor("b6", self.isTarget(data["heater_generic chamber"]))
 
-        # Caselight
+    @watch("output_pin caselight.value")
+    async def updateCaselight(self, data: dict):
         await self.setCaselight("b0", data["output_pin caselight"]["value"] > 0)
 
+    async def onPrinterStatusUpdate(self, data: dict):
+        #log.info(f"MainPage: onPrinterStatusUpdate: EventType: {type}, data: {data}")
+
         # W-LAN
         #await self.setHighlight("b1", data["output_pin caselight"]["value"] > 0)
 
@@ -595,7 +656,7 @@ class MainPage(OpenP4Page):
         """
 
 
-class FileListPage(OpenP4Page):
+class FileListPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -608,23 +669,21 @@ class FileListPage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                self.changePage(PrintingPage)
-            #elif data.component_id == 1: # Load and go to page | 17  | 0x11 | printing
-            #elif data.component_id == 2:
-            #elif data.component_id == 3:
-            #elif data.component_id == 4:
-            #elif data.component_id == 5:
-            #elif data.component_id == 6: # LOCAL
-            #elif data.component_id == 7: # USB
-            #elif data.component_id == 8: # enter
-            #elif data.component_id == 9: # up
-            #elif data.component_id == 10: # down
-            #else:  
-            self.handleNavBarButtons(data.component_id)
+    @touch(0)
+    def onPrinting(self, data):
+        self.changePage(PrintingPage)
+
+    # Not handled yet:
+    # 1: Load and go to page | 17  | 0x11 | printing
+    # 2
+    # 3
+    # 4
+    # 5
+    # 6: LOCAL
+    # 7: USB
+    # 8: enter
+    # 9: up
+    # 10: down
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -635,7 +694,7 @@ class FileListPage(OpenP4Page):
         #t4
         #t5
 
-class PreviewPage(OpenP4Page):
+class PreviewPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -648,26 +707,24 @@ class PreviewPage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            #elif data.component_id == 3:
-                #uVar10 = check_conflict();
-                #if ((uVar10 & 0xff) == 0) {
-                #    on_process = 1;
-                #    puVar20 = (undefined4 *)go_to_syntony_move();
-                #}
-                #self.changePage(SyntonyMovePage)
-            if data.component_id == 4:
-                self.changePage(ToolSelectPage)
-            else:
-                self.handleNavBarButtons(data.component_id)
+    @touch(4)
+    def onToolSelect(self, data):
+        self.changePage(ToolSelectPage)
+
+    # Not handled yet:
+    # 3: go_to_syntony_move()
+    #uVar10 = check_conflict();
+    #if ((uVar10 & 0xff) == 0) {
+    #    on_process = 1;
+    #    puVar20 = (undefined4 *)go_to_syntony_move();
+    #}
+    #self.changePage(SyntonyMovePage)
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class PreviewPop1Page(OpenP4Page):
+class PreviewPop1Page(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -680,16 +737,11 @@ class PreviewPop1Page(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            self.handleNavBarButtons(data.component_id)
-
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class PreviewPop2Page(OpenP4Page):
+class PreviewPop2Page(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -702,17 +754,12 @@ class PreviewPop2Page(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            self.handleNavBarButtons(data.component_id)
-
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
 # Start resonance test
-class SyntonyPage(OpenP4Page):
+class SyntonyPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -725,17 +772,12 @@ class SyntonyPage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            self.handleNavBarButtons(data.component_id)
-
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
 # Input shaping running
-class SyntonyMovePage(OpenP4Page):
+class SyntonyMovePage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -748,16 +790,11 @@ class SyntonyMovePage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            self.handleNavBarButtons(data.component_id)
-
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class BedCalibratePage(OpenP4Page):
+class BedCalibratePage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -770,16 +807,11 @@ class BedCalibratePage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            self.handleNavBarButtons(data.component_id)
-
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class PreCalibratePage(OpenP4Page):
+class PreCalibratePage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -792,16 +824,11 @@ class PreCalibratePage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            self.handleNavBarButtons(data.component_id)
-
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class CalibrateSrcPage(OpenP4Page):
+class CalibrateSrcPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -814,16 +841,11 @@ class CalibrateSrcPage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            self.handleNavBarButtons(data.component_id)
-
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class CalibrateMovePage(OpenP4Page):
+class CalibrateMovePage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -836,16 +858,11 @@ class CalibrateMovePage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            self.handleNavBarButtons(data.component_id)
-
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class AutoLevelPage(OpenP4Page):
+class AutoLevelPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -858,16 +875,11 @@ class AutoLevelPage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            self.handleNavBarButtons(data.component_id)
-
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class AutoMovePage(OpenP4Page):
+class AutoMovePage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -880,16 +892,11 @@ class AutoMovePage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            self.handleNavBarButtons(data.component_id)
-
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class ZOffsetPage(OpenP4Page):
+class ZOffsetPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -902,16 +909,11 @@ class ZOffsetPage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            self.handleNavBarButtons(data.component_id)
-
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class PrintingPage(OpenP4Page):
+class PrintingPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -920,6 +922,14 @@ class PrintingPage(OpenP4Page):
     @classproperty
     def id(cls) -> int:
         return 17
+
+    @classproperty
+    def printerObjects(cls) -> Dict[str, List[str]]:
+        return {
+            **HEATER_OBJECTS,
+            "output_pin caselight": ["value"],
+            "display_status": ["progress"],
+        }
     
     # Element image id's
     _regular = 51
@@ -948,79 +958,79 @@ class PrintingPage(OpenP4Page):
         minutes = int((seconds % 3600) // 60)
         return f"{hours:02d}:{minutes:02d}"
     
-    async def onDisplayEvent(self, type: EventType, data):
-        #log.info(f"PrintingPage: onDisplayEvent: EventType: {type}, data: {data}")
+    @touch(0)
+    def onEmergencyStop(self, data):
+        self.state.printer.emergencyStop()
 
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
+    @touch(1)
+    def onPause(self, data):
+        self.state.printer.pausePrint()
+        #TODO self.changePage(PausePage)
+        #temporary back to home
+        #self.changePage(MainPage)
 
-            if data.component_id == 0:
-                self.state.printer.emergencyStop()
-            elif data.component_id == 1:
-                self.state.printer.pausePrint()
-                #TODO self.changePage(PausePage)
-                #temporary back to home
-                #self.changePage(MainPage)
-            elif data.component_id == 2:
-                log.info(f"PrintingPage: onDisplayEvent: EventType: {type}, data: {data}")
-            elif data.component_id == 3:
-                log.info(f"PrintingPage: onDisplayEvent: EventType: {type}, data: {data}")
-            elif data.component_id == 4:
-                log.info(f"PrintingPage: onDisplayEvent: EventType: {type}, data: {data}")
-            elif data.component_id == 5:
-                self.state.printer.togglePin("caselight")
-            elif data.component_id == 6:
-                self.changePage(ControlPage)
+    @touch(5)
+    def onCaselight(self, data):
+        self.state.printer.togglePin("caselight")
 
-                """
-                elif data.component_id == 11:
-                    pass
-
-                elif data.component_id == 21:  # extruder
-                    self.state.heater_manager.set_heater_data("extruder")
-                    self.state.return_page = self.__class__  # Store current page class
-                    self.changePage(KeypadPage)
-                    
-                elif data.component_id == 22:  # bed
-                    self.state.heater_manager.set_heater_data("bed")
-                    self.state.return_page = self.__class__  # Store current page class
-                    self.changePage(KeypadPage)
-                    
-                elif data.component_id == 23:  # chamber
-                    self.state.heater_manager.set_heater_data("chamber")
-                    self.state.return_page = self.__class__  # Store current page class
-                    self.changePage(KeypadPage)
-
-                elif data.component_id == 2:
-                    self.changePage(PrintingPage2)
-                """
-            else:
-                self.handleNavBarButtons(data.component_id)
+    @touch(6)
+    def onControl(self, data):
+        self.changePage(ControlPage)
 
-    async def onPrinterStatusUpdate(self, data: dict):
-        #log.info(f"PrintingPage: onPrinterStatusUpdate: {data}")
+        """
+        elif data.component_id == 11:
+            pass
 
-        # Extruder
+        elif data.component_id == 21:  # extruder
+            self.state.heater_manager.set_heater_data("extruder")
+            self.state.return_page = self.__class__  # Store current page class
+            self.changePage(KeypadPage)
+
+        elif data.component_id == 22:  # bed
+            self.state.heater_manager.set_heater_data("bed")
+            self.state.return_page = self.__class__  # Store current page class
+            self.changePage(KeypadPage)
+
+        elif data.component_id == 23:  # chamber
+            self.state.heater_manager.set_heater_data("chamber")
+            self.state.return_page = self.__class__  # Store current page class
+            self.changePage(KeypadPage)
+
+        elif data.component_id == 2:
+            self.changePage(PrintingPage2)
+        """
+
+    @touch(2, 3, 4)
+    def onLogTouch(self, data):
+        log.info(f"PrintingPage: onDisplayEvent: EventType: {EventType.TOUCH}, data: {data}")
+
+    @watch("extruder")
+    async def updateExtruder(self, data: dict):
         await self.state.display.set("n0.val", int(data["extruder"]["temperature"]))
         await self.setHighlight("b0", self.isHeating(data["extruder"]))
         extruder_target = int(data["extruder"]["target"])
         await self.state.display.set("t0.txt", f"{extruder_target}")
 
-        # Bed
+    @watch("heater_bed")
+    async def updateBed(self, data: dict):
         await self.state.display.set("n1.val", int(data["heater_bed"]["temperature"]))
         await self.setHighlight("b1", self.isHeating(data["heater_bed"]))
         bed_target = int(data["heater_bed"]["target"])
         await self.state.display.set("t1.txt", f"{bed_target}")
 
-        # Chamber
+    @watch("heater_generic chamber")
+    async def updateChamber(self, data: dict):
         await self.state.display.set("n2.val", int(data["heater_generic chamber"]["temperature"]))
         await self.setHighlight("b7", self.isHeating(data["heater_generic chamber"]))
         chamber_target = int(data["heater_generic chamber"]["target"])
         await self.state.display.set("t5.txt", f"{chamber_target}")
 
-        # Caselight
+    @watch("output_pin caselight.value")
+    async def updateCaselight(self, data: dict):
         await self.setHighlight("b3", data["output_pin caselight"]["value"] < 1)
 
+    @watch("display_status.progress", "print_stats.print_duration")
+    async def updateProgress(self, data: dict):
         # Progress tracking
         progress = data["display_status"]["progress"] * 100
         print_duration = data["print_stats"]["print_duration"]
@@ -1047,7 +1057,7 @@ class PrintingPage(OpenP4Page):
             await self.state.display.set("t3.txt", "--:--")
 
 
-class PrintingKbPage(OpenP4Page):
+class PrintingKbPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -1060,16 +1070,11 @@ class PrintingKbPage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            self.handleNavBarButtons(data.component_id)
-
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class PrintingZOffsetPage(OpenP4Page):
+class PrintingZOffsetPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -1082,16 +1087,11 @@ class PrintingZOffsetPage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            self.handleNavBarButtons(data.component_id)
-
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class PrintingFinishPage(OpenP4Page):
+class PrintingFinishPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -1104,16 +1104,11 @@ class PrintingFinishPage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            self.handleNavBarButtons(data.component_id)
-
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class PrintingFinishPage(OpenP4Page):
+class PrintingFinishPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -1126,11 +1121,6 @@ class PrintingFinishPage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            self.handleNavBarButtons(data.component_id)
-
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
@@ -1139,7 +1129,7 @@ class PrintingFinishPage(OpenP4Page):
 # SETTINGS
 #------------------------------------------------------------------------------
 
-class LanguagePage(OpenP4Page):
+class LanguagePage(SettingsPage):
     @classproperty
     def name(cls) -> str:
         return "language"
@@ -1148,27 +1138,11 @@ class LanguagePage(OpenP4Page):
     def id(cls) -> int:
         return 21
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                self.changePage(LanguagePage)
-            elif data.component_id == 1:
-                self.changePage(NetworkPage)
-            elif data.component_id == 2:
-                self.changePage(ResetPage)
-            elif data.component_id == 4:
-                self.changePage(UpdatePage)
-            elif data.component_id == 5:
-                self.changePage(MorePage)
-            else:  
-                self.handleNavBarButtons(data.component_id)
-
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class Language2Page(OpenP4Page):
+class Language2Page(SettingsPage):
     @classproperty
     def name(cls) -> str:
         return "language_2"
@@ -1177,27 +1151,11 @@ class Language2Page(OpenP4Page):
     def id(cls) -> int:
         return 69
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                self.changePage(LanguagePage)
-            elif data.component_id == 1:
-                self.changePage(NetworkPage)
-            elif data.component_id == 2:
-                self.changePage(ResetPage)
-            elif data.component_id == 4:
-                self.changePage(UpdatePage)
-            elif data.component_id == 5:
-                self.changePage(MorePage)
-            else:  
-                self.handleNavBarButtons(data.component_id)
-
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class WiFiPage(OpenP4Page):
+class WiFiPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -1210,16 +1168,11 @@ class WiFiPage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            self.handleNavBarButtons(data.component_id)
-
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class WiFiKbPage(OpenP4Page):
+class WiFiKbPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -1232,16 +1185,11 @@ class WiFiKbPage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            self.handleNavBarButtons(data.component_id)
-
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class WiFiConnectPage(OpenP4Page):
+class WiFiConnectPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -1254,16 +1202,11 @@ class WiFiConnectPage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            self.handleNavBarButtons(data.component_id)
-
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class WiFiSavingPage(OpenP4Page):
+class WiFiSavingPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -1276,16 +1219,11 @@ class WiFiSavingPage(OpenP4Page):
     async def init(self):
         pass
     
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            self.handleNavBarButtons(data.component_id)
-
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class WiFiSuccessPage(OpenP4Page):
+class WiFiSuccessPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -1298,16 +1236,11 @@ class WiFiSuccessPage(OpenP4Page):
     async def init(self):
         pass
     
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            self.handleNavBarButtons(data.component_id)
-
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class WiFiFailPage(OpenP4Page):
+class WiFiFailPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -1320,16 +1253,11 @@ class WiFiFailPage(OpenP4Page):
     async def init(self):
         pass
     
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            self.handleNavBarButtons(data.component_id)
-
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class ShowGrPage(OpenP4Page):
+class ShowGrPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -1342,16 +1270,11 @@ class ShowGrPage(OpenP4Page):
     async def init(self):
         pass
     
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            self.handleNavBarButtons(data.component_id)
-
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class SystemOkPage(OpenP4Page):
+class SystemOkPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -1364,16 +1287,11 @@ class SystemOkPage(OpenP4Page):
     async def init(self):
         pass
     
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            self.handleNavBarButtons(data.component_id)
-
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class ResetPage(OpenP4Page):
+class ResetPage(SettingsPage):
     @classproperty
     def name(cls) -> str:
         return "reset"
@@ -1382,27 +1300,17 @@ class ResetPage(OpenP4Page):
     def id(cls) -> int:
         return 30
     
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                self.changePage(LanguagePage)
-            elif data.component_id == 1:
-                self.changePage(NetworkPage)
-            elif data.component_id == 2:
-                self.changePage(ResetPage)
-            elif data.component_id == 4:
-                self.changePage(UpdatePage)
-            elif data.component_id == 5:
-                self.changePage(MorePage)
-            elif data.component_id == 6:
-                self.changePage(ExportLogPage)
-            elif data.component_id == 7: # restart klipper
-                self.state.printer.restart()
-            elif data.component_id == 8: # restart firmware
-                self.state.printer.firmwareRestart()
-            else:  
-                self.handleNavBarButtons(data.component_id)
+    @touch(6)
+    def onExportLog(self, data):
+        self.changePage(ExportLogPage)
+
+    @touch(7) # restart klipper
+    def onRestart(self, data):
+        self.state.printer.restart()
+
+    @touch(8) # restart firmware
+    def onFirmwareRestart(self, data):
+        self.state.printer.firmwareRestart()
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -1410,7 +1318,7 @@ class ResetPage(OpenP4Page):
         #await self.state.display.set("t6.txt", )
 
 
-class SleepModePage(OpenP4Page):
+class SleepModePage(SettingsPage):
 
     @classproperty
     def name(cls) -> str:
@@ -1423,35 +1331,27 @@ class SleepModePage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                self.changePage(LanguagePage)
-            elif data.component_id == 1:
-                self.changePage(NetworkPage)
-            elif data.component_id == 2:
-                self.changePage(ResetPage)
-            elif data.component_id == 4:
-                self.changePage(UpdatePage)
-            elif data.component_id == 5:
-                self.changePage(MorePage)
-            elif data.component_id == 6: # 5 minutes
-                pass
-            elif data.component_id == 7: # 15 minutes
-                pass
-            elif data.component_id == 8: # 30 minutes
-                pass
-            elif data.component_id == 9: # never
-                pass
-            else:  
-                self.handleNavBarButtons(data.component_id)
+    @touch(6) # 5 minutes
+    def onSleep5Minutes(self, data):
+        pass
+
+    @touch(7) # 15 minutes
+    def onSleep15Minutes(self, data):
+        pass
+
+    @touch(8) # 30 minutes
+    def onSleep30Minutes(self, data):
+        pass
+
+    @touch(9) # never
+    def onSleepNever(self, data):
+        pass
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class UpdatePage(OpenP4Page):
+class UpdatePage(SettingsPage):
 
     @classproperty
     def name(cls) -> str:
@@ -1464,23 +1364,9 @@ class UpdatePage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                self.changePage(LanguagePage)
-            elif data.component_id == 1:
-                self.changePage(NetworkPage)
-            elif data.component_id == 2:
-                self.changePage(ResetPage)
-            elif data.component_id == 4:
-                self.changePage(UpdatePage)
-            elif data.component_id == 5:
-                self.changePage(MorePage)
-            #elif data.component_id == 6: # offline update
-            #elif data.component_id == 7: # online update
-            else:  
-                self.handleNavBarButtons(data.component_id)
+    # Not handled yet:
+    # 6: offline update
+    # 7: online update
 
     async def onPrinterStatusUpdate(self, data: dict):
 
@@ -1488,7 +1374,7 @@ class UpdatePage(OpenP4Page):
         await self.state.display.set("t6.txt", "V" + HMI_VERSION_MAJOR + "." + HMI_VERSION_MINOR + "." + HMI_VERSION_PATCH)
 
 
-class MorePage(OpenP4Page):
+class MorePage(SettingsPage):
 
     @classproperty
     def name(cls) -> str:
@@ -1501,44 +1387,44 @@ class MorePage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                self.changePage(LanguagePage)
-            elif data.component_id == 1:
-                self.changePage(NetworkPage)
-            elif data.component_id == 2:
-                self.changePage(ResetPage)
-            elif data.component_id == 4:
-                self.changePage(UpdatePage)
-            elif data.component_id == 5:
-                #if (current_page_id == 0x21) {
-                #    puVar20 = (undefined4 *)set_mks_oobe_enabled(true);
-                #}
-                #else {
-                #    puVar20 = (undefined4 *)page_to(0x21);
-                #}
-                self.changePage(MorePage)
-            elif data.component_id == 3: # Screen Timeout
-                self.changePage(SleepModePage)
-            elif data.component_id == 6: # After-sales Support
-                self.changePage(ServicePage)
-            elif data.component_id == 7: # Sound
-                pass
-                #SET_PIN PIN=beeper VALUE=1
-                #SET_PIN PIN=beeper VALUE=0
-                #void beep_on_off(void)
-                #if (printer_out_pin_beep_value == 0.0) {
-                #    "beep_on"
-                #else
-                #    "beep_off"
-
-    async def onPrinterStatusUpdate(self, data: dict):
-        pass
-
-
-class ServicePage(OpenP4Page):
+    @touch(5)
+    def onTabMore(self, data):
+        #if (current_page_id == 0x21) {
+        #    puVar20 = (undefined4 *)set_mks_oobe_enabled(true);
+        #}
+        #else {
+        #    puVar20 = (undefined4 *)page_to(0x21);
+        #}
+        self.changePage(MorePage)
+
+    @touch(33, 34, 35, 36, 37) # no NavBar on this page
+    def onNavBar(self, data):
+        pass
+
+    @touch(3) # Screen Timeout
+    def onScreenTimeout(self, data):
+        self.changePage(SleepModePage)
+
+    @touch(6) # After-sales Support
+    def onService(self, data):
+        self.changePage(ServicePage)
+
+    @touch(7) # Sound
+    def onSound(self, data):
+        pass
+        #SET_PIN PIN=beeper VALUE=1
+        #SET_PIN PIN=beeper VALUE=0
+        #void beep_on_off(void)
+        #if (printer_out_pin_beep_value == 0.0) {
+        #    "beep_on"
+        #else
+        #    "beep_off"
+
+    async def onPrinterStatusUpdate(self, data: dict):
+        pass
+
+
+class ServicePage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -1551,16 +1437,11 @@ class ServicePage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            self.handleNavBarButtons(data.component_id)
-
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class ControlPage(OpenP4Page):
+class ControlPage(NavBarPage):
     @classproperty
     def name(cls) -> str:
         return "control"
@@ -1568,107 +1449,18 @@ class ControlPage(OpenP4Page):
     @classproperty
     def id(cls) -> int:
         return 35
+
+    @classproperty
+    def printerObjects(cls) -> Dict[str, List[str]]:
+        return HEATER_OBJECTS
     
     # Initialize display components
     async def init(self):
         self.input_value = ""
 
     async def onDisplayEvent(self, type: EventType, data):
-        #log.info(f"ControlPage: onPrinterStatusUpdate: {data}")
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0: # filament_extruder_target();
-                pass
-            elif data.component_id == 1: # filament_heater_bed_target();
-                pass
-            elif data.component_id == 2: # filament_hot_target();
-                pass
-            elif data.component_id < 6: # page_to(0x24);
-                self.changePage(ControlKbPage)
-            elif data.component_id == 6: # Button 1mm
-                self._printer_move_dist = 1.0
-                self._printer_filament_extruedr_dist = 1.0
-            elif data.component_id == 7: # Button 10mm
-                self._printer_move_dist = 10.0
-                self._printer_filament_extruedr_dist = 10.0
-            elif data.component_id == 8: # Button 50mm
-                self._printer_move_dist = 50.0
-                self._printer_filament_extruedr_dist = 50.0
-            elif data.component_id == 9: # Button 100mm
-                self._printer_move_dist = 100.0
-                self._printer_filament_extruedr_dist = 100.0
-            elif data.component_id == 10: # Button home
-                #self.check_conflict()
-                #uVar10 = check_conflict();
-                #puVar20 = (undefined4 *)(ulong)(uVar10 & 0xff);
-                #if ((uVar10 & 0xff) == 0) {
-                #G28 - Auto Home
-                self.state.printer.runGcode(f"G28") 
-                pass
-            elif data.component_id == 11: # Button motors off
-                #self.check_conflict()
-                # M84 - Disable steppers
-                self.state.printer.runGcode(f"M84")
-            elif data.component_id == 13: # Button box
-                #MultiColorSlots::SetSelectedSlotIndex((MultiColorSlots *)slot,-1);
-                #MultiColorSlots::SetSelectedBoxIndex((MultiColorSlots *)slot,0);
-                #puVar20 = (undefined4 *)MultiColorSlots::SlotParamsSetConfirm((MultiColorSlots *)slot);
-                #TODO Box count
-                box_count = 0
-                if box_count == 0:
-                    self.changePage(ZeroBoxPage) 
-                else:
-                    self.changePage(OneBoxPage)
-            elif data.component_id == 14: # Button y increase
-                #self.check_conflict(
-                self._unhomed_move_mode = 3
-                self.state.printer.runGcode(f"Y{str(self._printer_move_dist)}")
-                #FORCE_MOVE STEPPER=stepper_x DISTANCE=1 VELOCITY=130 ACCEL=20000
-            elif data.component_id == 15: # Button y decrease
-                #self.check_conflict()
-                self._unhomed_move_mode = 4
-                self.state.printer.runGcode(f"Y-{str(self._printer_move_dist)}")
-            elif data.component_id == 16: # Button x decrease
-                #self.check_conflict()
-                self._unhomed_move_mode = 2
-                self.state.printer.runGcode(f"X-{str(self._printer_move_dist)}")
-            elif data.component_id == 17: # Button x increase
-                #self.check_conflict()
-                self._unhomed_move_mode = 1
-                self.state.printer.runGcode(f"X{str(self._printer_move_dist)}")
-            elif data.component_id == 18: # Button z decrease
-                #self.check_conflict()
-                self._unhomed_move_mode = 5
-                self.state.printer.runGcode(f"Z-{str(self._printer_move_dist)}")
-            elif data.component_id == 19: # Button z increase
-                #self.check_conflict()
-                self._unhomed_move_mode = 6
-                self.state.printer.runGcode(f"Z{str(self._printer_move_dist)}")
-            elif data.component_id == 20: # Button filament retract
-                state = data["print_stats"]["state"]
-                if state == "printing":
-                    if self._page_filament_extrude_button == 0:
-                        self._printer_idle_timeout_state = "Printing"
-                        self._page_filament_extrude_button = 1
-                        await self.state.display.set("vis gm1,1")
-                        self.start_retract()
-                else:
-                    self.changePage(BtnConflictPage)
-            elif data.component_id == 21: # Button filament extrude
-                state = data["print_stats"]["state"]
-                if state == "printing":
-                    if self._page_filament_extrude_button == 0:
-                        self._printer_idle_timeout_state = "Printing"
-                        self._page_filament_extrude_button = 1
-                        await self.state.display.set("vis gm0,1")
-                        self.start_extrude()
-                else:
-                    self.changePage(BtnConflictPage)
-            elif data.component_id == 22: # Fan control
-                self.changePage(ControlSetFanPage)
-            else:
-                self.handleNavBarButtons(data.component_id)
-        elif type == EventType.NUMERIC_INPUT:
+        await super().onDisplayEvent(type, data)
+        if type == EventType.NUMERIC_INPUT:
             if data.component_id == 0: # Extruder target temperature
                 if MAX_EXTRUDER_TEMP < data.value:
                     self._numeric_input = MAX_EXTRUDER_TEMP
@@ -1690,6 +1482,128 @@ class ControlPage(OpenP4Page):
             else:
                 log.info(f"ControlKbPage: onDisplayEvent: EventType: {type}, data: {data}")
 
+    @touch(3, 4, 5) # page_to(0x24);
+    def onTargetInput(self, data):
+        self.changePage(ControlKbPage)
+
+    @touch(6) # Button 1mm
+    def onDistance1mm(self, data):
+        self._printer_move_dist = 1.0
+        self._printer_filament_extruedr_dist = 1.0
+
+    @touch(7) # Button 10mm
+    def onDistance10mm(self, data):
+        self._printer_move_dist = 10.0
+        self._printer_filament_extruedr_dist = 10.0
+
+    @touch(8) # Button 50mm
+    def onDistance50mm(self, data):
+        self._printer_move_dist = 50.0
+        self._printer_filament_extruedr_dist = 50.0
+
+    @touch(9) # Button 100mm
+    def onDistance100mm(self, data):
+        self._printer_move_dist = 100.0
+        self._printer_filament_extruedr_dist = 100.0
+
+    @touch(10) # Button home
+    def onHome(self, data):
+        #self.check_conflict()
+        #uVar10 = check_conflict();
+        #puVar20 = (undefined4 *)(ulong)(uVar10 & 0xff);
+        #if ((uVar10 & 0xff) == 0) {
+        #G28 - Auto Home
+        self.state.printer.runGcode(f"G28") 
+        pass
+
+    @touch(11) # Button motors off
+    def onMotorsOff(self, data):
+        #self.check_conflict()
+        # M84 - Disable steppers
+        self.state.printer.runGcode(f"M84")
+
+    @touch(13) # Button box
+    def onBox(self, data):
+        #MultiColorSlots::SetSelectedSlotIndex((MultiColorSlots *)slot,-1);
+        #MultiColorSlots::SetSelectedBoxIndex((MultiColorSlots *)slot,0);
+        #puVar20 = (undefined4 *)MultiColorSlots::SlotParamsSetConfirm((MultiColorSlots *)slot);
+        #TODO Box count
+        box_count = 0
+        if box_count == 0:
+            self.changePage(ZeroBoxPage) 
+        else:
+            self.changePage(OneBoxPage)
+
+    @touch(14) # Button y increase
+    def onYIncrease(self, data):
+        #self.check_conflict(
+        self._unhomed_move_mode = 3
+        self.state.printer.runGcode(f"Y{str(self._printer_move_dist)}")
+        #FORCE_MOVE STEPPER=stepper_x DISTANCE=1 VELOCITY=130 ACCEL=20000
+
+    @touch(15) # Button y decrease
+    def onYDecrease(self, data):
+        #self.check_conflict()
+        self._unhomed_move_mode = 4
+        self.state.printer.runGcode(f"Y-{str(self._printer_move_dist)}")
+
+    @touch(16) # Button x decrease
+    def onXDecrease(self, data):
+        #self.check_conflict()
+        self._unhomed_move_mode = 2
+        self.state.printer.runGcode(f"X-{str(self._printer_move_dist)}")
+
+    @touch(17) # Button x increase
+    def onXIncrease(self, data):
+        #self.check_conflict()
+        self._unhomed_move_mode = 1
+        self.state.printer.runGcode(f"X{str(self._printer_move_dist)}")
+
+    @touch(18) # Button z decrease
+    def onZDecrease(self, data):
+        #self.check_conflict()
+        self._unhomed_move_mode = 5
+        self.state.printer.runGcode(f"Z-{str(self._printer_move_dist)}")
+
+    @touch(19) # Button z increase
+    def onZIncrease(self, data):
+        #self.check_conflict()
+        self._unhomed_move_mode = 6
+        self.state.printer.runGcode(f"Z{str(self._printer_move_dist)}")
+
+    @touch(20) # Button filament retract
+    async def onRetract(self, data):
+        state = data["print_stats"]["state"]
+        if state == "printing":
+            if self._page_filament_extrude_button == 0:
+                self._printer_idle_timeout_state = "Printing"
+                self._page_filament_extrude_button = 1
+                await self.state.display.set("vis gm1,1")
+                self.start_retract()
+        else:
+            self.changePage(BtnConflictPage)
+
+    @touch(21) # Button filament extrude
+    async def onExtrude(self, data):
+        state = data["print_stats"]["state"]
+        if state == "printing":
+            if self._page_filament_extrude_button == 0:
+                self._printer_idle_timeout_state = "Printing"
+                self._page_filament_extrude_button = 1
+                await self.state.display.set("vis gm0,1")
+                self.start_extrude()
+        else:
+            self.changePage(BtnConflictPage)
+
+    @touch(22) # Fan control
+    def onFans(self, data):
+        self.changePage(ControlSetFanPage)
+
+    # Not handled yet:
+    # 0: filament_extruder_target();
+    # 1: filament_heater_bed_target();
+    # 2: filament_hot_target();
+
     async def onPrinterStatusUpdate(self, data: dict):
         #log.info(f"ControlPage: onPrinterStatusUpdate: {data}")
 
@@ -1738,7 +1652,8 @@ class ControlPage(OpenP4Page):
         #self.state.printer.runGcode(f"M83\nG1 E{str(self._printer_filament_extruedr_dist)} F300\n")
         pass
 
-class ControlKbPage(OpenP4Page):
+class ControlKbPage(ControlPage):
+    # ControlPage with the temperature keyboard shown, the buttons behave the same
     @classproperty
     def name(cls) -> str:
         return "control_kb"
@@ -1746,143 +1661,16 @@ class ControlKbPage(OpenP4Page):
     @classproperty
     def id(cls) -> int:
         return 36
-    
-    # Initialize display components
-    async def init(self):
-        self.input_value = ""
-
-    async def onDisplayEvent(self, type: EventType, data):
-        #log.info(f"ControlKbPage: onDisplayEvent: EventType: {type}, data: {data}")
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0: # filament_extruder_target();
-                pass
-            elif data.component_id == 1: # filament_heater_bed_target();
-                pass
-            elif data.component_id == 2: # filament_hot_target();
-                pass
-            elif data.component_id < 6: # page_to(0x24);
-                self.changePage(ControlKbPage)
-            elif data.component_id == 6: # Button 1mm
-                self._printer_move_dist = 1.0
-                self._printer_filament_extruedr_dist = 1.0
-            elif data.component_id == 7: # Button 10mm
-                self._printer_move_dist = 10.0
-                self._printer_filament_extruedr_dist = 10.0
-            elif data.component_id == 8: # Button 50mm
-                self._printer_move_dist = 50.0
-                self._printer_filament_extruedr_dist = 50.0
-            elif data.component_id == 9: # Button 100mm
-                self._printer_move_dist = 100.0
-                self._printer_filament_extruedr_dist = 100.0
-            elif data.component_id == 10: # Button home
-                #self.check_conflict()
-                #uVar10 = check_conflict();
-                #puVar20 = (undefined4 *)(ulong)(uVar10 & 0xff);
-                #if ((uVar10 & 0xff) == 0) {
-                #G28 - Auto Home
-                self.state.printer.runGcode(f"G28") 
-                pass
-            elif data.component_id == 11: # Button motors off
-                #self.check_conflict()
-                # M84 - Disable steppers
-                self.state.printer.runGcode(f"M84")
-            elif data.component_id == 13: # Button box
-                #MultiColorSlots::SetSelectedSlotIndex((MultiColorSlots *)slot,-1);
-                #MultiColorSlots::SetSelectedBoxIndex((MultiColorSlots *)slot,0);
-                #puVar20 = (undefined4 *)MultiColorSlots::SlotParamsSetConfirm((MultiColorSlots *)slot);
-                pass
-            elif data.component_id == 14: # Button y increase
-                #self.check_conflict(
-                self._unhomed_move_mode = 3
-                self.state.printer.runGcode(f"Y{str(self._printer_move_dist)}")
-                #FORCE_MOVE STEPPER=stepper_x DISTANCE=1 VELOCITY=130 ACCEL=20000
-            elif data.component_id == 15: # Button y decrease
-                #self.check_conflict()
-                self._unhomed_move_mode = 4
-                self.state.printer.runGcode(f"Y-{str(self._printer_move_dist)}")
-            elif data.component_id == 16: # Button x decrease
-                #self.check_conflict()
-                self._unhomed_move_mode = 2
-                self.state.printer.runGcode(f"X-{str(self._printer_move_dist)}")
-            elif data.component_id == 17: # Button x increase
-                #self.check_conflict()
-                self._unhomed_move_mode = 1
-                self.state.printer.runGcode(f"X{str(self._printer_move_dist)}")
-            elif data.component_id == 18: # Button z decrease
-                #self.check_conflict()
-                self._unhomed_move_mode = 5
-                self.state.printer.runGcode(f"Z-{str(self._printer_move_dist)}")
-            elif data.component_id == 19: # Button z increase
-                #self.check_conflict()
-                self._unhomed_move_mode = 6
-                self.state.printer.runGcode(f"Z{str(self._printer_move_dist)}")
-            elif data.component_id == 20: # Button filament retract
-                state = data["print_stats"]["state"]
-                if state == "printing":
-                    if self._page_filament_extrude_button == 0:
-                        self._printer_idle_timeout_state = "Printing"
-                        self._page_filament_extrude_button = 1
-                        await self.state.display.set("vis gm1,1")
-                        self.start_retract()
-                else:
-                    self.changePage(BtnConflictPage)
-            elif data.component_id == 21: # Button filament extrude
-                state = data["print_stats"]["state"]
-                if state == "printing":
-                    if self._page_filament_extrude_button == 0:
-                        self._printer_idle_timeout_state = "Printing"
-                        self._page_filament_extrude_button = 1
-                        await self.state.display.set("vis gm0,1")
-                        self.start_extrude()
-                else:
-                    self.changePage(BtnConflictPage)
-            elif data.component_id == 22: # Fan control
-                self.changePage(ControlSetFanPage)
-            else:
-                self.handleNavBarButtons(data.component_id)
-        elif type == EventType.NUMERIC_INPUT:
-            if data.component_id == 0: # Extruder target temperature
-                if MAX_EXTRUDER_TEMP < data.value:
-                    self._numeric_input = MAX_EXTRUDER_TEMP
-                else:
-                    self._numeric_input = data.value
-                self.state.printer.runGcode(f"SET_HEATER_TEMPERATURE HEATER=extruder TARGET={str(self._numeric_input)}")
-            elif data.component_id == 1: # Heatbed target temperature
-                if MAX_HEATER_BED_TEMP < data.value:
-                    self._numeric_input = MAX_HEATER_BED_TEMP
-                else:
-                    self._numeric_input = data.value
-                self.state.printer.runGcode(f"SET_HEATER_TEMPERATURE HEATER=heater_bed TARGET={str(self._numeric_input)}")
-            elif data.component_id == 2: # Chamber target temperature
-                if MAX_CHAMBER_TEMP < data.value:
-                    self._numeric_input = MAX_CHAMBER_TEMP
-                else:
-                    self._numeric_input = data.value
-                self.state.printer.runGcode(f"SET_HEATER_TEMPERATURE HEATER=chamber TARGET={str(self._numeric_input)}")
-            else:
-                log.info(f"ControlKbPage: onDisplayEvent: EventType: {type}, data: {data}")
-
-    async def onPrinterStatusUpdate(self, data: dict):
-        #log.info(f"ControlKbPage: onPrinterStatusUpdate: {data}")
-
-        state = data["print_stats"]["state"]
-        if state == "printing":
-            self.changePage(PrintingPage)
 
-        # Extruder actual value
-        await self.state.display.set("n0.val", int(data["extruder"]["temperature"]))
-
-        # Heatbed actual value
-        await self.state.display.set("n1.val", int(data["heater_bed"]["temperature"]))
-
-        # Chamber actual value
-        await self.state.display.set(
-            "n2.val", int(data["heater_generic chamber"]["temperature"])
-        )
+    @touch(13) # Button box
+    def onBox(self, data):
+        #MultiColorSlots::SetSelectedSlotIndex((MultiColorSlots *)slot,-1);
+        #MultiColorSlots::SetSelectedBoxIndex((MultiColorSlots *)slot,0);
+        #puVar20 = (undefined4 *)MultiColorSlots::SlotParamsSetConfirm((MultiColorSlots *)slot);
+        pass
 
 
-class PreLoadPage(OpenP4Page):
+class PreLoadPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -1892,32 +1680,40 @@ class PreLoadPage(OpenP4Page):
     def id(cls) -> int:
         return 37
 
+    @classproperty
+    def printerObjects(cls) -> Dict[str, List[str]]:
+        return HEATER_OBJECTS
+
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0: # filament_extruder_target();
-                log.info(f"PreLoadPage: Button Extruder")
-            elif data.component_id == 1: # filament_heater_bed_target();
-                log.info(f"PreLoadPage: Button Bed")
-            elif data.component_id == 2: # filament_hot_target();
-                log.info(f"PreLoadPage: Button Camber")
-            elif data.component_id == 3: # page_to(0x25);
-                self.changePage(PreLoadPage)
-            elif data.component_id == 4: # page_to(0x25);
-                self.changePage(PreLoadPage)
-            elif data.component_id == 5: # page_to(0x25);
-                self.changePage(PreLoadPage)
-            elif data.component_id == 9:
-                log.info(f"PreLoadPage: Button Next")
-            elif data.component_id == 10: # finish_unload(); -> page_to(0x71);
-                log.info(f"PreLoadPage: Button Back")
-            elif data.component_id == 22:
-                log.info(f"PreLoadPage: Button FanBack")
-            else:
-                self.handleNavBarButtons(data.component_id)
+    @touch(0) # filament_extruder_target();
+    def onExtruder(self, data):
+        log.info(f"PreLoadPage: Button Extruder")
+
+    @touch(1) # filament_heater_bed_target();
+    def onBed(self, data):
+        log.info(f"PreLoadPage: Button Bed")
+
+    @touch(2) # filament_hot_target();
+    def onChamber(self, data):
+        log.info(f"PreLoadPage: Button Camber")
+
+    @touch(3, 4, 5) # page_to(0x25);
+    def onTargetInput(self, data):
+        self.changePage(PreLoadPage)
+
+    @touch(9)
+    def onNext(self, data):
+        log.info(f"PreLoadPage: Button Next")
+
+    @touch(10) # finish_unload(); -> page_to(0x71);
+    def onBack(self, data):
+        log.info(f"PreLoadPage: Button Back")
+
+    @touch(22)
+    def onFanBack(self, data):
+        log.info(f"PreLoadPage: Button FanBack")
 
     async def onPrinterStatusUpdate(self, data: dict):
 
@@ -1937,7 +1733,7 @@ class PreLoadPage(OpenP4Page):
         )
 
 
-class PreUnloadPage(OpenP4Page):
+class PreUnloadPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -1947,32 +1743,40 @@ class PreUnloadPage(OpenP4Page):
     def id(cls) -> int:
         return 38
 
+    @classproperty
+    def printerObjects(cls) -> Dict[str, List[str]]:
+        return HEATER_OBJECTS
+
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0: # filament_extruder_target();
-                log.info(f"PreLoadPage: Button Extruder")
-            elif data.component_id == 1: # filament_heater_bed_target();
-                log.info(f"PreLoadPage: Button Bed")
-            elif data.component_id == 2: # filament_hot_target();
-                log.info(f"PreLoadPage: Button Camber")
-            elif data.component_id == 3: # page_to(0x24);
-                self.changePage(ControlKbPage)
-            elif data.component_id == 4: # page_to(0x24);
-                self.changePage(ControlKbPage)
-            elif data.component_id == 5: # page_to(0x24);
-                self.changePage(ControlKbPage)
-            elif data.component_id == 9:
-                log.info(f"PreLoadPage: Button Next")
-            elif data.component_id == 10: # finish_unload(); -> page_to(0x71);
-                log.info(f"PreLoadPage: Button Back")
-            elif data.component_id == 22:
-                log.info(f"PreLoadPage: Button FanBack")
-            else:
-                self.handleNavBarButtons(data.component_id)
+    @touch(0) # filament_extruder_target();
+    def onExtruder(self, data):
+        log.info(f"PreLoadPage: Button Extruder")
+
+    @touch(1) # filament_heater_bed_target();
+    def onBed(self, data):
+        log.info(f"PreLoadPage: Button Bed")
+
+    @touch(2) # filament_hot_target();
+    def onChamber(self, data):
+        log.info(f"PreLoadPage: Button Camber")
+
+    @touch(3, 4, 5) # page_to(0x24);
+    def onTargetInput(self, data):
+        self.changePage(ControlKbPage)
+
+    @touch(9)
+    def onNext(self, data):
+        log.info(f"PreLoadPage: Button Next")
+
+    @touch(10) # finish_unload(); -> page_to(0x71);
+    def onBack(self, data):
+        log.info(f"PreLoadPage: Button Back")
+
+    @touch(22)
+    def onFanBack(self, data):
+        log.info(f"PreLoadPage: Button FanBack")
 
     async def onPrinterStatusUpdate(self, data: dict):
 
@@ -1992,7 +1796,7 @@ class PreUnloadPage(OpenP4Page):
         )
 
 
-class PreHeatPage(OpenP4Page):
+class PreHeatPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -2002,38 +1806,52 @@ class PreHeatPage(OpenP4Page):
     def id(cls) -> int:
         return 39
 
+    @classproperty
+    def printerObjects(cls) -> Dict[str, List[str]]:
+        return HEATER_OBJECTS
+
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0: # filament_extruder_target();
-                log.info(f"PreHeatPage: Button Extruder")
-            elif data.component_id == 1: # filament_heater_bed_target();
-                log.info(f"PreHeatPage: Button Bed")
-            elif data.component_id == 2: # filament_hot_target();
-                log.info(f"PreHeatPage: Button Camber")
-            elif data.component_id == 3: # page_to(0x24);
-                self.changePage(ControlKbPage)
-            elif data.component_id == 4: # page_to(0x24);
-                self.changePage(ControlKbPage)
-            elif data.component_id == 5: # page_to(0x24);
-                self.changePage(ControlKbPage)
-            elif data.component_id == 6:
-                log.info(f"PreHeatPage: Button 220°C")
-            elif data.component_id == 7:
-                log.info(f"PreHeatPage: Button 250°C")
-            elif data.component_id == 8:
-                log.info(f"PreHeatPage: Button 300°C")
-            elif data.component_id == 9:
-                log.info(f"PreHeatPage: Button Next")
-            elif data.component_id == 10: # finish_unload(); -> page_to(0x71);
-                log.info(f"PreHeatPage: Button Back")
-            elif data.component_id == 22:
-                log.info(f"PreHeatPage: Button FanBack")
-            else:
-                self.handleNavBarButtons(data.component_id)
+    @touch(0) # filament_extruder_target();
+    def onExtruder(self, data):
+        log.info(f"PreHeatPage: Button Extruder")
+
+    @touch(1) # filament_heater_bed_target();
+    def onBed(self, data):
+        log.info(f"PreHeatPage: Button Bed")
+
+    @touch(2) # filament_hot_target();
+    def onChamber(self, data):
+        log.info(f"PreHeatPage: Button Camber")
+
+    @touch(3, 4, 5) # page_to(0x24);
+    def onTargetInput(self, data):
+        self.changePage(ControlKbPage)
+
+    @touch(6)
+    def onPreset220(self, data):
+        log.info(f"PreHeatPage: Button 220°C")
+
+    @touch(7)
+    def onPreset250(self, data):
+        log.info(f"PreHeatPage: Button 250°C")
+
+    @touch(8)
+    def onPreset300(self, data):
+        log.info(f"PreHeatPage: Button 300°C")
+
+    @touch(9)
+    def onNext(self, data):
+        log.info(f"PreHeatPage: Button Next")
+
+    @touch(10) # finish_unload(); -> page_to(0x71);
+    def onBack(self, data):
+        log.info(f"PreHeatPage: Button Back")
+
+    @touch(22)
+    def onFanBack(self, data):
+        log.info(f"PreHeatPage: Button FanBack")
 
     async def onPrinterStatusUpdate(self, data: dict):
 
@@ -2053,7 +1871,7 @@ class PreHeatPage(OpenP4Page):
         )
 
 
-class UnloadPage(OpenP4Page):
+class UnloadPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -2063,32 +1881,40 @@ class UnloadPage(OpenP4Page):
     def id(cls) -> int:
         return 40
 
+    @classproperty
+    def printerObjects(cls) -> Dict[str, List[str]]:
+        return HEATER_OBJECTS
+
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0: # filament_extruder_target();
-                log.info(f"UnloadPage: Button Extruder")
-            elif data.component_id == 1: # filament_heater_bed_target();
-                log.info(f"UnloadPage: Button Bed")
-            elif data.component_id == 2: # filament_hot_target();
-                log.info(f"UnloadPage: Button Camber")
-            elif data.component_id == 3: # page_to(0x24);
-                self.changePage(ControlKbPage)
-            elif data.component_id == 4: # page_to(0x24);
-                self.changePage(ControlKbPage)
-            elif data.component_id == 5: # page_to(0x24);
-                self.changePage(ControlKbPage)
-            elif data.component_id == 9:
-                log.info(f"UnloadPage: Button Next")
-            elif data.component_id == 10: # finish_unload(); -> page_to(0x71);
-                log.info(f"UnloadPage: Button Back")
-            elif data.component_id == 22:
-                log.info(f"UnloadPage: Button FanBack")
-            else:
-                self.handleNavBarButtons(data.component_id)
+    @touch(0) # filament_extruder_target();
+    def onExtruder(self, data):
+        log.info(f"UnloadPage: Button Extruder")
+
+    @touch(1) # filament_heater_bed_target();
+    def onBed(self, data):
+        log.info(f"UnloadPage: Button Bed")
+
+    @touch(2) # filament_hot_target();
+    def onChamber(self, data):
+        log.info(f"UnloadPage: Button Camber")
+
+    @touch(3, 4, 5) # page_to(0x24);
+    def onTargetInput(self, data):
+        self.changePage(ControlKbPage)
+
+    @touch(9)
+    def onNext(self, data):
+        log.info(f"UnloadPage: Button Next")
+
+    @touch(10) # finish_unload(); -> page_to(0x71);
+    def onBack(self, data):
+        log.info(f"UnloadPage: Button Back")
+
+    @touch(22)
+    def onFanBack(self, data):
+        log.info(f"UnloadPage: Button FanBack")
 
     async def onPrinterStatusUpdate(self, data: dict):
 
@@ -2116,7 +1942,7 @@ class UnloadPage(OpenP4Page):
         # filament unload completed.
 
 
-class LoadPage(OpenP4Page):
+class LoadPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -2126,26 +1952,28 @@ class LoadPage(OpenP4Page):
     def id(cls) -> int:
         return 41
 
+    @classproperty
+    def printerObjects(cls) -> Dict[str, List[str]]:
+        return HEATER_OBJECTS
+
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0: # filament_extruder_target();
-                log.info(f"LoadPage: Button Extruder")
-            elif data.component_id == 1: # filament_heater_bed_target();
-                log.info(f"LoadPage: Button Bed")
-            elif data.component_id == 2: # filament_hot_target();
-                log.info(f"LoadPage: Button Camber")
-            elif data.component_id == 3: # page_to(0x24);
-                self.changePage(ControlKbPage)
-            elif data.component_id == 4: # page_to(0x24);
-                self.changePage(ControlKbPage)
-            elif data.component_id == 5: # page_to(0x24);
-                self.changePage(ControlKbPage)
-            else:
-                self.handleNavBarButtons(data.component_id)
+    @touch(0) # filament_extruder_target();
+    def onExtruder(self, data):
+        log.info(f"LoadPage: Button Extruder")
+
+    @touch(1) # filament_heater_bed_target();
+    def onBed(self, data):
+        log.info(f"LoadPage: Button Bed")
+
+    @touch(2) # filament_hot_target();
+    def onChamber(self, data):
+        log.info(f"LoadPage: Button Camber")
+
+    @touch(3, 4, 5) # page_to(0x24);
+    def onTargetInput(self, data):
+        self.changePage(ControlKbPage)
 
     async def onPrinterStatusUpdate(self, data: dict):
 
@@ -2167,7 +1995,7 @@ class LoadPage(OpenP4Page):
         # t0.txt Heating up...
 
 
-class MovePop1Page(OpenP4Page):
+class MovePop1Page(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -2180,15 +2008,13 @@ class MovePop1Page(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                log.info(f"MovePop1Page: Button Confirm")
-            elif data.component_id == 1:
-                log.info(f"MovePop1Page: Button Cancel")
-            else:
-                self.handleNavBarButtons(data.component_id)
+    @touch(0)
+    def onConfirm(self, data):
+        log.info(f"MovePop1Page: Button Confirm")
+
+    @touch(1)
+    def onCancel(self, data):
+        log.info(f"MovePop1Page: Button Cancel")
 
     async def onPrinterStatusUpdate(self, data: dict):
 
@@ -2209,6 +2035,7 @@ class ScreenSleepPage(OpenP4Page):
         return 43
 
     async def onDisplayEvent(self, type: EventType, data):
+        # Touches wake the panel up, they must not send it back to sleep
         if type == EventType.TOUCH:
             #prints 0x65,1
             #prints dp,1
@@ -2216,19 +2043,22 @@ class ScreenSleepPage(OpenP4Page):
             #prints 0xff,1
             #prints 0xff,1
             #prints 0xff,1
-            if data.component_id == 0:
-                self.changePage(self.state.return_page)
-                self.state.return_page = None  # Clear return page
-            elif data.component_id == 1:
-                log.info(f"ScreenSleepPage: component_id = 1")
-            else:
-                pass
+            await self.dispatchTouch(data)
+
+    @touch(0)
+    def onWake(self, data):
+        self.changePage(self.state.return_page)
+        self.state.return_page = None  # Clear return page
+
+    @touch(1)
+    def onTouch(self, data):
+        log.info(f"ScreenSleepPage: component_id = 1")
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class DetectErrorPage(OpenP4Page):
+class DetectErrorPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -2241,20 +2071,16 @@ class DetectErrorPage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                log.info(f"DetectErrorPage: Button Confirm")
-            else:
-                self.handleNavBarButtons(data.component_id)
+    @touch(0)
+    def onConfirm(self, data):
+        log.info(f"DetectErrorPage: Button Confirm")
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
         # t0.txt error_message
 
 
-class GCodeErrorPage(OpenP4Page):
+class GCodeErrorPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -2267,20 +2093,16 @@ class GCodeErrorPage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                log.info(f"GCodeErrorPage: Button Confirm")
-            else:
-                self.handleNavBarButtons(data.component_id)
+    @touch(0)
+    def onConfirm(self, data):
+        log.info(f"GCodeErrorPage: Button Confirm")
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
         # t0.txt gcode_error
 
 
-class UpdateSuccessPage(OpenP4Page):
+class UpdateSuccessPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -2293,13 +2115,9 @@ class UpdateSuccessPage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                log.info(f"UpdateSuccessPage: Button Confirm")
-            else:
-                self.handleNavBarButtons(data.component_id)
+    @touch(0)
+    def onConfirm(self, data):
+        log.info(f"UpdateSuccessPage: Button Confirm")
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -2352,7 +2170,7 @@ class UpdateFinishPage(OpenP4Page):
         # t0.txt Please turn off the power supply, reboot after \r20 seconds, and then it will start updating."
 
 
-class PrintNoFilPage(OpenP4Page):
+class PrintNoFilPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -2365,20 +2183,16 @@ class PrintNoFilPage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                log.info(f"PrintNoFilPage: Button Confirm")
-            else:
-                self.handleNavBarButtons(data.component_id)
+    @touch(0)
+    def onConfirm(self, data):
+        log.info(f"PrintNoFilPage: Button Confirm")
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
         # t0.txt Filament ran-out, \rplease re-load filament.
 
 
-class PrintNoFil2Page(OpenP4Page):
+class PrintNoFil2Page(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -2391,20 +2205,16 @@ class PrintNoFil2Page(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                log.info(f"PrintNoFil2Page: Button Confirm")
-            else:
-                self.handleNavBarButtons(data.component_id)
+    @touch(0)
+    def onConfirm(self, data):
+        log.info(f"PrintNoFil2Page: Button Confirm")
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
         # t0.txt Filament ran-out, \rplease re-load filament.
 
 
-class PrintLogSuccessPage(OpenP4Page):
+class PrintLogSuccessPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -2417,20 +2227,16 @@ class PrintLogSuccessPage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                log.info(f"PrintLogSuccessPage: Button Confirm")
-            else:
-                self.handleNavBarButtons(data.component_id)
+    @touch(0)
+    def onConfirm(self, data):
+        log.info(f"PrintLogSuccessPage: Button Confirm")
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
         # t0.txt Export logs successfully.
 
 
-class PrintLogFailedPage(OpenP4Page):
+class PrintLogFailedPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -2443,20 +2249,16 @@ class PrintLogFailedPage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                log.info(f"PrintLogFailedPage: Button Confirm")
-            else:
-                self.handleNavBarButtons(data.component_id)
+    @touch(0)
+    def onConfirm(self, data):
+        log.info(f"PrintLogFailedPage: Button Confirm")
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
         # t0.txt Failed to export logs. Please make \rsure the USB drive is inserted.
 
 
-class PrintStopPage(OpenP4Page):
+class PrintStopPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -2469,15 +2271,13 @@ class PrintStopPage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                log.info(f"PrintStopPage: Button Confirm")
-            if data.component_id == 1:
-                log.info(f"PrintStopPage: Button Cancel")
-            else:
-                self.handleNavBarButtons(data.component_id)
+    @touch(0)
+    def onConfirm(self, data):
+        log.info(f"PrintStopPage: Button Confirm")
+
+    @touch(1)
+    def onCancel(self, data):
+        log.info(f"PrintStopPage: Button Cancel")
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -2497,11 +2297,9 @@ class MovePop2Page(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                log.info(f"MovePop2Page: Button Confirm")
+    @touch(0)
+    def onConfirm(self, data):
+        log.info(f"MovePop2Page: Button Confirm")
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -2523,11 +2321,9 @@ class PrintStoppingPage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                log.info(f"PrintStoppingPage: Button Confirm")
+    @touch(0)
+    def onConfirm(self, data):
+        log.info(f"PrintStoppingPage: Button Confirm")
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -2549,13 +2345,13 @@ class ResumePrintPage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                log.info(f"ResumePrintPage: Button Confirm")
-            if data.component_id == 1:
-                log.info(f"ResumePrintPage: Button Cancel")
+    @touch(0)
+    def onConfirm(self, data):
+        log.info(f"ResumePrintPage: Button Confirm")
+
+    @touch(1)
+    def onCancel(self, data):
+        log.info(f"ResumePrintPage: Button Cancel")
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -2577,11 +2373,9 @@ class MemoryWarningPage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                log.info(f"MemoryWarningPage: Button Confirm")
+    @touch(0)
+    def onConfirm(self, data):
+        log.info(f"MemoryWarningPage: Button Confirm")
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -2590,7 +2384,7 @@ class MemoryWarningPage(OpenP4Page):
         # Der Speicher ist voll. \rBitte den Speicher leeren.
 
 
-class ControlSetFanPage(OpenP4Page):
+class ControlSetFanPage(NavBarPage):
 
     _fan0_speed = 0.0
     _fan2_speed = 0.0
@@ -2604,6 +2398,15 @@ class ControlSetFanPage(OpenP4Page):
     def id(cls) -> int:
         return 58
 
+    @classproperty
+    def printerObjects(cls) -> Dict[str, List[str]]:
+        return {
+            **HEATER_OBJECTS,
+            "fan_generic cooling_fan": ["speed"],           # Part cooling
+            "fan_generic auxiliary_cooling_fan": ["speed"], # Auxiliary cooling
+            "fan_generic exhaust_fan": ["speed"],           # Exhaust fan
+        }
+
     async def init(self):
         pass
 
@@ -2665,91 +2468,84 @@ class ControlSetFanPage(OpenP4Page):
             "%s.picc2" % element, 136 if highlight else 135
         )
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0: # filament_extruder_target();
-                log.info(f"ControlSetFanPage: Button Extruder")
-            elif data.component_id == 1: # filament_heater_bed_target();
-                log.info(f"ControlSetFanPage: Button Bed")
-            elif data.component_id == 2: # filament_hot_target();
-                log.info(f"ControlSetFanPage: Button Camber")
-            elif data.component_id == 3: # page_to(0x24);
-                self.changePage(ControlKbPage)
-            elif data.component_id == 4: # page_to(0x24);
-                self.changePage(ControlKbPage)
-            elif data.component_id == 5: # page_to(0x24);
-                self.changePage(ControlKbPage)
-
-            elif data.component_id == 6: # Button Cooling Fan
-                #self.filament_fan0()
-                if self._fan0_speed == 0.0:
-                    self.state.printer.runGcode(f"M106 P0 S255")
-                    #SET_FAN_SPEED FAN=cooling_fan SPEED=0.3 #30%
-                else:
-                    self.state.printer.runGcode(f"M106 P0 S0")
-            elif data.component_id == 7: # Button Auxiliary Cooling Fan
-                self.filament_fan2()
-            elif data.component_id == 8: # Button Chamber Circulation Fan
-                self.filament_fan3()
-
-            elif data.component_id == 9:
-                log.info(f"ControlSetFanPage: Button + Cooling Fan")
-            elif data.component_id == 10:
-                log.info(f"ControlSetFanPage: Button + Auxiliary Cooling Fan")
-            elif data.component_id == 11:
-                log.info(f"ControlSetFanPage: Button + Chamber Circulation Fan")
-
-            elif data.component_id == 12:
-                log.info(f"ControlSetFanPage: Button - Cooling Fan")
-            elif data.component_id == 13:
-                log.info(f"ControlSetFanPage: Button - Auxiliary Cooling Fan")
-            elif data.component_id == 14:
-                log.info(f"ControlSetFanPage: Button - Chamber Circulation Fan")
-
-            elif data.component_id == 15:
-                log.info(f"ControlSetFanPage: Button ? Cooling Fan")
-            elif data.component_id == 16:
-                log.info(f"ControlSetFanPage: Button ? Cooling Fan")
-            elif data.component_id == 17:
-                log.info(f"ControlSetFanPage: Button ? Cooling Fan")
-            elif data.component_id == 18:
-                log.info(f"ControlSetFanPage: Button ? Cooling Fan")
-            elif data.component_id == 19:
-                log.info(f"ControlSetFanPage: Button ? Cooling Fan")
-
-            elif data.component_id == 20:
-                log.info(f"ControlSetFanPage: Button ? Auxiliary Cooling Fan")
-            elif data.component_id == 21:
-                log.info(f"ControlSetFanPage: Button ? Auxiliary Cooling Fan")
-            elif data.component_id == 23:
-                log.info(f"ControlSetFanPage: Button ? Auxiliary Cooling Fan")
-            elif data.component_id == 24:
-                log.info(f"ControlSetFanPage: Button ? Auxiliary Cooling Fan")
-            elif data.component_id == 25:
-                log.info(f"ControlSetFanPage: Button ? Auxiliary Cooling Fan")
-
-            elif data.component_id == 26:
-                log.info(f"ControlSetFanPage: Button ? Chamber Circulation Fan")
-            elif data.component_id == 27:
-                log.info(f"ControlSetFanPage: Button ? Chamber Circulation Fan")
-            elif data.component_id == 28:
-                log.info(f"ControlSetFanPage: Button ? Chamber Circulation Fan")
-            elif data.component_id == 29:
-                log.info(f"ControlSetFanPage: Button ? Chamber Circulation Fan")
-            elif data.component_id == 30:
-                log.info(f"ControlSetFanPage: Button ? Chamber Circulation Fan")
-
-            elif data.component_id == 22: # Button Back
-                log.info(f"ControlSetFanPage: Button Back")
-                #self.changePage(self.state.return_page)
-                self.changePage(ControlPage)
-                
-            elif data.component_id == 34: # ignore NavBar control button
-                log.info(f"ControlSetFanPage: ignore NavBar control button")
+    @touch(0) # filament_extruder_target();
+    def onExtruder(self, data):
+        log.info(f"ControlSetFanPage: Button Extruder")
 
-            else:
-                self.handleNavBarButtons(data.component_id)
+    @touch(1) # filament_heater_bed_target();
+    def onBed(self, data):
+        log.info(f"ControlSetFanPage: Button Bed")
+
+    @touch(2) # filament_hot_target();
+    def onChamber(self, data):
+        log.info(f"ControlSetFanPage: Button Camber")
+
+    @touch(3, 4, 5) # page_to(0x24);
+    def onTargetInput(self, data):
+        self.changePage(ControlKbPage)
+
+    @touch(6) # Button Cooling Fan
+    def onCoolingFan(self, data):
+        #self.filament_fan0()
+        if self._fan0_speed == 0.0:
+            self.state.printer.runGcode(f"M106 P0 S255")
+            #SET_FAN_SPEED FAN=cooling_fan SPEED=0.3 #30%
+        else:
+            self.state.printer.runGcode(f"M106 P0 S0")
+
+    @touch(7) # Button Auxiliary Cooling Fan
+    def onAuxiliaryFan(self, data):
+        self.filament_fan2()
+
+    @touch(8) # Button Chamber Circulation Fan
+    def onChamberFan(self, data):
+        self.filament_fan3()
+
+    @touch(9)
+    def onCoolingFanUp(self, data):
+        log.info(f"ControlSetFanPage: Button + Cooling Fan")
+
+    @touch(10)
+    def onAuxiliaryFanUp(self, data):
+        log.info(f"ControlSetFanPage: Button + Auxiliary Cooling Fan")
+
+    @touch(11)
+    def onChamberFanUp(self, data):
+        log.info(f"ControlSetFanPage: Button + Chamber Circulation Fan")
+
+    @touch(12)
+    def onCoolingFanDown(self, data):
+        log.info(f"ControlSetFanPage: Button - Cooling Fan")
+
+    @touch(13)
+    def onAuxiliaryFanDown(self, data):
+        log.info(f"ControlSetFanPage: Button - Auxiliary Cooling Fan")
+
+    @touch(14)
+    def onChamberFanDown(self, data):
+        log.info(f"ControlSetFanPage: Button - Chamber Circulation Fan")
+
+    @touch(15, 16, 17, 18, 19)
+    def onCoolingFanPreset(self, data):
+        log.info(f"ControlSetFanPage: Button ? Cooling Fan")
+
+    @touch(20, 21, 23, 24, 25)
+    def onAuxiliaryFanPreset(self, data):
+        log.info(f"ControlSetFanPage: Button ? Auxiliary Cooling Fan")
+
+    @touch(26, 27, 28, 29, 30)
+    def onChamberFanPreset(self, data):
+        log.info(f"ControlSetFanPage: Button ? Chamber Circulation Fan")
+
+    @touch(22) # Button Back
+    def onBack(self, data):
+        log.info(f"ControlSetFanPage: Button Back")
+        #self.changePage(self.state.return_page)
+        self.changePage(ControlPage)
+
+    @touch(34) # ignore NavBar control button
+    def onNavControl(self, data):
+        log.info(f"ControlSetFanPage: ignore NavBar control button")
 
     async def onPrinterStatusUpdate(self, data: dict):
 
@@ -2801,7 +2597,7 @@ class ControlSetFanPage(OpenP4Page):
         await self.state.display.set("n8.val", self._fan3_speed)
         await self.setHighlightFan("b8", self._fan3_speed > 0)
 
-class SyntonyFinischPage(OpenP4Page):
+class SyntonyFinischPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -2814,13 +2610,9 @@ class SyntonyFinischPage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 3:
-                log.info(f"SyntonyFinischPage: Button Confirm")
-            else:
-                self.handleNavBarButtons(data.component_id)
+    @touch(3)
+    def onConfirm(self, data):
+        log.info(f"SyntonyFinischPage: Button Confirm")
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -2828,7 +2620,7 @@ class SyntonyFinischPage(OpenP4Page):
         # Input shaping completed.
 
 
-class BedCalFinischPage(OpenP4Page):
+class BedCalFinischPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -2841,13 +2633,9 @@ class BedCalFinischPage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 3:
-                log.info(f"BedCalFinischPage: Button Confirm")
-            else:
-                self.handleNavBarButtons(data.component_id)
+    @touch(3)
+    def onConfirm(self, data):
+        log.info(f"BedCalFinischPage: Button Confirm")
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -2855,7 +2643,7 @@ class BedCalFinischPage(OpenP4Page):
         # Platform calibration completed.
 
 
-class AutoFinischPage(OpenP4Page):
+class AutoFinischPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -2868,13 +2656,9 @@ class AutoFinischPage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 3:
-                log.info(f"AutoFinischPage: Button Confirm")
-            else:
-                self.handleNavBarButtons(data.component_id)
+    @touch(3)
+    def onConfirm(self, data):
+        log.info(f"AutoFinischPage: Button Confirm")
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -2882,7 +2666,7 @@ class AutoFinischPage(OpenP4Page):
         # Auto Leveling Completed.
 
 
-class NetworkPage(OpenP4Page):
+class NetworkPage(SettingsPage):
     @classproperty
     def name(cls) -> str:
         return "network"
@@ -2891,29 +2675,15 @@ class NetworkPage(OpenP4Page):
     def id(cls) -> int:
         return 62
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                self.changePage(LanguagePage)
-            elif data.component_id == 1:
-                self.changePage(NetworkPage)
-            elif data.component_id == 2:
-                self.changePage(ResetPage)
-            elif data.component_id == 4:
-                self.changePage(UpdatePage)
-            elif data.component_id == 5:
-                self.changePage(MorePage)
-            #elif data.component_id == 6: Button WiFi connect
-            #elif data.component_id == 7: Button LAN connect
-            #elif data.component_id == 8: Button WiFi connection
-            #elif data.component_id == 9: Button Fluidd account
-            #elif data.component_id == 10: Button connection
-            #elif data.component_id == 20: Button Client
-            #elif data.component_id == 21: Button Server
-            #elif data.component_id == 22: Button Search
-            else:  
-                self.handleNavBarButtons(data.component_id)
+    # Not handled yet:
+    # 6: Button WiFi connect
+    # 7: Button LAN connect
+    # 8: Button WiFi connection
+    # 9: Button Fluidd account
+    # 10: Button connection
+    # 20: Button Client
+    # 21: Button Server
+    # 22: Button Search
 
     async def onPrinterStatusUpdate(self, data: dict):
         #log.info(f"ControlKbPage: onPrinterStatusUpdate: {data}")
@@ -2937,7 +2707,7 @@ class NetworkPage(OpenP4Page):
 """
 
 
-class ServerSetPage(OpenP4Page):
+class ServerSetPage(SettingsPage):
     @classproperty
     def name(cls) -> str:
         return "network"
@@ -2946,30 +2716,16 @@ class ServerSetPage(OpenP4Page):
     def id(cls) -> int:
         return 63
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                self.changePage(LanguagePage)
-            elif data.component_id == 1:
-                self.changePage(NetworkPage)
-            elif data.component_id == 2:
-                self.changePage(ResetPage)
-            elif data.component_id == 4:
-                self.changePage(UpdatePage)
-            elif data.component_id == 5:
-                self.changePage(MorePage)
-            #elif data.component_id == 6: Button refresh
-            #elif data.component_id == 7: Button up
-            #elif data.component_id == 8: Button down
-            #elif data.component_id == 9: Button back
-            #elif data.component_id == 10: server1
-            #elif data.component_id == 11: server2
-            #elif data.component_id == 12: server3
-            #elif data.component_id == 13: server4
-            #elif data.component_id == 14: server5
-            else:  
-                self.handleNavBarButtons(data.component_id)
+    # Not handled yet:
+    # 6: Button refresh
+    # 7: Button up
+    # 8: Button down
+    # 9: Button back
+    # 10: server1
+    # 11: server2
+    # 12: server3
+    # 13: server4
+    # 14: server5
 
     async def onPrinterStatusUpdate(self, data: dict):
         #log.info(f"ControlKbPage: onPrinterStatusUpdate: {data}")
@@ -2994,7 +2750,7 @@ class ServerSetPage(OpenP4Page):
         await self.state.display.set("t12.txt", 1)
 '''
 
-class SearchServerPage(OpenP4Page):
+class SearchServerPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -3007,18 +2763,13 @@ class SearchServerPage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            if data.component_id == 0:
-                pass
-            else:  
-                self.handleNavBarButtons(data.component_id)
+    # Not handled yet: 0
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class OnlineUpdatePage(OpenP4Page):
+class OnlineUpdatePage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -3031,18 +2782,13 @@ class OnlineUpdatePage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            if data.component_id == 0:
-                pass
-            else:  
-                self.handleNavBarButtons(data.component_id)
+    # Not handled yet: 0
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class OfflineUpdatePage(OpenP4Page):
+class OfflineUpdatePage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -3055,12 +2801,7 @@ class OfflineUpdatePage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            if data.component_id == 0:
-                pass
-            else:  
-                self.handleNavBarButtons(data.component_id)
+    # Not handled yet: 0
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -3103,17 +2844,15 @@ class BtnConflictPage(OpenP4Page):
         # t0.txt
         # Please wait until current operation \rfinish.
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                self.changePage(self.state.return_page)
+    @touch(0)
+    def onReturn(self, data):
+        self.changePage(self.state.return_page)
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class Language2Page(OpenP4Page):
+class Language2Page(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -3126,12 +2865,7 @@ class Language2Page(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            if data.component_id == 0:
-                pass
-            else:  
-                self.handleNavBarButtons(data.component_id)
+    # Not handled yet: 0
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -3152,16 +2886,15 @@ class LowTempPage(OpenP4Page):
         # t0.txt
         # The temperature of the nozzle is too \rlow.Please click the button again \rafter the temperature reaches the set \rtemperature.
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            if data.component_id == 0:
-                self.changePage(self.state.return_page)
+    @touch(0)
+    def onReturn(self, data):
+        self.changePage(self.state.return_page)
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class Load2Page(OpenP4Page):
+class Load2Page(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -3174,18 +2907,13 @@ class Load2Page(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            if data.component_id == 0:
-                pass
-            else:  
-                self.handleNavBarButtons(data.component_id)
+    # Not handled yet: 0
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class LoadFinishPage(OpenP4Page):
+class LoadFinishPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -3198,12 +2926,7 @@ class LoadFinishPage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            if data.component_id == 0:
-                pass
-            else:  
-                self.handleNavBarButtons(data.component_id)
+    # Not handled yet: 0
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -3224,16 +2947,15 @@ class AutoWarningPage(OpenP4Page):
         # t0.txt
         # Please set the temperature to above 35 ℃.
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            if data.component_id == 0:
-                self.changePage(self.state.return_page)
+    @touch(0)
+    def onReturn(self, data):
+        self.changePage(self.state.return_page)
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class CalWarningPage(OpenP4Page):
+class CalWarningPage(NavBarPage):
 
     @classproperty
     def name(cls) -> str:
@@ -3246,12 +2968,7 @@ class CalWarningPage(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            if data.component_id == 0:
-                pass
-            else:  
-                self.handleNavBarButtons(data.component_id)
+    # Not handled yet: 0
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -3272,10 +2989,9 @@ class RePrintingPage(OpenP4Page):
         # t0.txt
         # Restoring printing...
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            if data.component_id == 0:
-                self.changePage(self.state.return_page)
+    @touch(0)
+    def onReturn(self, data):
+        self.changePage(self.state.return_page)
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -3294,10 +3010,9 @@ class OpenLanguage1Page(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            if data.component_id == 0:
-                self.changePage(self.state.return_page)
+    @touch(0)
+    def onReturn(self, data):
+        self.changePage(self.state.return_page)
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -3316,10 +3031,9 @@ class OpenLanguage2Page(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            if data.component_id == 0:
-                self.changePage(self.state.return_page)
+    @touch(0)
+    def onReturn(self, data):
+        self.changePage(self.state.return_page)
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -3340,12 +3054,13 @@ class OpenSkipPopPage(OpenP4Page):
         # t0.txt
         # Are you sure to skip start-guide?
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            if data.component_id == 0: # Confirm
-                self.changePage(self.state.return_page)
-            if data.component_id == 1: # Cancel
-                self.changePage(self.state.return_page)
+    @touch(0) # Confirm
+    def onConfirm(self, data):
+        self.changePage(self.state.return_page)
+
+    @touch(1) # Cancel
+    def onCancel(self, data):
+        self.changePage(self.state.return_page)
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -3364,10 +3079,9 @@ class OpenUnpack1Page(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            if data.component_id == 0: # Next
-                self.changePage(OpenUnpack2Page)
+    @touch(0) # Next
+    def onNext(self, data):
+        self.changePage(OpenUnpack2Page)
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -3386,10 +3100,9 @@ class OpenUnpack2Page(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            if data.component_id == 0: # Next
-                self.changePage(OpenUnpack3Page)
+    @touch(0) # Next
+    def onNext(self, data):
+        self.changePage(OpenUnpack3Page)
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -3408,10 +3121,9 @@ class OpenUnpack3Page(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            if data.component_id == 0: # Next
-                self.changePage(OpenUnpack4Page)
+    @touch(0) # Next
+    def onNext(self, data):
+        self.changePage(OpenUnpack4Page)
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -3430,10 +3142,9 @@ class OpenUnpack4Page(OpenP4Page):
     async def init(self):
         pass
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            if data.component_id == 0: # Next
-                self.changePage(MainPage)
+    @touch(0) # Next
+    def onNext(self, data):
+        self.changePage(MainPage)
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -3456,10 +3167,9 @@ class OpenLoad1Page(OpenP4Page):
         #t2.txt="Load"
         #t3.txt="Install the supplies holder."
         
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            if data.component_id == 0: # Next
-                self.changePage(OpenUnpack2Page)
+    @touch(0) # Next
+    def onNext(self, data):
+        self.changePage(OpenUnpack2Page)
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -3482,10 +3192,9 @@ class OpenLoad2Page(OpenP4Page):
         #t2.txt="Load"
         #t3.txt="Keep pushing the filament \rinto the filament tube \runtill reach extruder."
         
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            if data.component_id == 0: # Next
-                self.changePage(OpenUnpack3Page)
+    @touch(0) # Next
+    def onNext(self, data):
+        self.changePage(OpenUnpack3Page)
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -3509,10 +3218,9 @@ class OpenLoad3Page(OpenP4Page):
         #t3.txt="Set the corresponding \rnozzle temperature for \rthe filament and start \rheating."
         #t4.txt="Attention: Wait for the \rnozzle temperature to \rreach the set temperature \rbefore clicking Next."
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            if data.component_id == 0: # Next
-                self.changePage(OpenUnpack4Page)
+    @touch(0) # Next
+    def onNext(self, data):
+        self.changePage(OpenUnpack4Page)
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -3535,12 +3243,12 @@ class OpenLoad4Page(OpenP4Page):
         #t2.txt="Load"
         #t3.txt="Click load button and keep \rpushing the filament until it come out from the nozzle."
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            if data.component_id == 0: #b0.txt="Next"
-                self.changePage(OpenFinishPage)
-            if data.component_id == 1: #b1.txt="Load"
-                pass
+    @touch(0) #b0.txt="Next"
+    def onNext(self, data):
+        self.changePage(OpenFinishPage)
+
+    # Not handled yet:
+    # 1: b1.txt="Load"
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -3564,10 +3272,9 @@ class OpenFinishPage(OpenP4Page):
         #t3.txt="Congrats!guide tutorial finished."
         #t4.txt="Attention: Input shaping will be \rautomatically performed."
         
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            if data.component_id == 0: #b0.txt="Completed"
-                self.changePage(MainPage) # Input shaping will be \rautomatically performed."
+    @touch(0) #b0.txt="Completed"
+    def onCompleted(self, data):
+        self.changePage(MainPage) # Input shaping will be \rautomatically performed."
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -3595,19 +3302,16 @@ class MorePopPage(OpenP4Page):
     async def init(self):
         pass
         #t0.txt="Do you want to restore factory \rsettings?"
-        
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            if data.component_id == 0: #b0.txt="Confirm"
-                pass
-            if data.component_id == 1: #b1.txt="Cancel"
-                pass
+
+    # Not handled yet:
+    # 0: b0.txt="Confirm"
+    # 1: b1.txt="Cancel"
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class ToolSelectPage(OpenP4Page):
+class ToolSelectPage(NavBarPage):
     @classproperty
     def name(cls) -> str:
         return "tool_select"
@@ -3616,27 +3320,31 @@ class ToolSelectPage(OpenP4Page):
     def id(cls) -> int:
         return 95
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                self.changePage(PlatformResetPage)
-            elif data.component_id == 1:
-                self.changePage(AutoBedLevelingPage)
-            elif data.component_id == 2:
-                self.changePage(InputShapingPage)
-            elif data.component_id == 3:
-                self.changePage(ConsumablesDryingPage)
-            elif data.component_id == 4:
-                self.changePage(BoxDryingPage)
-            else:
-                self.handleNavBarButtons(data.component_id)
+    @touch(0)
+    def onPlatformReset(self, data):
+        self.changePage(PlatformResetPage)
+
+    @touch(1)
+    def onAutoBedLeveling(self, data):
+        self.changePage(AutoBedLevelingPage)
+
+    @touch(2)
+    def onInputShaping(self, data):
+        self.changePage(InputShapingPage)
+
+    @touch(3)
+    def onConsumablesDrying(self, data):
+        self.changePage(ConsumablesDryingPage)
+
+    @touch(4)
+    def onBoxDrying(self, data):
+        self.changePage(BoxDryingPage)
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class DryPage(OpenP4Page):
+class DryPage(NavBarPage):
     @classproperty
     def name(cls) -> str:
         return "dry"
@@ -3650,21 +3358,15 @@ class DryPage(OpenP4Page):
         #t0.txt="1. Please check the platform and the bottom of the \rmachine to ensure that there are no debris. \r2. After initialization, cover the consumables with a \rbox and start drying by selecting the filament type."
         #t1.txt="Attention: Please use a box that is resistant to \rhigh temperatures."
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0: # Play
-                pass
-            elif data.component_id == 1:
-                pass
-            else:
-                self.handleNavBarButtons(data.component_id)
+    # Not handled yet:
+    # 0: Play
+    # 1
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class DryPreparePage(OpenP4Page):
+class DryPreparePage(NavBarPage):
     @classproperty
     def name(cls) -> str:
         return "dry_prepare"
@@ -3677,21 +3379,13 @@ class DryPreparePage(OpenP4Page):
         pass
         #t0.txt="Initializing location, please wait..."
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                pass
-            elif data.component_id == 1:
-                pass
-            else:
-                self.handleNavBarButtons(data.component_id)
+    # Not handled yet: 0, 1
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class DryTipsPage(OpenP4Page):
+class DryTipsPage(NavBarPage):
     @classproperty
     def name(cls) -> str:
         return "dry_tips"
@@ -3704,21 +3398,15 @@ class DryTipsPage(OpenP4Page):
         pass
         #t0.txt="Please select consumables in the \rupper left corner"
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0: #b0.txt="Back"
-                pass
-            elif data.component_id == 1: #b1.txt="Start"
-                pass
-            else:
-                self.handleNavBarButtons(data.component_id)
+    # Not handled yet:
+    # 0: b0.txt="Back"
+    # 1: b1.txt="Start"
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class DrySelectPage(OpenP4Page):
+class DrySelectPage(NavBarPage):
     @classproperty
     def name(cls) -> str:
         return "dry_select"
@@ -3731,27 +3419,15 @@ class DrySelectPage(OpenP4Page):
         pass
         #t0.txt="Please select consumables in the \rupper left corner"
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                pass
-            elif data.component_id == 1:
-                pass
-            elif data.component_id == 2:
-                pass
-            elif data.component_id == 3:
-                pass
-            elif data.component_id == 4:
-                pass
-            elif data.component_id == 5:
-                pass
-            elif data.component_id == 6: #button up
-                pass
-            elif data.component_id == 7: #button down
-                pass
-            else:
-                self.handleNavBarButtons(data.component_id)
+    # Not handled yet:
+    # 0
+    # 1
+    # 2
+    # 3
+    # 4
+    # 5
+    # 6: button up
+    # 7: button down
 
     async def onPrinterStatusUpdate(self, data: dict):
         #t1.txt
@@ -3764,7 +3440,7 @@ class DrySelectPage(OpenP4Page):
         pass
 
 
-class DryingPage(OpenP4Page):
+class DryingPage(NavBarPage):
     @classproperty
     def name(cls) -> str:
         return "drying"
@@ -3778,13 +3454,8 @@ class DryingPage(OpenP4Page):
         #t0.txt="Suggest flipping the consumables \revery 6 hours"
         #t1.txt="Caution: Be careful of high \rtemperature burns"
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0: #b0.txt="Stop"
-                pass
-            else:
-                self.handleNavBarButtons(data.component_id)
+    # Not handled yet:
+    # 0: b0.txt="Stop"
 
     async def onPrinterStatusUpdate(self, data: dict):
         #t2.txt
@@ -3796,7 +3467,7 @@ class DryingPage(OpenP4Page):
         pass
 
 
-class DryingFinishPage(OpenP4Page):
+class DryingFinishPage(NavBarPage):
     @classproperty
     def name(cls) -> str:
         return "dry_finish"
@@ -3810,19 +3481,14 @@ class DryingFinishPage(OpenP4Page):
         #t0.txt="Remove the consumables as soon as they \rcool down."
         #t1.txt="It is recommended to put the consumables \rin a protective box to avoid moisture again."
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0: #b0.txt="Confirm"
-                pass
-            else:
-                self.handleNavBarButtons(data.component_id)
+    # Not handled yet:
+    # 0: b0.txt="Confirm"
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class DebugPage(OpenP4Page):
+class DebugPage(NavBarPage):
     @classproperty
     def name(cls) -> str:
         return "debug"
@@ -3839,13 +3505,9 @@ class DebugPage(OpenP4Page):
         #t3.txt="热传保护"
         #t9.txt="重试次数"
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0: #Exit"
-                self.changePage(MainPage)
-            else:
-                self.handleNavBarButtons(data.component_id)
+    @touch(0) #Exit"
+    def onExit(self, data):
+        self.changePage(MainPage)
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -3869,11 +3531,9 @@ class DryWarn1Page(OpenP4Page):
         pass
         #t0.txt="Please configure consumables \rbefore use"
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0: #Confirm"
-                self.changePage(MainPage)
+    @touch(0) #Confirm"
+    def onConfirm(self, data):
+        self.changePage(MainPage)
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -3892,17 +3552,15 @@ class DryWarn2Page(OpenP4Page):
         pass
         #t0.txt="Please select the type of consumables"
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0: #Confirm"
-                self.changePage(MainPage)
+    @touch(0) #Confirm"
+    def onConfirm(self, data):
+        self.changePage(MainPage)
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class UserInfoPage(OpenP4Page):
+class UserInfoPage(SettingsPage):
     @classproperty
     def name(cls) -> str:
         return "user_info"
@@ -3919,22 +3577,6 @@ class UserInfoPage(OpenP4Page):
         #t4.txt="Check for updates"
         #t5.txt="more"
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                self.changePage(LanguagePage)
-            elif data.component_id == 1:
-                self.changePage(NetworkPage)
-            elif data.component_id == 2:
-                self.changePage(ResetPage)
-            elif data.component_id == 4:
-                self.changePage(UpdatePage)
-            elif data.component_id == 5:
-                self.changePage(MorePage)
-            else:
-                self.handleNavBarButtons(data.component_id)
-
     async def onPrinterStatusUpdate(self, data: dict):
         pass
         #t6.txt="Device code:"
@@ -3943,7 +3585,7 @@ class UserInfoPage(OpenP4Page):
         #t8.txt=""
 
 
-class NetworkTestPage(OpenP4Page):
+class NetworkTestPage(SettingsPage):
     @classproperty
     def name(cls) -> str:
         return "network_test"
@@ -3960,22 +3602,6 @@ class NetworkTestPage(OpenP4Page):
         #t4.txt="Check for updates"
         #t5.txt="more"
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                self.changePage(LanguagePage)
-            elif data.component_id == 1:
-                self.changePage(NetworkPage)
-            elif data.component_id == 2:
-                self.changePage(ResetPage)
-            elif data.component_id == 4:
-                self.changePage(UpdatePage)
-            elif data.component_id == 5:
-                self.changePage(MorePage)
-            else:
-                self.handleNavBarButtons(data.component_id)
-
     async def onPrinterStatusUpdate(self, data: dict):
         pass
         #t11.txt="No network connection"
@@ -4003,13 +3629,13 @@ class UserExitPage(OpenP4Page):
         pass
         #t0.txt="Do you want to \rlog out of the account?"
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0: #b0.txt="Confirm"
-                self.changePage(MainPage)
-            elif data.component_id == 1: #b1.txt="Cancel"
-                self.changePage(MainPage)
+    @touch(0) #b0.txt="Confirm"
+    def onConfirm(self, data):
+        self.changePage(MainPage)
+
+    @touch(1) #b1.txt="Cancel"
+    def onCancel(self, data):
+        self.changePage(MainPage)
  
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -4048,11 +3674,9 @@ class ServerSuccessPage(OpenP4Page):
         pass
         #t0.txt="Successfully switched servers"
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0: #b0.txt="Confirm"
-                self.changePage(MainPage)
+    @touch(0) #b0.txt="Confirm"
+    def onConfirm(self, data):
+        self.changePage(MainPage)
  
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -4071,11 +3695,9 @@ class ServerFailPage(OpenP4Page):
         pass
         #t0.txt="Server switching failed"
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0: #b0.txt="Confirm"
-                self.changePage(MainPage)
+    @touch(0) #b0.txt="Confirm"
+    def onConfirm(self, data):
+        self.changePage(MainPage)
  
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -4094,13 +3716,13 @@ class ForgetPwdPage(OpenP4Page):
         pass
         #t0.txt="Are you sure you want to\rremove this connection?"
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0: #b0.txt="Confirm"
-                self.changePage(MainPage)
-            elif data.component_id == 1: #b1.txt="Cancel"
-                self.changePage(MainPage)
+    @touch(0) #b0.txt="Confirm"
+    def onConfirm(self, data):
+        self.changePage(MainPage)
+
+    @touch(1) #b1.txt="Cancel"
+    def onCancel(self, data):
+        self.changePage(MainPage)
  
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -4119,17 +3741,15 @@ class BedHeatRulesPage(OpenP4Page):
         pass
         #t0.txt="The hotbed temperature is too low,\rand it will automatically heat up."
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0: #b0.txt="Confirm"
-                self.changePage(MainPage)
+    @touch(0) #b0.txt="Confirm"
+    def onConfirm(self, data):
+        self.changePage(MainPage)
  
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class ZeroBoxPage(OpenP4Page):
+class ZeroBoxPage(NavBarPage):
     @classproperty
     def name(cls) -> str:
         return "zero_box_page"
@@ -4138,43 +3758,53 @@ class ZeroBoxPage(OpenP4Page):
     def id(cls) -> int:
         return 113
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                pass
-            elif data.component_id == 1:
-                #page_to(0x23);
-                self.changePage(ControlPage)
-            elif data.component_id == 2:
-                self.changePage(UserGuidePage)
-                #page_to(0x74);
-            elif data.component_id == 3:
-                #slot[0x10bc] = 0x71;
-                #MultiColorSlots::SetLoadTarget();
-                self.changePage(LoadStep1Page) #page_to(0x7f);
-                #send_cmd_vis(tty_fd,"gm0","1");
-            elif data.component_id == 4:
-                #MultiColorSlots::SetLoadTarget();
-                #filament_unload();
-                self.changePage(UnloadPage) #page_to(0x28);
-            elif data.component_id == 5:
-                pass
-                #puVar20 = (undefined4 *)MultiColorSlots::UpdateBoxStates((MultiColorSlots *)slot);
-            elif data.component_id == 6:
-                self.changePage(SlotParamsPage) #page_to(0x75);
-                #MultiColorSlots::SetSingleSlot((MultiColorSlots *)slot,"a0");
-            elif data.component_id == 7:
-                pass
-                #MultiColorSlots::SetSelectedSlotIndex((MultiColorSlots *)slot,0);
-            else:
-                self.handleNavBarButtons(data.component_id)
+    @touch(0)
+    def onNothing(self, data):
+        pass
+
+    @touch(1)
+    def onBack(self, data):
+        #page_to(0x23);
+        self.changePage(ControlPage)
+
+    @touch(2)
+    def onUserGuide(self, data):
+        self.changePage(UserGuidePage)
+        #page_to(0x74);
+
+    @touch(3)
+    def onLoad(self, data):
+        #slot[0x10bc] = 0x71;
+        #MultiColorSlots::SetLoadTarget();
+        self.changePage(LoadStep1Page) #page_to(0x7f);
+        #send_cmd_vis(tty_fd,"gm0","1");
+
+    @touch(4)
+    def onUnload(self, data):
+        #MultiColorSlots::SetLoadTarget();
+        #filament_unload();
+        self.changePage(UnloadPage) #page_to(0x28);
+
+    @touch(5)
+    def onUpdateBoxStates(self, data):
+        pass
+        #puVar20 = (undefined4 *)MultiColorSlots::UpdateBoxStates((MultiColorSlots *)slot);
+
+    @touch(6)
+    def onSlotParams(self, data):
+        self.changePage(SlotParamsPage) #page_to(0x75);
+        #MultiColorSlots::SetSingleSlot((MultiColorSlots *)slot,"a0");
+
+    @touch(7)
+    def onSelectSlot(self, data):
+        pass
+        #MultiColorSlots::SetSelectedSlotIndex((MultiColorSlots *)slot,0);
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class OneBoxPage(OpenP4Page):
+class OneBoxPage(NavBarPage):
     @classproperty
     def name(cls) -> str:
         return "one_box_page"
@@ -4183,125 +3813,72 @@ class OneBoxPage(OpenP4Page):
     def id(cls) -> int:
         return 114
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                self.changePage(ControlPage) #page_to(0x23);
-            if data.component_id == 1:
-                pass
-                #MultiColorSlots::HandleUninstallEvent((MultiColorSlots *)slot);
-            elif data.component_id == 2:
-                pass
-                #MultiColorSlots::HandleLoadEvent((MultiColorSlots *)slot);
-            elif data.component_id == 3:
-                pass
-                #MultiColorSlots::HandleUnloadEvent((MultiColorSlots *)slot);
-            elif data.component_id == 4:
-                self.changePage(SlotParamsPage) #page_to(0x75);
-            elif data.component_id == 5:
-                self.changePage(SlotParamsPage)
-            elif data.component_id == 6:
-                self.changePage(SlotParamsPage)
-            elif data.component_id == 7:
-                self.changePage(SlotParamsPage)
-            elif data.component_id == 8:
-                self.changePage(SlotParamsPage)
-            elif data.component_id == 9:
-                pass
-                #MultiColorSlots::UpdateSlotOperationUI((MultiColorSlots *)slot,"p5");
-            elif data.component_id == 10:
-                pass
-                #MultiColorSlots::UpdateSlotOperationUI((MultiColorSlots *)slot,"p6");
-            elif data.component_id == 11:
-                pass
-                #MultiColorSlots::UpdateSlotOperationUI((MultiColorSlots *)slot,"p7");
-            elif data.component_id == 12:
-                pass
-                #MultiColorSlots::UpdateSlotOperationUI((MultiColorSlots *)slot,"p8");
-            elif data.component_id == 13:
-                pass
-                #MultiColorSlots::UpdateSlotOperationUI((MultiColorSlots *)slot,"p9");
-            elif data.component_id == 15:
-                pass
-                #MultiColorSlots::SetSelectedSlotIndex((MultiColorSlots *)slot,-1);
-                #MultiColorSlots::SetSelectedBoxIndex((MultiColorSlots *)slot,0);
-            elif data.component_id == 16:
-                pass
-                #MultiColorSlots::SetSelectedSlotIndex((MultiColorSlots *)slot,-1);
-                #MultiColorSlots::SetSelectedBoxIndex((MultiColorSlots *)slot,1);
-            elif data.component_id == 17:
-                pass
-                #MultiColorSlots::SetSelectedSlotIndex((MultiColorSlots *)slot,-1);
-                #MultiColorSlots::SetSelectedBoxIndex((MultiColorSlots *)slot,2);
-            elif data.component_id == 18:
-                pass
-                #MultiColorSlots::SetSelectedSlotIndex((MultiColorSlots *)slot,-1);
-                #MultiColorSlots::SetSelectedBoxIndex((MultiColorSlots *)slot,3);
-            elif data.component_id == 19:
-                self.changePage(BoxSettingsPage) #page_to(0x85);
-            elif data.component_id == 20:
-                pass
-                #MultiColorSlots::ControlShowKeypad((MultiColorSlots *)slot,"display");
-            elif data.component_id == 23:
-                pass
-                #MultiColorSlots::HandleRetryEvent();
-            elif data.component_id == 39:
-                pass
-                #MultiColorSlots::HandleKeypadEvent((MultiColorSlots *)slot,0x28);
-            elif data.component_id == 40:
-                pass
-                #MultiColorSlots::HandleKeypadEvent((MultiColorSlots *)slot,0x29);
-            elif data.component_id == 41:
-                pass
-                #MultiColorSlots::HandleKeypadEvent((MultiColorSlots *)slot,0x2a);
-            elif data.component_id == 42:
-                pass
-                #MultiColorSlots::HandleKeypadEvent((MultiColorSlots *)slot,0x2b);
-            elif data.component_id == 43:
-                pass
-                #MultiColorSlots::HandleKeypadEvent((MultiColorSlots *)slot,0x2c);
-            elif data.component_id == 44:
-                pass
-                #MultiColorSlots::HandleKeypadEvent((MultiColorSlots *)slot,0x2d);
-            elif data.component_id == 45:
-                pass
-                #MultiColorSlots::HandleKeypadEvent((MultiColorSlots *)slot,0x2e);
-            elif data.component_id == 46:
-                pass
-                #MultiColorSlots::HandleKeypadEvent((MultiColorSlots *)slot,0x2f);
-            elif data.component_id == 47:
-                pass
-                #MultiColorSlots::HandleKeypadEvent((MultiColorSlots *)slot,0x30);
-            elif data.component_id == 48:
-                pass
-                #MultiColorSlots::HandleKeypadEvent((MultiColorSlots *)slot,0x31);
-            elif data.component_id == 49:
-                pass
-                #MultiColorSlots::HandleKeypadEvent((MultiColorSlots *)slot,0x32);
-            elif data.component_id == 50:
-                pass
-                #MultiColorSlots::HandleKeypadEvent((MultiColorSlots *)slot,0x33);
-            elif data.component_id == 70:
-                pass
-                #MultiColorSlots::HandleRfidEvent((MultiColorSlots *)slot);
-            elif data.component_id == 71:
-                pass
-                #MultiColorSlots::HandleRfidEvent((MultiColorSlots *)slot);
-            elif data.component_id == 72:
-                pass
-                #MultiColorSlots::HandleRfidEvent((MultiColorSlots *)slot);
-            elif data.component_id == 73:
-                pass
-                #MultiColorSlots::HandleRfidEvent((MultiColorSlots *)slot);
-            else:
-                self.handleNavBarButtons(data.component_id)
+    @touch(0)
+    def onBack(self, data):
+        self.changePage(ControlPage) #page_to(0x23);
+
+    @touch(1)
+    def onUninstall(self, data):
+        pass
+        #MultiColorSlots::HandleUninstallEvent((MultiColorSlots *)slot);
+
+    @touch(2)
+    def onLoad(self, data):
+        pass
+        #MultiColorSlots::HandleLoadEvent((MultiColorSlots *)slot);
+
+    @touch(3)
+    def onUnload(self, data):
+        pass
+        #MultiColorSlots::HandleUnloadEvent((MultiColorSlots *)slot);
+
+    @touch(4, 5, 6, 7, 8)
+    def onSlotParams(self, data):
+        self.changePage(SlotParamsPage) #page_to(0x75);
+
+    @touch(9, 10, 11, 12, 13)
+    def onSlotOperation(self, data):
+        pass
+        #MultiColorSlots::UpdateSlotOperationUI((MultiColorSlots *)slot,"p5");
+        # ... "p9" for component 13
+
+    @touch(15, 16, 17, 18)
+    def onSelectBox(self, data):
+        pass
+        #MultiColorSlots::SetSelectedSlotIndex((MultiColorSlots *)slot,-1);
+        #MultiColorSlots::SetSelectedBoxIndex((MultiColorSlots *)slot,0);
+        # ... box index 3 for component 18
+
+    @touch(19)
+    def onBoxSettings(self, data):
+        self.changePage(BoxSettingsPage) #page_to(0x85);
+
+    @touch(20)
+    def onShowKeypad(self, data):
+        pass
+        #MultiColorSlots::ControlShowKeypad((MultiColorSlots *)slot,"display");
+
+    @touch(23)
+    def onRetry(self, data):
+        pass
+        #MultiColorSlots::HandleRetryEvent();
+
+    @touch(*range(39, 51))
+    def onKeypad(self, data):
+        pass
+        #MultiColorSlots::HandleKeypadEvent((MultiColorSlots *)slot,0x28);
+        # ... 0x33 for component 50, always component id + 1
+
+    @touch(70, 71, 72, 73)
+    def onRfid(self, data):
+        pass
+        #MultiColorSlots::HandleRfidEvent((MultiColorSlots *)slot);
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class MultiBoxPage(OpenP4Page):
+class MultiBoxPage(NavBarPage):
     @classproperty
     def name(cls) -> str:
         return "multi_box_page"
@@ -4310,189 +3887,85 @@ class MultiBoxPage(OpenP4Page):
     def id(cls) -> int:
         return 115
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                self.changePage(ControlPage) #page_to(0x23);
-            if data.component_id == 1:
-                pass
-                #MultiColorSlots::HandleUninstallEvent((MultiColorSlots *)slot);
-            elif data.component_id == 2:
-                pass
-                #MultiColorSlots::HandleLoadEvent((MultiColorSlots *)slot);
-            elif data.component_id == 3:
-                pass
-                #MultiColorSlots::HandleUnloadEvent((MultiColorSlots *)slot);
-            elif data.component_id == 4:
-                pass
-                #MultiColorSlots::SetSingleSlot((MultiColorSlots *)slot,"a0");
-            elif data.component_id == 5:
-                #MultiColorSlots::GetSelectedBox[abi:cxx11]();
-                #MultiColorSlots::SetMultiColorSlot((MultiColorSlots *)slot,asStack_4b8,1);
-                self.changePage(SlotParamsPage) #page_to(0x75);
-            elif data.component_id == 6:
-                #MultiColorSlots::GetSelectedBox[abi:cxx11]();
-                #MultiColorSlots::SetMultiColorSlot((MultiColorSlots *)slot,asStack_498,2);
-                self.changePage(SlotParamsPage)
-            elif data.component_id == 7:
-                #MultiColorSlots::GetSelectedBox[abi:cxx11]();
-                #MultiColorSlots::SetMultiColorSlot((MultiColorSlots *)slot,asStack_478,3);
-                self.changePage(SlotParamsPage)
-            elif data.component_id == 8:
-                #MultiColorSlots::GetSelectedBox[abi:cxx11]();
-                #MultiColorSlots::SetMultiColorSlot((MultiColorSlots *)slot,asStack_458,4);
-                self.changePage(SlotParamsPage)
-            elif data.component_id == 9:
-                pass
-                #MultiColorSlots::UpdateSlotOperationUI((MultiColorSlots *)slot,"p5");
-            elif data.component_id == 10:
-                pass
-                #MultiColorSlots::UpdateSlotOperationUI((MultiColorSlots *)slot,"p6");
-            elif data.component_id == 11:
-                pass
-                #MultiColorSlots::UpdateSlotOperationUI((MultiColorSlots *)slot,"p7");
-            elif data.component_id == 12:
-                pass
-                #MultiColorSlots::UpdateSlotOperationUI((MultiColorSlots *)slot,"p8");
-            elif data.component_id == 13:
-                pass
-                #MultiColorSlots::UpdateSlotOperationUI((MultiColorSlots *)slot,"p9");
-            elif data.component_id == 15:
-                pass
-                '''
-                iVar9 = MultiColorSlots::GetStatusBox1((MultiColorSlots *)slot);
-                if (iVar9 == 0) {
-                    page_to(0x7a);
-                    MultiColorSlots::GetSelectedBox[abi:cxx11]();
-                            /* try { // try from 0073ae40 to 0073ae43 has its CatchHandler @ 0073ce0c */
-                    MultiColorSlots::SetSelectedBox((MultiColorSlots *)slot,asStack_370);
-                    puVar20 = (undefined4 *)std::__cxx11::string::~string(asStack_370);
-                }
-                else {
-                    std::allocator<char>::allocator();
-                            /* try { // try from 0073ae70 to 0073ae73 has its CatchHandler @ 0073ce30 */
-                    std::__cxx11::string::string<>(asStack_350,"box1",aaStack_330);
-                            /* try { // try from 0073ae84 to 0073ae87 has its CatchHandler @ 0073ce20 */
-                    MultiColorSlots::SetSelectedBox((MultiColorSlots *)slot,asStack_350);
-                    std::__cxx11::string::~string(asStack_350);
-                    std::allocator<char>::~allocator((allocator<char> *)aaStack_330);
-                    puVar20 = (undefined4 *)page_to(0x73);
-                }
-                '''
-            elif data.component_id == 16:
-                pass
-                '''
-                iVar9 = MultiColorSlots::GetStatusBox2((MultiColorSlots *)slot);
-                if (iVar9 == 0) {
-                    page_to(0x7a);
-                    MultiColorSlots::GetSelectedBox[abi:cxx11]();
-                            /* try { // try from 0073aef0 to 0073aef3 has its CatchHandler @ 0073ce44 */
-                    MultiColorSlots::SetSelectedBox((MultiColorSlots *)slot,asStack_328);
-                    puVar20 = (undefined4 *)std::__cxx11::string::~string(asStack_328);
-                }
-                else {
-                    std::allocator<char>::allocator();
-                            /* try { // try from 0073af20 to 0073af23 has its CatchHandler @ 0073ce68 */
-                    std::__cxx11::string::string<>(asStack_308,"box2",aaStack_2e8);
-                            /* try { // try from 0073af34 to 0073af37 has its CatchHandler @ 0073ce58 */
-                    MultiColorSlots::SetSelectedBox((MultiColorSlots *)slot,asStack_308);
-                    std::__cxx11::string::~string(asStack_308);
-                    std::allocator<char>::~allocator((allocator<char> *)aaStack_2e8);
-                    puVar20 = (undefined4 *)page_to(0x73);
-                }
-                '''
-            elif data.component_id == 17:
-                pass
-                '''
-                iVar9 = MultiColorSlots::GetStatusBox3((MultiColorSlots *)slot);
-                if (iVar9 == 0) {
-                    page_to(0x7a);
-                    MultiColorSlots::GetSelectedBox[abi:cxx11]();
-                            /* try { // try from 0073afa0 to 0073afa3 has its CatchHandler @ 0073ce7c */
-                    MultiColorSlots::SetSelectedBox((MultiColorSlots *)slot,asStack_2e0);
-                    puVar20 = (undefined4 *)std::__cxx11::string::~string(asStack_2e0);
-                }
-                else {
-                    std::allocator<char>::allocator();
-                            /* try { // try from 0073afd0 to 0073afd3 has its CatchHandler @ 0073cea0 */
-                    std::__cxx11::string::string<>(asStack_2c0,"box3",aaStack_2a0);
-                            /* try { // try from 0073afe4 to 0073afe7 has its CatchHandler @ 0073ce90 */
-                    MultiColorSlots::SetSelectedBox((MultiColorSlots *)slot,asStack_2c0);
-                    std::__cxx11::string::~string(asStack_2c0);
-                    std::allocator<char>::~allocator((allocator<char> *)aaStack_2a0);
-                    puVar20 = (undefined4 *)page_to(0x73);
-                }
-                '''
-            elif data.component_id == 18:
-                pass
-                '''
-                iVar9 = MultiColorSlots::GetStatusBox4((MultiColorSlots *)slot);
-                if (iVar9 == 0) {
-                    page_to(0x7a);
-                    MultiColorSlots::GetSelectedBox[abi:cxx11]();
-                            /* try { // try from 0073b050 to 0073b053 has its CatchHandler @ 0073ceb4 */
-                    MultiColorSlots::SetSelectedBox((MultiColorSlots *)slot,asStack_298);
-                    puVar20 = (undefined4 *)std::__cxx11::string::~string(asStack_298);
-                }
-                else {
-                    std::allocator<char>::allocator();
-                            /* try { // try from 0073b080 to 0073b083 has its CatchHandler @ 0073ced8 */
-                    std::__cxx11::string::string<>(asStack_278,"box4",aaStack_258);
-                            /* try { // try from 0073b094 to 0073b097 has its CatchHandler @ 0073cec8 */
-                    MultiColorSlots::SetSelectedBox((MultiColorSlots *)slot,asStack_278);
-                    std::__cxx11::string::~string(asStack_278);
-                    std::allocator<char>::~allocator((allocator<char> *)aaStack_258);
-                    puVar20 = (undefined4 *)page_to(0x73);
-                }
-                '''
-            elif data.component_id == 20:
-                pass
-                #MultiColorSlots::ControlShowKeypad((MultiColorSlots *)slot,"display");
-            elif data.component_id == 39:
-                pass
-                #MultiColorSlots::HandleKeypadEvent((MultiColorSlots *)slot,0x28);
-            elif data.component_id == 40:
-                pass
-                #MultiColorSlots::HandleKeypadEvent((MultiColorSlots *)slot,0x29);
-            elif data.component_id == 41:
-                pass
-                #MultiColorSlots::HandleKeypadEvent((MultiColorSlots *)slot,0x2a);
-            elif data.component_id == 42:
-                pass
-                #MultiColorSlots::HandleKeypadEvent((MultiColorSlots *)slot,0x2b);
-            elif data.component_id == 43:
-                pass
-                #MultiColorSlots::HandleKeypadEvent((MultiColorSlots *)slot,0x2c);
-            elif data.component_id == 44:
-                pass
-                #MultiColorSlots::HandleKeypadEvent((MultiColorSlots *)slot,0x2d);
-            elif data.component_id == 45:
-                pass
-                #MultiColorSlots::HandleKeypadEvent((MultiColorSlots *)slot,0x2e);
-            elif data.component_id == 46:
-                pass
-                #MultiColorSlots::HandleKeypadEvent((MultiColorSlots *)slot,0x2f);
-            elif data.component_id == 47:
-                pass
-                #MultiColorSlots::HandleKeypadEvent((MultiColorSlots *)slot,0x30);
-            elif data.component_id == 48:
-                pass
-                #MultiColorSlots::HandleKeypadEvent((MultiColorSlots *)slot,0x31);
-            elif data.component_id == 49:
-                pass
-                #MultiColorSlots::HandleKeypadEvent((MultiColorSlots *)slot,0x32);
-            elif data.component_id == 50:
-                pass
-                #MultiColorSlots::HandleKeypadEvent((MultiColorSlots *)slot,0x33);
-            else:
-                self.handleNavBarButtons(data.component_id)
+    @touch(0)
+    def onBack(self, data):
+        self.changePage(ControlPage) #page_to(0x23);
+
+    @touch(1)
+    def onUninstall(self, data):
+        pass
+        #MultiColorSlots::HandleUninstallEvent((MultiColorSlots *)slot);
+
+    @touch(2)
+    def onLoad(self, data):
+        pass
+        #MultiColorSlots::HandleLoadEvent((MultiColorSlots *)slot);
+
+    @touch(3)
+    def onUnload(self, data):
+        pass
+        #MultiColorSlots::HandleUnloadEvent((MultiColorSlots *)slot);
+
+    @touch(4)
+    def onSingleSlot(self, data):
+        pass
+        #MultiColorSlots::SetSingleSlot((MultiColorSlots *)slot,"a0");
+
+    @touch(5, 6, 7, 8)
+    def onSlotParams(self, data):
+        #MultiColorSlots::GetSelectedBox[abi:cxx11]();
+        #MultiColorSlots::SetMultiColorSlot((MultiColorSlots *)slot,asStack_4b8,1);
+        # ... slot 4 for component 8
+        self.changePage(SlotParamsPage) #page_to(0x75);
+
+    @touch(9, 10, 11, 12, 13)
+    def onSlotOperation(self, data):
+        pass
+        #MultiColorSlots::UpdateSlotOperationUI((MultiColorSlots *)slot,"p5");
+        # ... "p9" for component 13
+
+    @touch(15, 16, 17, 18)
+    def onSelectBox(self, data):
+        pass
+        '''
+        Same for box1 to box4, component 15 to 18:
+
+        iVar9 = MultiColorSlots::GetStatusBox1((MultiColorSlots *)slot);
+        if (iVar9 == 0) {
+            page_to(0x7a);
+            MultiColorSlots::GetSelectedBox[abi:cxx11]();
+                    /* try { // try from 0073ae40 to 0073ae43 has its CatchHandler @ 0073ce0c */
+            MultiColorSlots::SetSelectedBox((MultiColorSlots *)slot,asStack_370);
+            puVar20 = (undefined4 *)std::__cxx11::string::~string(asStack_370);
+        }
+        else {
+            std::allocator<char>::allocator();
+                    /* try { // try from 0073ae70 to 0073ae73 has its CatchHandler @ 0073ce30 */
+            std::__cxx11::string::string<>(asStack_350,"box1",aaStack_330);
+                    /* try { // try from 0073ae84 to 0073ae87 has its CatchHandler @ 0073ce20 */
+            MultiColorSlots::SetSelectedBox((MultiColorSlots *)slot,asStack_350);
+            std::__cxx11::string::~string(asStack_350);
+            std::allocator<char>::~allocator((allocator<char> *)aaStack_330);
+            puVar20 = (undefined4 *)page_to(0x73);
+        }
+        '''
+
+    @touch(20)
+    def onShowKeypad(self, data):
+        pass
+        #MultiColorSlots::ControlShowKeypad((MultiColorSlots *)slot,"display");
+
+    @touch(*range(39, 51))
+    def onKeypad(self, data):
+        pass
+        #MultiColorSlots::HandleKeypadEvent((MultiColorSlots *)slot,0x28);
+        # ... 0x33 for component 50, always component id + 1
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class UserGuidePage(OpenP4Page):
+class UserGuidePage(NavBarPage):
     @classproperty
     def name(cls) -> str:
         return "user_guide"
@@ -4501,21 +3974,19 @@ class UserGuidePage(OpenP4Page):
     def id(cls) -> int:
         return 116
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 1:
-                self.changePage(ControlPage) #page_to(0x23);
-            if data.component_id == 2:
-                self.changePage(ZeroBoxPage) #page_to(0x71);
-            else:
-                self.handleNavBarButtons(data.component_id)
+    @touch(1)
+    def onControl(self, data):
+        self.changePage(ControlPage) #page_to(0x23);
+
+    @touch(2)
+    def onZeroBox(self, data):
+        self.changePage(ZeroBoxPage) #page_to(0x71);
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class SlotParamsPage(OpenP4Page):
+class SlotParamsPage(NavBarPage):
     @classproperty
     def name(cls) -> str:
         return "slot_params"
@@ -4524,26 +3995,28 @@ class SlotParamsPage(OpenP4Page):
     def id(cls) -> int:
         return 117
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 1:
-                self.changePage(VendorSetPage) #page_to(0x76);
-            if data.component_id == 2:
-                self.changePage(FilamentSetPage) #page_to(0x77);
-            if data.component_id == 3:
-                self.changePage(ColorSetPage) #page_to(0x78);
-            if data.component_id == 4:
-                pass
-                #MultiColorSlots::SlotParamsSetConfirm((MultiColorSlots *)slot);
-            else:
-                self.handleNavBarButtons(data.component_id)
+    @touch(1)
+    def onVendorSet(self, data):
+        self.changePage(VendorSetPage) #page_to(0x76);
+
+    @touch(2)
+    def onFilamentSet(self, data):
+        self.changePage(FilamentSetPage) #page_to(0x77);
+
+    @touch(3)
+    def onColorSet(self, data):
+        self.changePage(ColorSetPage) #page_to(0x78);
+
+    @touch(4)
+    def onConfirm(self, data):
+        pass
+        #MultiColorSlots::SlotParamsSetConfirm((MultiColorSlots *)slot);
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class VendorSetPage(OpenP4Page):
+class VendorSetPage(NavBarPage):
     @classproperty
     def name(cls) -> str:
         return "vendor_set"
@@ -4552,19 +4025,13 @@ class VendorSetPage(OpenP4Page):
     def id(cls) -> int:
         return 118
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                pass
-            else:
-                self.handleNavBarButtons(data.component_id)
+    # Not handled yet: 0
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class FilamentSetPage(OpenP4Page):
+class FilamentSetPage(NavBarPage):
     @classproperty
     def name(cls) -> str:
         return "filament_set"
@@ -4573,19 +4040,13 @@ class FilamentSetPage(OpenP4Page):
     def id(cls) -> int:
         return 119
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                pass
-            else:
-                self.handleNavBarButtons(data.component_id)
+    # Not handled yet: 0
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class ColorSetPage(OpenP4Page):
+class ColorSetPage(NavBarPage):
     @classproperty
     def name(cls) -> str:
         return "color_set"
@@ -4594,19 +4055,13 @@ class ColorSetPage(OpenP4Page):
     def id(cls) -> int:
         return 120
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                pass
-            else:
-                self.handleNavBarButtons(data.component_id)
+    # Not handled yet: 0
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class McPrintSetPage(OpenP4Page):
+class McPrintSetPage(NavBarPage):
     @classproperty
     def name(cls) -> str:
         return "mc_print_set"
@@ -4615,19 +4070,13 @@ class McPrintSetPage(OpenP4Page):
     def id(cls) -> int:
         return 121
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                pass
-            else:
-                self.handleNavBarButtons(data.component_id)
+    # Not handled yet: 0
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class UnconnectPopPage(OpenP4Page):
+class UnconnectPopPage(NavBarPage):
     @classproperty
     def name(cls) -> str:
         return "unconnect_pop"
@@ -4636,19 +4085,13 @@ class UnconnectPopPage(OpenP4Page):
     def id(cls) -> int:
         return 122
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                pass
-            else:
-                self.handleNavBarButtons(data.component_id)
+    # Not handled yet: 0
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class VendorPopPage(OpenP4Page):
+class VendorPopPage(NavBarPage):
     @classproperty
     def name(cls) -> str:
         return "vendor_pop"
@@ -4657,19 +4100,13 @@ class VendorPopPage(OpenP4Page):
     def id(cls) -> int:
         return 123
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                pass
-            else:
-                self.handleNavBarButtons(data.component_id)
+    # Not handled yet: 0
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class BoxErrorPopPage(OpenP4Page):
+class BoxErrorPopPage(NavBarPage):
     @classproperty
     def name(cls) -> str:
         return "box_error_pop"
@@ -4678,19 +4115,13 @@ class BoxErrorPopPage(OpenP4Page):
     def id(cls) -> int:
         return 124
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                pass
-            else:
-                self.handleNavBarButtons(data.component_id)
+    # Not handled yet: 0
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class DataPopPage(OpenP4Page):
+class DataPopPage(NavBarPage):
     @classproperty
     def name(cls) -> str:
         return "data_pop"
@@ -4699,19 +4130,13 @@ class DataPopPage(OpenP4Page):
     def id(cls) -> int:
         return 125
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                pass
-            else:
-                self.handleNavBarButtons(data.component_id)
+    # Not handled yet: 0
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class NoFilaPopPage(OpenP4Page):
+class NoFilaPopPage(NavBarPage):
     @classproperty
     def name(cls) -> str:
         return "no_fila_pop"
@@ -4720,19 +4145,13 @@ class NoFilaPopPage(OpenP4Page):
     def id(cls) -> int:
         return 126
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                pass
-            else:
-                self.handleNavBarButtons(data.component_id)
+    # Not handled yet: 0
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class LoadStep1Page(OpenP4Page):
+class LoadStep1Page(NavBarPage):
     @classproperty
     def name(cls) -> str:
         return "load_step1"
@@ -4741,19 +4160,13 @@ class LoadStep1Page(OpenP4Page):
     def id(cls) -> int:
         return 127
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                pass
-            else:
-                self.handleNavBarButtons(data.component_id)
+    # Not handled yet: 0
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class LoadStep2Page(OpenP4Page):
+class LoadStep2Page(NavBarPage):
     @classproperty
     def name(cls) -> str:
         return "load_step2"
@@ -4762,19 +4175,13 @@ class LoadStep2Page(OpenP4Page):
     def id(cls) -> int:
         return 128
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                pass
-            else:
-                self.handleNavBarButtons(data.component_id)
+    # Not handled yet: 0
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class BoxUnlinkPopPage(OpenP4Page):
+class BoxUnlinkPopPage(NavBarPage):
     @classproperty
     def name(cls) -> str:
         return "box_unlink_pop"
@@ -4783,19 +4190,13 @@ class BoxUnlinkPopPage(OpenP4Page):
     def id(cls) -> int:
         return 129
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                pass
-            else:
-                self.handleNavBarButtons(data.component_id)
+    # Not handled yet: 0
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class BoxLinkPopPage(OpenP4Page):
+class BoxLinkPopPage(NavBarPage):
     @classproperty
     def name(cls) -> str:
         return "box_link_pop"
@@ -4804,19 +4205,13 @@ class BoxLinkPopPage(OpenP4Page):
     def id(cls) -> int:
         return 130
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                pass
-            else:
-                self.handleNavBarButtons(data.component_id)
+    # Not handled yet: 0
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class BoxUpdatePopPage(OpenP4Page):
+class BoxUpdatePopPage(NavBarPage):
     @classproperty
     def name(cls) -> str:
         return "box_update_pop"
@@ -4825,19 +4220,13 @@ class BoxUpdatePopPage(OpenP4Page):
     def id(cls) -> int:
         return 131
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                pass
-            else:
-                self.handleNavBarButtons(data.component_id)
+    # Not handled yet: 0
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class LoadErrorPopPage(OpenP4Page):
+class LoadErrorPopPage(NavBarPage):
     @classproperty
     def name(cls) -> str:
         return "load_error_pop"
@@ -4846,19 +4235,13 @@ class LoadErrorPopPage(OpenP4Page):
     def id(cls) -> int:
         return 132
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                pass
-            else:
-                self.handleNavBarButtons(data.component_id)
+    # Not handled yet: 0
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class BoxSettingsPage(OpenP4Page):
+class BoxSettingsPage(NavBarPage):
     @classproperty
     def name(cls) -> str:
         return "box_setting"
@@ -4867,19 +4250,13 @@ class BoxSettingsPage(OpenP4Page):
     def id(cls) -> int:
         return 133
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                pass
-            else:
-                self.handleNavBarButtons(data.component_id)
+    # Not handled yet: 0
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class FilaNotMatchPage(OpenP4Page):
+class FilaNotMatchPage(NavBarPage):
     @classproperty
     def name(cls) -> str:
         return "fila_not_match"
@@ -4888,19 +4265,13 @@ class FilaNotMatchPage(OpenP4Page):
     def id(cls) -> int:
         return 134
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                pass
-            else:
-                self.handleNavBarButtons(data.component_id)
+    # Not handled yet: 0
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class BoxDryingPage(OpenP4Page):
+class BoxDryingPage(NavBarPage):
     @classproperty
     def name(cls) -> str:
         return "box_drying"
@@ -4909,19 +4280,13 @@ class BoxDryingPage(OpenP4Page):
     def id(cls) -> int:
         return 135
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                pass
-            else:
-                self.handleNavBarButtons(data.component_id)
+    # Not handled yet: 0
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class DryingInspPage(OpenP4Page):
+class DryingInspPage(NavBarPage):
     @classproperty
     def name(cls) -> str:
         return "drying_insp"
@@ -4930,19 +4295,13 @@ class DryingInspPage(OpenP4Page):
     def id(cls) -> int:
         return 136
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                pass
-            else:
-                self.handleNavBarButtons(data.component_id)
+    # Not handled yet: 0
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
 
 
-class Page0Page(OpenP4Page):
+class Page0Page(NavBarPage):
     @classproperty
     def name(cls) -> str:
         return "page0"
@@ -4951,13 +4310,7 @@ class Page0Page(OpenP4Page):
     def id(cls) -> int:
         return 137
 
-    async def onDisplayEvent(self, type: EventType, data):
-        if type == EventType.TOUCH:
-            self.handleScreenSleep(data.page_id)
-            if data.component_id == 0:
-                pass
-            else:
-                self.handleNavBarButtons(data.component_id)
+    # Not handled yet: 0
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -4990,7 +4343,7 @@ class FilamentPage(OpenP4Page):
             if data.component_id == 23:
                 self.changePage(ControlPage)
             else:
-                self.handleNavBarButtons(data.component_id)
+                await self.dispatchTouch(data)
 
     async def onPrinterStatusUpdate(self, data: dict):
         await self.state.display.set(
@@ -5032,7 +4385,7 @@ class CalibrationPage(OpenP4Page):
             if data.component_id == 23:
                 self.changePage(SettingsPage)
             else:
-                self.handleNavBarButtons(data.component_id)
+                await self.dispatchTouch(data)
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -5066,7 +4419,7 @@ class PrintingPage2(OpenP4Page):
             if data.component_id == 0:
                 self.changePage(PrintingPage)
             else:
-                self.handleNavBarButtons(data.component_id)
+                await self.dispatchTouch(data)
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -5124,7 +4477,7 @@ class KeypadPage(OpenP4Page):
                 self.changePage(self.state.return_page)
                 self.state.return_page = None  # Clear return page
             else:
-                self.handleNavBarButtons(data.component_id)
+                await self.dispatchTouch(data)
 
     async def onPrinterStatusUpdate(self, data: dict):
         pass
@@ -16,11 +16,14 @@ You should have received a copy of the GNU General Public License along with
 klipmi. If not, see <https://www.gnu.org/licenses/>. 
 """
 
-from .utils import updateNestedDict, classproperty
-from .libcolpic import parseThumbnail
+from .utils import updateNestedDict, updateStatus, classproperty
+from .libcolpic import decodeThumbnail, parseThumbnail, streamThumbnail
 
 __all__ = [
     "classproperty",
     "updateNestedDict",
+    "updateStatus",
+    "decodeThumbnail",
     "parseThumbnail",
+    "streamThumbnail",
 ]
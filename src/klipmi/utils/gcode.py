@@ -0,0 +1,81 @@
+"""
+Copyright 2024 Joe Maples <joe@maples.dev>
+
+This file is part of klipmi.
+
+klipmi is free software: you can redistribute it and/or modify it under the
+terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+klipmi is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+klipmi. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import base64
+import mmap
+import os
+import re
+
+from typing import Dict, List
+
+# Slicers write the thumbnails before the first move, only this much of the
+# file is searched
+HEADER_SIZE = 1024 * 1024
+THUMBNAIL_BEGIN = re.compile(
+    rb"^; (thumbnail(?:_[A-Z]+)?) begin (\d+)x(\d+) (\d+)\r?$", re.MULTILINE
+)
+
+
+def bestFit(thumbnails: List[Dict], size: int) -> Dict | None:
+    """
+    Smallest thumbnail at least `size` pixels wide, or the largest one if
+    all of them are smaller.
+    """
+    larger = [t for t in thumbnails if t["width"] >= size]
+    if larger:
+        return min(larger, key=lambda t: t["width"])
+    return max(thumbnails, key=lambda t: t["width"], default=None)
+
+
+def findThumbnails(data: bytes | mmap.mmap, limit: int = HEADER_SIZE) -> List[Dict]:
+    # Position of the base64 data of every thumbnail block in the header
+    thumbnails = []
+    for match in THUMBNAIL_BEGIN.finditer(data, 0, limit):
+        tag = match.group(1)
+        end = data.find(b"; %s end" % tag, match.end(), limit)
+        if end < 0:
+            continue
+        thumbnails.append(
+            {
+                "width": int(match.group(2)),
+                "height": int(match.group(3)),
+                "size": int(match.group(4)),
+                "start": match.end(),
+                "end": end,
+            }
+        )
+    return thumbnails
+
+
+def readThumbnail(path: str, size: int) -> bytes | None:
+    """
+    Image data of the thumbnail embedded in the gcode file at `path` that
+    fits `size` best, None if the file has none.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Only the pages holding the header and the chosen block are read
+            thumbnail = bestFit(findThumbnails(mm), size)
+            if thumbnail is None:
+                return None
+            lines = mm[thumbnail["start"] : thumbnail["end"]].splitlines()
+
+    data = b"".join(line.lstrip(b"; ").strip() for line in lines)
+    return base64.b64decode(data)
@@ -3,45 +3,77 @@
 
 
 from array import array
-from PIL import ImageColor
+from PIL import Image, ImageColor
+from typing import Dict, Iterator, Tuple
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Block size of runCodes(), in pixels with numpy and in bytes without. Has
+# to hold a full run of 255 pixels
+RUN_WINDOW = 16384
+
+
+def imageToColor16(img, background) -> array:
+    """
+    Blends the RGBA image onto the background and packs it into RGB565,
+    row by row. Uses numpy when available.
+    """
+    if img.mode != "RGBA":
+        img = img.convert("RGBA")
+    if numpy is None:
+        return imageToColor16Python(img, background)
+    return imageToColor16Numpy(img, background)
+
+
+def imageToColor16Python(img, background) -> array:
+    pixels = img.load()
+    color16 = array("H")
+    for y in range(img.size[1]):  # for every pixel:
+        for x in range(img.size[0]):
+            pixel_color = pixels[x, y]
+            if pixel_color[3] < 255:
+                alpha = pixel_color[3] / 255
+                pixel_color = (
+                    int(pixel_color[0] * alpha + (1 - alpha) * background[0]),
+                    int(pixel_color[1] * alpha + (1 - alpha) * background[1]),
+                    int(pixel_color[2] * alpha + (1 - alpha) * background[2]),
+                )
+            r = pixel_color[0] >> 3
+            g = pixel_color[1] >> 2
+            b = pixel_color[2] >> 3
+            rgb = (r << 11) | (g << 5) | b
+            color16.append(rgb)
+    return color16
+
+
+def imageToColor16Numpy(img, background) -> array:
+    pixels = numpy.asarray(img, dtype=numpy.uint8).reshape(-1, 4)
+    rgb = pixels[:, :3].astype(numpy.int64)
+
+    # Same float64 operations in the same order as the pure Python path, so
+    # the truncated results match bit for bit
+    translucent = pixels[:, 3] < 255
+    if translucent.any():
+        alpha = pixels[translucent, 3:4] / 255
+        blended = rgb[translucent] * alpha + (1 - alpha) * numpy.array(
+            background[:3], dtype=numpy.float64
+        )
+        rgb[translucent] = blended.astype(numpy.int64)
+
+    packed = ((rgb[:, 0] >> 3) << 11) | ((rgb[:, 1] >> 2) << 5) | (rgb[:, 2] >> 3)
+    color16 = array("H")
+    color16.frombytes(packed.astype("=u2").tobytes())
+    return color16
 
 
 def parseThumbnail(img, width, height, default_background) -> str:
     img.thumbnail((width, height))
-    pixels = img.load()
-    result = ""
     img_size = img.size
-    color16 = array("H")
-    default_background = ImageColor.getcolor(
-        (
-            default_background
-            if default_background.startswith("#")
-            else "#" + default_background
-        ),
-        "RGB",
-    )
     try:
-        for i in range(img.size[0]):  # for every pixel:
-            for j in range(img.size[1]):
-                pixel_color = pixels[j, i]
-                if pixel_color[3] < 255:
-                    alpha = pixel_color[3] / 255
-                    pixel_color = (
-                        int(
-                            pixel_color[0] * alpha + (1 - alpha) * default_background[0]
-                        ),
-                        int(
-                            pixel_color[1] * alpha + (1 - alpha) * default_background[1]
-                        ),
-                        int(
-                            pixel_color[2] * alpha + (1 - alpha) * default_background[2]
-                        ),
-                    )
-                r = pixel_color[0] >> 3
-                g = pixel_color[1] >> 2
-                b = pixel_color[2] >> 3
-                rgb = (r << 11) | (g << 5) | b
-                color16.append(rgb)
+        color16 = imageToColor16(img, thumbnailBackground(default_background))
         output_data = bytearray(img_size[0] * img_size[1] * 10)
         ColPic_EncodeStr(
             color16,
@@ -52,16 +84,33 @@ def parseThumbnail(img, width, height, default_background) -> str:
             1024,
         )
 
-        j = 0
-        for i in range(len(output_data)):
-            if output_data[i] != 0:
-                result += chr(output_data[i])
-                j += 1
-
     except Exception as e:
         raise e
 
-    return result
+    return output_data.replace(b"\0", b"").decode("latin-1")
+
+
+def streamThumbnail(
+    img, width, height, default_background, chunksize=1024
+) -> Iterator[str]:
+    """
+    Same text as parseThumbnail(), yielded in chunks of `chunksize`
+    characters while it is encoded.
+    """
+    img.thumbnail((width, height))
+    color16 = imageToColor16(img, thumbnailBackground(default_background))
+    return ColPicEncodeStream(color16, img.size[0], img.size[1], 1024, chunksize)
+
+
+def thumbnailBackground(default_background) -> Tuple[int, int, int]:
+    return ImageColor.getcolor(
+        (
+            default_background
+            if default_background.startswith("#")
+            else "#" + default_background
+        ),
+        "RGB",
+    )
 
 
 def ColPic_EncodeStr(
@@ -118,58 +167,93 @@ def ColPic_EncodeStr(
     return qty
 
 
+def ColPicEncodeStream(
+    fromcolor16, picw, pich, colorsmax, chunksize=1024
+) -> Iterator[str]:
+    """
+    Streaming ColPic_EncodeStr() without an output size limit. The size of
+    the run codes goes into the header, so they are counted in a first pass
+    and encoded again while the text is yielded.
+    """
+    dotsqty = picw * pich
+    Listu16, palette, lookup, enqty = colPicPlan(fromcolor16, dotsqty, colorsmax)
+
+    pending = bytearray(colPicHeader(picw, pich, len(Listu16), enqty))
+    for val in Listu16:
+        pending.append(val & 255)
+        pending.append((val & 65280) >> 8)
+
+    # Every 3 bytes become 4 characters, so chunks are cut at whole groups
+    chunkbytes = max(chunksize // 4, 1) * 3
+    for block in runCodes(fromcolor16, dotsqty, palette, lookup):
+        pending += block
+        while len(pending) >= chunkbytes:
+            yield encodeText(pending[:chunkbytes])
+            del pending[:chunkbytes]
+
+    pending += bytes(3 - len(pending) % 3)
+    while pending:
+        yield encodeText(pending[:chunkbytes])
+        del pending[:chunkbytes]
+
+
+def colPicPlan(
+    fromcolor16, dotsqty, colorsmax
+) -> Tuple[array, Dict[int, int], object, int]:
+    # Palette, palette index, its lookup table and size of the run codes
+    if colorsmax > 1024:
+        colorsmax = 1024
+    Listu16 = colorPalette(fromcolor16, dotsqty, 1024)
+    if len(Listu16) > colorsmax:
+        Listu16 = reducePalette(fromcolor16, dotsqty, Listu16, colorsmax)
+    palette: Dict[int, int] = {}
+    for i, val in enumerate(Listu16):
+        palette.setdefault(val, i)
+
+    lookup = paletteLookup(palette)
+    enqty = 0
+    for block in runCodes(fromcolor16, dotsqty, palette, lookup):
+        enqty += len(block)
+    return Listu16, palette, lookup, enqty
+
+
+def colPicHeader(picw, pich, listqty, enqty) -> bytes:
+    head = bytearray(32)
+    head[0] = 3
+    head[4:8] = picw.to_bytes(4, "little")
+    head[8:12] = pich.to_bytes(4, "little")
+    head[12:16] = (98419516).to_bytes(4, "little")
+    head[16:20] = (listqty * 2).to_bytes(4, "little")
+    head[20:24] = enqty.to_bytes(4, "little")
+    return bytes(head)
+
+
+def encodeText(data) -> str:
+    # 6 bits per character offset by 48, with the backslash replaced by ~
+    text = bytearray(len(data) // 3 * 4)
+    for i in range(0, len(data) - 2, 3):
+        j = i // 3 * 4
+        text[j] = (data[i] >> 2) + 48
+        text[j + 1] = ((data[i] & 3) << 4) + (data[i + 1] >> 4) + 48
+        text[j + 2] = ((data[i + 1] & 15) << 2) + (data[i + 2] >> 6) + 48
+        text[j + 3] = (data[i + 2] & 63) + 48
+    return text.replace(b"\\", b"~").decode("ascii")
+
+
 def ColPicEncode(
     fromcolor16, picw, pich, outputdata: bytearray, outputmaxtsize, colorsmax
 ):
-    l0 = U16HEAD()
     Head0 = ColPicHead3()
-    Listu16 = []
-    for _ in range(1024):
-        Listu16.append(U16HEAD())
-
-    ListQty = 0
     enqty = 0
     dotsqty = picw * pich
     if colorsmax > 1024:
         colorsmax = 1024
-    for i in range(dotsqty):
-        ListQty = ADList0(fromcolor16[i], Listu16, ListQty, 1024)
-
-    for index in range(1, ListQty):
-        l0 = Listu16[index]
-        for i in range(index):
-            if l0.qty >= Listu16[i].qty:
-                aListu16 = Listu16.copy()
-                for j in range(index - i):
-                    Listu16[i + j + 1] = aListu16[i + j]
+    Listu16 = colorPalette(fromcolor16, dotsqty, 1024)
+    ListQty = len(Listu16)
 
-                Listu16[i] = l0
-                break
-
-    while ListQty > colorsmax:
-        l0 = Listu16[ListQty - 1]
-        minval = 255
-        fid = -1
-        for i in range(colorsmax):
-            cha0 = Listu16[i].A0 - l0.A0
-            if cha0 < 0:
-                cha0 = 0 - cha0
-            cha1 = Listu16[i].A1 - l0.A1
-            if cha1 < 0:
-                cha1 = 0 - cha1
-            cha2 = Listu16[i].A2 - l0.A2
-            if cha2 < 0:
-                cha2 = 0 - cha2
-            chall = cha0 + cha1 + cha2
-            if chall < minval:
-                minval = chall
-                fid = i
-
-        for i in range(dotsqty):
-            if fromcolor16[i] == l0.colo16:
-                fromcolor16[i] = Listu16[fid].colo16
-
-        ListQty = ListQty - 1
+    if ListQty > colorsmax:
+        Listu16 = reducePalette(fromcolor16, dotsqty, Listu16, colorsmax)
+        ListQty = colorsmax
 
     for n in range(len(outputdata)):
         outputdata[n] = 0
@@ -189,8 +273,8 @@ def ColPicEncode(
     outputdata[19] = (ListQty * 2 & 4278190080) >> 24
     sizeofColPicHead3 = 32
     for i in range(ListQty):
-        outputdata[sizeofColPicHead3 + i * 2 + 1] = (Listu16[i].colo16 & 65280) >> 8
-        outputdata[sizeofColPicHead3 + i * 2 + 0] = Listu16[i].colo16 & 255
+        outputdata[sizeofColPicHead3 + i * 2 + 1] = (Listu16[i] & 65280) >> 8
+        outputdata[sizeofColPicHead3 + i * 2 + 0] = Listu16[i] & 255
 
     enqty = Byte8bitEncode(
         fromcolor16,
@@ -219,25 +303,95 @@ def ColPicEncode(
     return sizeofColPicHead3 + Head0.ListDataSize + Head0.ColorDataSize
 
 
-def ADList0(val, Listu16, ListQty, maxqty):
-    qty = ListQty
-    if qty >= maxqty:
-        return ListQty
-    for i in range(qty):
-        if Listu16[i].colo16 == val:
-            Listu16[i].qty += 1
-            return ListQty
+def reducePalette(fromcolor16, dotsqty, palette, colorsmax) -> array:
+    """
+    Maps the pixels of every palette color past `colorsmax` to the kept color
+    closest by summed channel distance, the first one on ties, in one pass
+    over the pixels. Returns the kept palette.
+    """
+    if numpy is None:
+        return reducePalettePython(fromcolor16, dotsqty, palette, colorsmax)
+    return reducePaletteNumpy(fromcolor16, dotsqty, palette, colorsmax)
 
-    A0 = val >> 11 & 31
-    A1 = (val & 2016) >> 5
-    A2 = val & 31
-    Listu16[qty].colo16 = val
-    Listu16[qty].A0 = A0
-    Listu16[qty].A1 = A1
-    Listu16[qty].A2 = A2
-    Listu16[qty].qty = 1
-    ListQty = qty + 1
-    return ListQty
+
+def reducePalettePython(fromcolor16, dotsqty, palette, colorsmax) -> array:
+    kept = [colorChannels(val) for val in palette[:colorsmax]]
+    nearest: Dict[int, int] = {}
+    for val in palette[colorsmax:]:
+        A0, A1, A2 = colorChannels(val)
+        minval = 255
+        fid = -1
+        for i, (B0, B1, B2) in enumerate(kept):
+            chall = abs(B0 - A0) + abs(B1 - A1) + abs(B2 - A2)
+            if chall < minval:
+                minval = chall
+                fid = i
+        nearest[val] = palette[fid]
+
+    for i in range(dotsqty):
+        val = fromcolor16[i]
+        if val in nearest:
+            fromcolor16[i] = nearest[val]
+    return palette[:colorsmax]
+
+
+def reducePaletteNumpy(fromcolor16, dotsqty, palette, colorsmax) -> array:
+    colors = numpy.asarray(palette, dtype=numpy.uint16)
+    channels = numpy.stack(colorChannels(colors.astype(numpy.int32)), axis=1)
+    kept, removed = channels[:colorsmax], channels[colorsmax:]
+    distance = numpy.abs(removed[:, None, :] - kept[None, :, :]).sum(axis=2)
+
+    # argmin picks the first of equally close colors, like the scan did
+    lookup = numpy.arange(65536, dtype=numpy.uint16)
+    lookup[colors[colorsmax:]] = colors[numpy.argmin(distance, axis=1)]
+    pixels = numpy.asarray(fromcolor16, dtype=numpy.uint16)[:dotsqty]
+    fromcolor16[:dotsqty] = array("H", lookup[pixels].tobytes())
+    return palette[:colorsmax]
+
+
+def colorChannels(val) -> Tuple[int, int, int]:
+    return val >> 11 & 31, (val & 2016) >> 5, val & 31
+
+
+def colorPalette(fromcolor16, dotsqty, maxqty) -> array:
+    """
+    Colors of the first `dotsqty` pixels by descending frequency. Like the
+    list the encoder always built, counting stops once `maxqty` colors are
+    known and ties are ordered by later first appearance first.
+    """
+    if numpy is None:
+        return colorPalettePython(fromcolor16, dotsqty, maxqty)
+    return colorPaletteNumpy(fromcolor16, dotsqty, maxqty)
+
+
+def colorPalettePython(fromcolor16, dotsqty, maxqty) -> array:
+    # Insertion ordered, so the position is the order of first appearance
+    counts: Dict[int, int] = {}
+    for i in range(dotsqty):
+        val = fromcolor16[i]
+        if val in counts:
+            counts[val] += 1
+        else:
+            counts[val] = 1
+            if len(counts) >= maxqty:
+                break
+
+    colors = list(counts.items())
+    order = sorted(range(len(colors)), key=lambda i: (-colors[i][1], -i))
+    return array("H", [colors[i][0] for i in order])
+
+
+def colorPaletteNumpy(fromcolor16, dotsqty, maxqty) -> array:
+    pixels = numpy.asarray(fromcolor16, dtype=numpy.uint16)[:dotsqty]
+    colors, first = numpy.unique(pixels, return_index=True)
+    if len(colors) > maxqty:
+        # Count up to the pixel that brought in the last known color
+        pixels = pixels[: numpy.sort(first)[maxqty - 1] + 1]
+    colors, first, counts = numpy.unique(
+        pixels, return_index=True, return_counts=True
+    )
+    order = numpy.lexsort((-first, -counts))
+    return array("H", colors[order].tobytes())
 
 
 def Byte8bitEncode(
@@ -249,85 +403,223 @@ def Byte8bitEncode(
     outputdataIndex,
     decMaxBytesize,
 ):
-    listu16 = outputdata
-    dots = 0
-    srcindex = 0
+    """
+    Writes the run codes of the pixels to `outputdata`, see runCodes().
+    Output stops at `decMaxBytesize` bytes.
+    """
+    palette = paletteIndex(outputdata, listu16Index, listqty)
     decindex = 0
+    for block in runCodes(fromcolor16, dotsqty, palette):
+        size = min(len(block), decMaxBytesize - decindex)
+        if size <= 0:
+            break
+        start = outputdataIndex + decindex
+        outputdata[start : start + size] = block[:size]
+        decindex += size
+    return decindex
+
+
+def paletteIndex(outputdata, listu16Index, listqty) -> Dict[int, int]:
+    palette: Dict[int, int] = {}
+    for i in range(listqty):
+        aa = outputdata[i * 2 + 1 + listu16Index] << 8
+        aa |= outputdata[i * 2 + 0 + listu16Index]
+        palette.setdefault(aa, i)
+    return palette
+
+
+def runCodes(
+    fromcolor16, dotsqty, palette: Dict[int, int], lookup=None
+) -> Iterator[bytes]:
+    """
+    Run-length encodes the pixels as indices into `palette`, yielding the
+    codes in blocks. Indices are sent as 5 bits, preceded by a
+    (7 << 5) + index / 32 byte whenever the upper part changes. Runs of up
+    to 6 pixels share the byte with the index, longer ones get a byte of
+    their own and runs are split at 255 pixels. Colors missing from the
+    palette are encoded as the first one.
+
+    `lookup` is the paletteLookup() of `palette`, passed in by callers that
+    encode the same image more than once.
+    """
+    if numpy is None:
+        return runCodesPython(fromcolor16, dotsqty, palette)
+    return runCodesNumpy(fromcolor16, dotsqty, palette, lookup)
+
+
+def paletteLookup(palette: Dict[int, int]):
+    # Palette index of every RGB565 color, None without numpy
+    if numpy is None:
+        return None
+    lookup = numpy.zeros(65536, dtype=numpy.uint16)
+    lookup[numpy.fromiter(palette.keys(), numpy.uint16, len(palette))] = (
+        numpy.fromiter(palette.values(), numpy.uint16, len(palette))
+    )
+    return lookup
+
+
+def runCodesPython(fromcolor16, dotsqty, palette: Dict[int, int]) -> Iterator[bytes]:
+    block = bytearray()
     lastid = 0
-    temp = 0
-    while dotsqty > 0:
+    srcindex = 0
+    while srcindex < dotsqty:
+        color = fromcolor16[srcindex]
         dots = 1
-        for i in range(dotsqty - 1):
-            if fromcolor16[srcindex + i] != fromcolor16[srcindex + i + 1]:
-                break
+        while (
+            dots < 255
+            and srcindex + dots < dotsqty
+            and fromcolor16[srcindex + dots] == color
+        ):
             dots += 1
-            if dots == 255:
-                break
-
-        temp = 0
-        for i in range(listqty):
-            aa = listu16[i * 2 + 1 + listu16Index] << 8
-            aa |= listu16[i * 2 + 0 + listu16Index]
-            if aa == fromcolor16[srcindex]:
-                temp = i
-                break
+        srcindex += dots
 
-        tid = int(temp % 32)
-        if tid > 255:
-            tid = 255
-        sid = int(temp / 32)
-        if sid > 255:
-            sid = 255
+        temp = palette.get(color, 0)
+        tid = temp % 32
+        sid = temp // 32
         if lastid != sid:
-            if decindex >= decMaxBytesize:
-                dotsqty = 0
-                break
-            outputdata[decindex + outputdataIndex] = 7
-            outputdata[decindex + outputdataIndex] <<= 5
-            outputdata[decindex + outputdataIndex] += sid
-            decindex += 1
+            block.append((7 << 5) + sid)
             lastid = sid
         if dots <= 6:
-            if decindex >= decMaxBytesize:
-                dotsqty = 0
-                break
-            aa = dots
-            if aa > 255:
-                aa = 255
-            outputdata[decindex + outputdataIndex] = aa
-            outputdata[decindex + outputdataIndex] <<= 5
-            outputdata[decindex + outputdataIndex] += tid
-            decindex += 1
+            block.append((dots << 5) + tid)
         else:
-            if decindex >= decMaxBytesize:
-                dotsqty = 0
-                break
-            outputdata[decindex + outputdataIndex] = 0
-            outputdata[decindex + outputdataIndex] += tid
-            decindex += 1
-            if decindex >= decMaxBytesize:
-                dotsqty = 0
-                break
-            aa = dots
-            if aa > 255:
-                aa = 255
-            outputdata[decindex + outputdataIndex] = aa
-            decindex += 1
-        srcindex += dots
-        dotsqty -= dots
+            block.append(tid)
+            block.append(dots)
 
-    return decindex
+        if len(block) >= RUN_WINDOW:
+            yield bytes(block)
+            block.clear()
+    if block:
+        yield bytes(block)
 
 
-class U16HEAD:
-    def __init__(self):
-        self.colo16 = 0
-        self.A0 = 0
-        self.A1 = 0
-        self.A2 = 0
-        self.res0 = 0
-        self.res1 = 0
-        self.qty = 0
+def runCodesNumpy(
+    fromcolor16, dotsqty, palette: Dict[int, int], lookup=None
+) -> Iterator[bytes]:
+    pixels = numpy.asarray(fromcolor16, dtype=numpy.uint16)[:dotsqty]
+    if lookup is None:
+        lookup = paletteLookup(palette)
+
+    lastid = 0
+    srcindex = 0
+    while srcindex < dotsqty:
+        window = pixels[srcindex : srcindex + RUN_WINDOW]
+        starts = numpy.flatnonzero(numpy.diff(window)) + 1
+        starts = numpy.concatenate(([0], starts))
+        end = len(window)
+        if srcindex + end < dotsqty:
+            # The last run may go on in the next window, leave it for then
+            # unless it fills the whole window
+            if len(starts) > 1:
+                end = int(starts[-1])
+                starts = starts[:-1]
+            else:
+                end = end // 255 * 255
+
+        # Runs of equal pixels, split every 255 pixels
+        lengths = numpy.diff(numpy.append(starts, end))
+        chunks = (lengths + 254) // 255
+        colors = numpy.repeat(window[starts], chunks)
+        dots = numpy.full(len(colors), 255, dtype=numpy.int64)
+        dots[numpy.cumsum(chunks) - 1] = lengths - (chunks - 1) * 255
+
+        temp = lookup[colors]
+        tid = temp % 32
+        sid = temp // 32
+        marker = sid != numpy.concatenate(([lastid], sid[:-1]))
+        short = dots <= 6
+
+        # Every run takes an optional marker byte and one or two bytes
+        sizes = marker.astype(numpy.int64) + numpy.where(short, 1, 2)
+        offsets = numpy.cumsum(sizes) - sizes
+        encoded = numpy.empty(int(sizes.sum()), dtype=numpy.uint8)
+        encoded[offsets[marker]] = (7 << 5) + sid[marker]
+        first = offsets + marker
+        encoded[first] = numpy.where(short, (dots << 5) + tid, tid)
+        encoded[first[~short] + 1] = dots[~short]
+
+        lastid = int(sid[-1])
+        srcindex += end
+        yield encoded.tobytes()
+
+
+def decodeThumbnail(text: str):
+    """
+    Renders the text sent to the panel back into an RGB Pillow image, the
+    way the panel shows it.
+    """
+    picw, pich, color16 = ColPicDecode(ColPicDecodeStr(text))
+    rgb = bytearray(len(color16) * 3)
+    for i, val in enumerate(color16):
+        rgb[i * 3] = (val >> 11 & 31) << 3
+        rgb[i * 3 + 1] = (val >> 5 & 63) << 2
+        rgb[i * 3 + 2] = (val & 31) << 3
+    return Image.frombytes("RGB", (picw, pich), bytes(rgb))
+
+
+def ColPicDecodeStr(text: str) -> bytes:
+    # Reverse of the text step of ColPic_EncodeStr(), padding included
+    data = text.replace("~", "\\").encode("ascii")
+    if len(data) % 4 != 0:
+        raise ValueError("ColPic text of %d characters is cut short" % len(data))
+    output = bytearray(len(data) // 4 * 3)
+    for i in range(0, len(data), 4):
+        a, b, c, d = [value - 48 for value in data[i : i + 4]]
+        if min(a, b, c, d) < 0 or max(a, b, c, d) > 63:
+            raise ValueError("invalid ColPic character at %d" % i)
+        j = i // 4 * 3
+        output[j] = (a << 2) | (b >> 4)
+        output[j + 1] = ((b & 15) << 4) | (c >> 2)
+        output[j + 2] = ((c & 3) << 6) | d
+    return bytes(output)
+
+
+def ColPicDecode(data: bytes) -> Tuple[int, int, array]:
+    """
+    Reverse of ColPicEncode(). Returns the width, the height and the pixels
+    in RGB565.
+    """
+    if len(data) < 32:
+        raise ValueError("ColPic data of %d bytes has no header" % len(data))
+    encodever = data[0]
+    picw = int.from_bytes(data[4:8], "little")
+    pich = int.from_bytes(data[8:12], "little")
+    mark = int.from_bytes(data[12:16], "little")
+    listsize = int.from_bytes(data[16:20], "little")
+    enqty = int.from_bytes(data[20:24], "little")
+    if encodever != 3 or mark != 98419516:
+        raise ValueError("not a version 3 ColPic header")
+    if 32 + listsize + enqty > len(data):
+        raise ValueError("ColPic data is cut short")
+
+    palette = [data[32 + i] | data[33 + i] << 8 for i in range(0, listsize - 1, 2)]
+    color16 = array("H")
+    dotsqty = picw * pich
+    sid = 0
+    srcindex = 32 + listsize
+    end = srcindex + enqty
+    while srcindex < end and len(color16) < dotsqty:
+        code = data[srcindex]
+        srcindex += 1
+        if code >> 5 == 7:
+            sid = code & 31
+            continue
+        if code >> 5 == 0:
+            if srcindex >= end:
+                raise ValueError("ColPic run is cut short")
+            dots = data[srcindex]
+            srcindex += 1
+        else:
+            dots = code >> 5
+        index = sid * 32 + (code & 31)
+        if index >= len(palette):
+            raise ValueError("ColPic palette index %d out of range" % index)
+        color16.extend([palette[index]] * dots)
+
+    if len(color16) != dotsqty:
+        raise ValueError(
+            "ColPic data has %d pixels instead of %d" % (len(color16), dotsqty)
+        )
+    return picw, pich, color16
 
 
 class ColPicHead3:
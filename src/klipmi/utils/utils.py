@@ -18,6 +18,8 @@ klipmi. If not, see <https://www.gnu.org/licenses/>.
 
 import collections.abc
 
+from typing import Set, Tuple
+
 
 def updateNestedDict(d, u):
     for k, v in u.items():
@@ -28,6 +30,31 @@ def updateNestedDict(d, u):
     return d
 
 
+def updateStatus(status: dict, delta: dict) -> Set[Tuple[str, str]]:
+    """
+    Merges a Moonraker status delta into `status` and returns the
+    (object, field) paths whose value actually changed.
+    """
+    changes: Set[Tuple[str, str]] = set()
+    for name, fields in delta.items():
+        current = status.setdefault(name, {})
+        for field, value in fields.items():
+            old = current.get(field)
+            if isinstance(value, collections.abc.Mapping):
+                if not isinstance(old, collections.abc.Mapping) or any(
+                    old.get(k) != v for k, v in value.items()
+                ):
+                    changes.add((name, field))
+                current[field] = updateNestedDict(
+                    old if isinstance(old, collections.abc.Mapping) else {}, value
+                )
+            else:
+                if field not in current or old != value:
+                    changes.add((name, field))
+                current[field] = value
+    return changes
+
+
 # Taken from https://stackoverflow.com/a/76301341
 class classproperty:
     def __init__(self, func):
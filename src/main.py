@@ -18,14 +18,19 @@ klipmi. If not, see <https://www.gnu.org/licenses/>.
 
 import asyncio
 import logging
+import os
 
 from nextion import TJC, EventType
 from setproctitle import setproctitle
 
 from klipmi import ui
-from klipmi.model.config import Config
+from klipmi.model.config import Config, getDataPath
+from klipmi.model.display import Display
+from klipmi.model.encoder import ThumbnailEncoder
 from klipmi.model.printer import Printer, PrinterState
+from klipmi.model.scheduler import RenderScheduler
 from klipmi.model.state import KlipmiState
+from klipmi.model.thumbnails import ThumbnailCache, ThumbnailWarmer
 from klipmi.model.ui import BaseUi
 
 
@@ -41,33 +46,77 @@ class Klipmi:
         self.state: KlipmiState = KlipmiState()
         self.state.options = Config()
 
-        # Initializing the display
-        self.state.display = TJC(
-            self.state.options.klipmi.device,
-            self.state.options.klipmi.baud,
-            self.onDisplayEvent,
+        # Initializing the display, at the last negotiated rate if any
+        baud = self.state.options.klipmi.baud
+        if self.state.options.klipmi.baudrates:
+            baud = self.loadBaud() or baud
+        tjc = TJC(self.state.options.klipmi.device, baud, self.onDisplayEvent)
+        tjc.encoding = "utf-8"
+        self.state.display = Display(tjc, baud)
+
+        # Encoded thumbnails are kept across restarts
+        self.state.thumbnails = ThumbnailCache(
+            os.path.join(getDataPath(), "thumbnails"),
+            int(self.state.options.klipmi.thumbnail_cache * 1024 * 1024),
+        )
+        self.state.encoder = ThumbnailEncoder(
+            self.state.options.klipmi.encoder_workers
         )
-        self.state.display.encoding = "utf-8"
 
         # Initialize UI
         self.ui: BaseUi = ui.implementations[self.state.options.klipmi.ui](self.state)
 
+        # Coalesce printer status updates before they are rendered
+        self.renderer: RenderScheduler = RenderScheduler(
+            self.ui.onPrinterStatusUpdate,
+            self.state.options.klipmi.render_rate,
+        )
+
         # Initializing the printer
         self.state.printer = Printer(
             self.state.options.moonraker,
             self.onConnectionEvent,
-            self.ui.onPrinterStatusUpdate,
-            self.ui.onFileListUpdate,
+            self.renderer.submit,
+            self.onFilesChanged,
             self.ui.printerObjects,
         )
 
+        # Thumbnails of new files are encoded before anyone opens them
+        self.warmer: ThumbnailWarmer = ThumbnailWarmer(
+            self.state.printer,
+            self.state.thumbnails,
+            self.state.encoder,
+            self.ui.thumbnailJobs,
+        )
+
     async def onDisplayEvent(self, type: EventType, data):
         if type == EventType.RECONNECTED:
+            # The panel lost all component values, resend everything
+            self.state.display.clearShadow()
+            self.ui.onDisplayReconnected()
             # Force update status on reconnect
             await self.onConnectionEvent(self.state.status)
         else:
             asyncio.create_task(self.ui.onDisplayEvent(type, data))
 
+    async def onFilesChanged(self, data: dict):
+        self.warmer.onFilesChanged(data)
+        await self.ui.onFileListUpdate(data)
+
+    def loadBaud(self) -> int | None:
+        try:
+            with open(os.path.join(getDataPath(), "baudrate")) as f:
+                return int(f.read())
+        except Exception as e:
+            return None
+
+    def saveBaud(self, baud: int):
+        try:
+            with open(os.path.join(getDataPath(), "baudrate"), "w") as f:
+                f.write(str(baud))
+        except Exception as e:
+            logging.exception(e)
+
     async def onConnectionEvent(self, status: PrinterState):
         logging.info("Conenction status: %s", status)
         self.state.status = status
@@ -84,8 +133,23 @@ class Klipmi:
 
         # Connecting the display
         await self.state.display.connect()
+        if self.state.options.klipmi.baudrates:
+            self.saveBaud(
+                await self.state.display.negotiateBaud(
+                    self.state.options.klipmi.baudrates
+                )
+            )
         await self.state.display.wakeup()
         
+        # Log display link and status update statistics
+        if self.state.options.klipmi.stats_interval > 0:
+            asyncio.create_task(
+                self.state.display.stats.report(
+                    self.state.options.klipmi.stats_interval,
+                    self.renderer.summary,
+                )
+            )
+
         # Initialize UI
         self.ui.onNotReady()
 
@@ -0,0 +1,76 @@
+"""
+Stand-ins for the serial client of the panel and the Moonraker client.
+"""
+
+import asyncio
+
+from types import SimpleNamespace
+from typing import List
+
+from klipmi.model.display import ACK, EOL, Display
+
+
+class FakePanel:
+    """
+    Takes the place of the TJC client. Records the commands the panel got
+    and keeps the text written to picture components. Pipelined writes are
+    answered in order, `lost` holds the numbers of the pipelines whose end
+    never reaches the panel.
+    """
+
+    encoding = "ascii"
+    sleeping = False
+
+    def __init__(self, lost: List[int] = []):
+        self._baud_rate = 115200
+        self._command_lock = asyncio.Lock()
+        self.sent: List[str] = []
+        self.pictures: dict = {}
+        self.writes: List[str] = []
+        self.lost = list(lost)
+        self.pipelines = 0
+        self.answers: asyncio.Queue = asyncio.Queue()
+
+    async def set(self, key, value, timeout=None):
+        self.sent.append("%s=%s" % (key, value))
+        return True
+
+    async def command(self, command, timeout=None):
+        self.sent.append(command)
+        if command.endswith(".close()"):
+            self.pictures[command[: -len(".close()")]] = ""
+        return True
+
+    async def wakeup(self):
+        pass
+
+    def _flush_read_buffer(self):
+        while not self.answers.empty():
+            self.answers.get_nowait()
+
+    def _write_command_raw(self, payload: bytes):
+        commands = [command.decode() for command in payload.split(EOL)]
+        if commands[0] == "bkcmd=2":
+            self.pipelines += 1
+            if self.pipelines in self.lost:
+                # The end of the pipeline got lost on the wire
+                commands = commands[:-1]
+        for command in commands:
+            if ".write(" in command:
+                self.writes.append(command)
+                picture = command[: command.index(".write(")]
+                text = command.split('"')[1]
+                self.pictures[picture] = self.pictures.get(picture, "") + text
+            elif command == "bkcmd=3":
+                self.answers.put_nowait(bytes([ACK]))
+
+    async def _read_packet(self, timeout):
+        return await asyncio.wait_for(self.answers.get(), timeout)
+
+
+def makeState(panel: FakePanel) -> SimpleNamespace:
+    return SimpleNamespace(
+        display=Display(panel, panel._baud_rate),
+        printer=SimpleNamespace(setPageObjects=lambda objects: None),
+        options=SimpleNamespace(timeout=1),
+    )
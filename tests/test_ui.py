@@ -0,0 +1,74 @@
+import asyncio
+
+from klipmi.model.ui import BasePage, BaseUi
+from klipmi.utils import classproperty
+
+from fakes import FakePanel, makeState
+
+
+class FirstPage(BasePage):
+    @classproperty
+    def name(cls) -> str:
+        return "first"
+
+    @classproperty
+    def id(cls) -> int:
+        return 1
+
+    async def onPrinterStatusUpdate(self, data: dict):
+        await self.state.display.set("n0.val", data["value"])
+        if data["value"] > 1:
+            self.changePage(SecondPage)
+
+
+class SecondPage(BasePage):
+    @classproperty
+    def name(cls) -> str:
+        return "second"
+
+    @classproperty
+    def id(cls) -> int:
+        return 2
+
+    async def init(self):
+        await self.state.display.set("t0.txt", "second")
+
+
+class Ui(BaseUi):
+    @classproperty
+    def printerObjects(cls):
+        return {}
+
+    def onNotReady(self):
+        pass
+
+    def onReady(self):
+        pass
+
+    def onStopped(self):
+        pass
+
+    def onMoonrakerError(self):
+        pass
+
+    def onKlipperError(self):
+        pass
+
+
+def test_page_change_from_status_batch():
+    async def run():
+        panel = FakePanel()
+        ui = Ui(makeState(panel))
+        ui.changePage(FirstPage)
+        await ui.pageChange
+        panel.sent.clear()
+
+        # The status batch is still open while the new page is loaded, its
+        # writes must not end up in it
+        ui.fullRender = False
+        async with ui.state.display.batch():
+            await ui.currentPage.onPrinterStatusUpdate({"value": 2})
+            await ui.pageChange
+            assert panel.sent == ["page 2", "t0.txt=second"]
+
+    asyncio.run(run())
@@ -0,0 +1,33 @@
+import asyncio
+
+from klipmi.model.upload import PictureUpload
+
+from fakes import FakePanel, makeState
+
+
+async def parts(data: str, size: int):
+    for offset in range(0, len(data), size):
+        yield data[offset : offset + size]
+
+
+def test_upload_restarts_after_lost_window():
+    async def run():
+        # Every write is found again by its text
+        data = "".join("%05d" % i for i in range(1000))
+        panel = FakePanel(lost=[2])
+        display = makeState(panel).display
+        display.uploadChunk = 1024
+
+        upload = PictureUpload(display, 1, "cp0")
+        await upload.send(parts(data, 700), len(data))
+
+        # Two chunks per window at 115200 baud. The end of the second window
+        # got lost, so the picture is closed and sent again from the start
+        offsets = [data.index(write.split('"')[1]) for write in panel.writes]
+        assert offsets == [0, 1024, 2048, 3072, 0, 1024, 2048, 3072, 4096]
+        assert panel.sent == ["p[1].cp0.close()", "p[1].cp0.close()"]
+        assert panel.pictures["p[1].cp0"] == data
+        assert upload.restarts == 1
+        assert upload.confirmed == len(data)
+
+    asyncio.run(run())